@@ -26,7 +26,7 @@ from models.models import (
     Program,Service, Scholarship, LeadIn, LeadOut, Booking, BookingCreate, AustraliaScholarship, UniversityModel ,ResetPasswordRequest,ForgotPasswordRequest,
     PeerCounsellor, PeerCounsellorAvailability,PeerCounsellorBooking
 )
-from db import Base, engine, get_db  # engine used only at startup for create_all
+from db import Base, engine, get_db, SessionLocal  # engine used only at startup for create_all
 from models.models_user import User
 from models.schemas_user import UserRegister, UserLogin, UserVerify, UserOut, TokenResponse
 from utils.crud_user import get_user_by_email, create_user
@@ -80,6 +80,19 @@ def startup_create_tables():
     """Create DB tables on startup; avoids connection at import time (Neon-friendly)."""
     Base.metadata.create_all(bind=engine)
 
+    # Indexes added to existing rec_* tables (create_all only indexes new tables)
+    from recommendation.logic.candidate_generator import ensure_candidate_indexes
+    ensure_candidate_indexes(engine)
+
+    # programs.school_id on existing databases, then the one-time backfill of the
+    # recommendation feature table and country keys (all no-ops once populated)
+    from recommendation.services.program_features import ensure_program_features, ensure_program_school_ids
+    from recommendation.services.country_keys import ensure_country_keys
+    with SessionLocal() as db:
+        ensure_program_school_ids(db)
+        ensure_program_features(db)
+        ensure_country_keys(db)
+
 
 DB_URL = os.environ.get("DATABASE_URL")
 session = boto3.session.Session()
@@ -3,7 +3,7 @@ import json
 from pydantic import BaseModel, EmailStr, constr
 from datetime import datetime
 from typing import List, Optional, Any
-from sqlalchemy import JSON, Column, Integer, String, Text, DateTime, ForeignKey, Float
+from sqlalchemy import JSON, Column, Integer, String, Text, DateTime, ForeignKey, Float, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.types import TypeDecorator, String as SqlString
 import json
@@ -166,25 +166,45 @@ class Program(Base):
     id = Column(String, primary_key=True)
     type = Column(String)
     attributes = Column(JSONBCompat)
+    # Extracted from attributes['school']['id'] so programs can be listed per university
+    school_id = Column(String)
+
+    __table_args__ = (
+        # (school_id, id): one index range read per university page, in id order
+        Index("ix_programs_school_id", "school_id", "id"),
+    )
+
+    @staticmethod
+    def school_id_from(attributes: Optional[dict]) -> Optional[str]:
+        school = (attributes or {}).get('school') or {}
+        school_id = school.get('id') if isinstance(school, dict) else None
+        return str(school_id) if school_id is not None else None
 
     @classmethod
     def upsert(cls, db: Session, entry: dict):
         # Fetch school_id from attributes['school']['id'] if available
         attributes = entry.get('attributes', {})
-        school = attributes.get('school', {})
-        school_id = school.get('id')
+        school_id = cls.school_id_from(attributes)
         obj = db.query(cls).get(entry['id'])
         if obj:
             obj.type = entry.get('type')
             obj.attributes = attributes
+            obj.school_id = school_id
         else:
             obj = cls(
                 id=entry['id'],
                 type=entry.get('type'),
                 attributes=attributes,
+                school_id=school_id,
             )
             db.add(obj)
         db.flush()
+        # Keep the recommendation feature table in sync (incremental refresh)
+        from recommendation.services.program_features import sync_program_feature
+        from recommendation.services.catalog_version import mark_catalog_changed
+        sync_program_feature(db, obj)
+        # Catalog version is bumped once per committed transaction, not per row
+        mark_catalog_changed(db)
         return obj
 
     @classmethod
@@ -217,6 +237,9 @@ class UniversityModel(Base):
                 included=entry.get('included')
             )
             db.add(obj)
+        # Invalidate cached recommendation results (once, when the transaction commits)
+        from recommendation.services.catalog_version import mark_catalog_changed
+        mark_catalog_changed(db)
         return obj
 
 
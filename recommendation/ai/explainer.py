@@ -1,56 +1,96 @@
 import os
 import json
-from typing import Dict, Any, Optional
+import time
+import asyncio
+from typing import Dict, Any, Optional, Tuple
 import openai
 from dotenv import load_dotenv
 
-from .prompt_builder import build_system_prompt, build_user_prompt
+from .prompt_builder import build_system_prompt, build_prompt_inputs, render_user_prompt
+from .jobs import jobs_from_env, READY
+from .explanation_cache import cache_from_env, explanation_cache_key
+from ..logic.timing import pipeline_metrics
 
 # Load env vars (if not already loaded)
 load_dotenv()
 
 class AIExplainer:
-    def __init__(self):
-        self.api_key = os.getenv("OPENAI_API_KEY")
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        # Optional override, e.g. a local fake OpenAI server in tests
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL")
         self.client = None
+        self.async_client = None
         if self.api_key:
-            self.client = openai.OpenAI(api_key=self.api_key)
-        
+            self.client = openai.OpenAI(api_key=self.api_key, base_url=self.base_url)
+            self.async_client = openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+
         self.model = "gpt-4o-mini"
         self.max_tokens = 700
         self.temperature = 0.3
         
-        # Simple in-memory cache: request_id -> response
-        # In production, use Redis or Memcached
-        self.cache = {}
+        # Content-addressed cache: prompt inputs hash -> response (memory LRU + optional SQLite tier)
+        self.cache = cache_from_env()
+
+        # Background explanation jobs (polled via GET /recommendations/{request_id}/explanation);
+        # shared by all workers through EXPLANATION_CACHE_PATH, per process otherwise
+        self.jobs = jobs_from_env()
+        if not self.jobs.shared and int(os.getenv("WEB_CONCURRENCY", "1")) > 1:
+            import logging
+            logging.getLogger(__name__).warning(
+                "⚠️ Explanation jobs are per process: set EXPLANATION_CACHE_PATH when running "
+                "more than one worker, or polls for jobs started by another worker return 404"
+            )
+
+        # Max outstanding async LLM calls per worker process
+        self.max_concurrency = max_concurrency or int(os.getenv("EXPLAINER_MAX_CONCURRENCY", "4"))
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None
+
+    def _prepare(self, student_profile: Dict[str, Any], engine_output: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Build the cache key and the chat completion arguments for one explanation."""
+        system_prompt = build_system_prompt()
+        inputs = build_prompt_inputs(student_profile, engine_output)
+        settings = {"model": self.model, "temperature": self.temperature, "max_tokens": self.max_tokens}
+
+        cache_key = explanation_cache_key(settings, system_prompt, inputs)
+        kwargs = {
+            **settings,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": render_user_prompt(inputs)}
+            ],
+            "response_format": {"type": "json_object"},
+        }
+        return cache_key, kwargs
 
     def get_explanation(self, request_id: str, student_profile: Dict[str, Any], engine_output: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Generates an explanation for the recommendation results.
         Returns None if API key is missing or error occurs.
+
+        Blocking - routes use explain_async instead.
         """
         if not self.client:
             print("Warning: OpenAI API key not found. Skipping AI explanation.")
             return None
         
         # Check cache
-        if request_id in self.cache:
-            return self.cache[request_id]
-
-        system_prompt = build_system_prompt()
-        user_prompt = build_user_prompt(student_profile, engine_output)
+        cache_key, kwargs = self._prepare(student_profile, engine_output)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                response_format={"type": "json_object"}
-            )
+            response = self.client.chat.completions.create(**kwargs)
             
             content = response.choices[0].message.content
             if not content:
@@ -59,7 +99,7 @@ class AIExplainer:
             parsed_content = json.loads(content)
             
             # Cache result
-            self.cache[request_id] = parsed_content
+            self.cache.set(cache_key, parsed_content)
             
             return parsed_content
             
@@ -67,5 +107,83 @@ class AIExplainer:
             print(f"Error generating AI explanation: {e}")
             return None
 
+    def submit(self, request_id: str) -> bool:
+        """
+        Register a background explanation job for request_id.
+
+        Returns:
+            True if the caller should schedule explain_async, False if the
+            explainer is disabled or a job is already pending/ready
+        """
+        if not self.async_client:
+            return False
+        return self.jobs.submit(request_id)
+
+    def complete_from_cache(self, request_id: str, student_profile: Dict[str, Any], engine_output: Dict[str, Any]) -> bool:
+        """
+        Record request_id's job as ready if equal prompt inputs were explained before.
+
+        Lets a new request_id for a repeated profile answer inline, with no LLM call
+        and no background job. Returns True if the job was completed.
+        """
+        if not self.async_client:
+            return False
+        cache_key, _ = self._prepare(student_profile, engine_output)
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return False
+        self.jobs.complete(request_id, cached)
+        return True
+
+    async def explain_async(self, request_id: str, student_profile: Dict[str, Any], engine_output: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Generate an explanation with the async OpenAI client and record the job result.
+
+        At most `max_concurrency` LLM calls are outstanding at once; extra jobs
+        wait for a slot. Returns None if API key is missing or error occurs.
+        """
+        if not self.async_client:
+            print("Warning: OpenAI API key not found. Skipping AI explanation.")
+            return None
+
+        job = self.jobs.get(request_id)
+        if job and job["status"] == READY:
+            return job["explanation"]
+        if not job:
+            self.jobs.submit(request_id)
+
+        # Same prompt inputs as an earlier request: zero LLM calls
+        start = time.perf_counter()
+        cache_key, kwargs = self._prepare(student_profile, engine_output)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.jobs.complete(request_id, cached)
+            pipeline_metrics.observe("explainer", (time.perf_counter() - start) * 1000, 1)
+            return cached
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            async with self._semaphore:
+                response = await self.async_client.chat.completions.create(**kwargs)
+
+            content = response.choices[0].message.content
+            if not content:
+                raise ValueError("Empty explanation returned by model")
+
+            parsed_content = json.loads(content)
+            self.cache.set(cache_key, parsed_content)
+            self.jobs.complete(request_id, parsed_content)
+            return parsed_content
+            
+        except Exception as e:
+            print(f"Error generating AI explanation: {e}")
+            self.jobs.fail(request_id, str(e))
+            return None
+        finally:
+            # Includes the wait for a concurrency slot
+            pipeline_metrics.observe("explainer", (time.perf_counter() - start) * 1000, 1)
+
 # Singleton instance
 explainer = AIExplainer()
@@ -0,0 +1,167 @@
+"""
+AI Explanation Cache
+
+Content-addressed cache for LLM explanations. The key is a hash of the model
+settings plus the prompt inputs (prompt_builder.build_prompt_inputs), so
+repeated explanations for the same profile/result set never reach the LLM.
+
+Two tiers:
+- In-process LRU, capped by the serialized size of the cached explanations
+- Optional SQLite file (WAL mode) shared by every uvicorn worker on the host
+
+Configuration (environment):
+    EXPLANATION_CACHE_MAX_BYTES         memory tier cap (default 8 MiB)
+    EXPLANATION_CACHE_PATH              SQLite file for the shared tier (disabled if unset)
+    EXPLANATION_CACHE_DISK_MAX_ENTRIES  rows kept in the SQLite tier (default 50000)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+# Prune the SQLite tier every N writes
+_DISK_PRUNE_INTERVAL = 100
+
+
+def explanation_cache_key(model_settings: Dict[str, Any], system_prompt: str, prompt_inputs: Dict[str, Any]) -> str:
+    """Stable content hash of everything that determines an LLM explanation."""
+    payload = json.dumps(
+        {"model": model_settings, "system": system_prompt, "inputs": prompt_inputs},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExplanationCache:
+    """Thread-safe LRU (memory-capped) with an optional shared SQLite tier."""
+
+    def __init__(
+        self,
+        max_bytes: int = 8 * 1024 * 1024,
+        db_path: Optional[str] = None,
+        disk_max_entries: int = 50000
+    ):
+        self.max_bytes = max_bytes
+        self.db_path = db_path
+        self.disk_max_entries = disk_max_entries
+
+        self._entries: "OrderedDict[str, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if db_path:
+            self._conn = self._connect(db_path)
+
+    @staticmethod
+    def _connect(db_path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(db_path, timeout=5, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS explanations ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_explanations_created_at ON explanations (created_at)")
+        return conn
+
+    def _remember(self, key: str, value: Dict[str, Any], size: int) -> None:
+        # Caller holds the lock
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous:
+            self._bytes -= previous[0]
+        self._entries[key] = (size, value)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, (evicted_size, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached explanation for key, checking memory then disk."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return entry[1]
+
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute("SELECT value FROM explanations WHERE key = ?", (key,)).fetchone()
+                except sqlite3.Error as e:
+                    print(f"Warning: explanation cache read failed: {e}")
+                    row = None
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, value, len(row[0]))
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store an explanation in both tiers."""
+        serialized = json.dumps(value, default=str)
+        with self._lock:
+            self._remember(key, value, len(serialized))
+
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO explanations (key, value, created_at) VALUES (?, ?, ?)",
+                        (key, serialized, time.time()),
+                    )
+                    self._writes += 1
+                    if self._writes % _DISK_PRUNE_INTERVAL == 0:
+                        self._prune_disk()
+                except sqlite3.Error as e:
+                    print(f"Warning: explanation cache write failed: {e}")
+
+    def _prune_disk(self) -> None:
+        # Caller holds the lock
+        self._conn.execute(
+            "DELETE FROM explanations WHERE created_at < ("
+            "SELECT created_at FROM explanations ORDER BY created_at DESC LIMIT 1 OFFSET ?)",
+            (self.disk_max_entries - 1,),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "disk_enabled": self._conn is not None,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+def cache_from_env() -> ExplanationCache:
+    """Build the explanation cache from EXPLANATION_CACHE_* environment variables."""
+    return ExplanationCache(
+        max_bytes=int(os.getenv("EXPLANATION_CACHE_MAX_BYTES", str(8 * 1024 * 1024))),
+        db_path=os.getenv("EXPLANATION_CACHE_PATH") or None,
+        disk_max_entries=int(os.getenv("EXPLANATION_CACHE_DISK_MAX_ENTRIES", "50000")),
+    )
@@ -0,0 +1,174 @@
+"""
+Explanation Job Store
+
+Tracks background AI explanation jobs by request_id so clients can poll
+GET /recommendations/{request_id}/explanation.
+
+Bounded (least recently updated jobs are evicted first). Two backends:
+- In-memory: a job is visible only to the worker process that started it, so
+  polls must reach that worker - fine for a single uvicorn worker only.
+- SQLite (WAL mode) in the explanation cache's file: every worker on the host
+  sees every job, so a poll can land on any worker.
+
+Configuration (environment):
+    EXPLAINER_JOB_STORE_SIZE   jobs kept (default 1000)
+    EXPLANATION_CACHE_PATH     SQLite file shared by all workers (in-memory if unset;
+                               required when running more than one worker)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+
+# Prune the SQLite backend every N writes
+_DISK_PRUNE_INTERVAL = 100
+
+
+class ExplanationJobStore:
+    """Thread-safe, bounded map of request_id -> explanation job state."""
+
+    def __init__(self, maxsize: int = 1000, db_path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.db_path = db_path
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+
+        if db_path:
+            self._conn = self._connect(db_path)
+
+    @staticmethod
+    def _connect(db_path: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(db_path, timeout=5, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS explanation_jobs ("
+            "request_id TEXT PRIMARY KEY, status TEXT NOT NULL, explanation TEXT, error TEXT, "
+            "created_at TEXT NOT NULL, updated_at TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_explanation_jobs_updated_at ON explanation_jobs (updated_at)")
+        return conn
+
+    @property
+    def shared(self) -> bool:
+        """True if jobs are visible to every worker process (SQLite backend)."""
+        return self._conn is not None
+
+    def _put(self, request_id: str, **fields) -> Dict[str, Any]:
+        # Caller holds the lock
+        now = datetime.utcnow().isoformat()
+        job = self._jobs.get(request_id) or {"request_id": request_id, "created_at": now}
+        job.update(fields, updated_at=now)
+        self._jobs[request_id] = job
+        self._jobs.move_to_end(request_id)
+        while len(self._jobs) > self.maxsize:
+            self._jobs.popitem(last=False)
+        return dict(job)
+
+    def _write(self, request_id: str, status: str, explanation: Optional[Dict[str, Any]], error: Optional[str],
+               only_if_failed: bool = False) -> bool:
+        # Caller holds the lock; returns True if the row was written
+        now = datetime.utcnow().isoformat()
+        condition = f" WHERE explanation_jobs.status = '{FAILED}'" if only_if_failed else ""
+        written = self._conn.execute(
+            "INSERT INTO explanation_jobs (request_id, status, explanation, error, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (request_id) DO UPDATE SET "
+            "status = excluded.status, explanation = excluded.explanation, error = excluded.error, "
+            "updated_at = excluded.updated_at" + condition,
+            (request_id, status, json.dumps(explanation, default=str) if explanation is not None else None,
+             error, now, now),
+        ).rowcount
+        self._writes += 1
+        if self._writes % _DISK_PRUNE_INTERVAL == 0:
+            self._conn.execute(
+                "DELETE FROM explanation_jobs WHERE updated_at < ("
+                "SELECT updated_at FROM explanation_jobs ORDER BY updated_at DESC LIMIT 1 OFFSET ?)",
+                (self.maxsize - 1,),
+            )
+        return written > 0
+
+    def submit(self, request_id: str) -> bool:
+        """
+        Mark a job as pending.
+
+        Returns:
+            True if a new job should be started, False if one is already
+            pending or ready for this request_id (in any worker, when shared)
+        """
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    # Atomic across workers: only a new or failed job is (re)started
+                    return self._write(request_id, PENDING, None, None, only_if_failed=True)
+                except sqlite3.Error as e:
+                    print(f"Warning: explanation job write failed: {e}")
+            job = self._jobs.get(request_id)
+            if job and job["status"] in (PENDING, READY):
+                return False
+            self._put(request_id, status=PENDING, explanation=None, error=None)
+            return True
+
+    def complete(self, request_id: str, explanation: Dict[str, Any]) -> None:
+        self._set(request_id, READY, explanation, None)
+
+    def fail(self, request_id: str, error: str) -> None:
+        self._set(request_id, FAILED, None, error)
+
+    def _set(self, request_id: str, status: str, explanation: Optional[Dict[str, Any]], error: Optional[str]) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._write(request_id, status, explanation, error)
+                    return
+                except sqlite3.Error as e:
+                    print(f"Warning: explanation job write failed: {e}")
+            self._put(request_id, status=status, explanation=explanation, error=error)
+
+    def get(self, request_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT request_id, status, explanation, error, created_at, updated_at "
+                        "FROM explanation_jobs WHERE request_id = ?",
+                        (request_id,),
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    print(f"Warning: explanation job read failed: {e}")
+                    row = None
+                if row is not None:
+                    return {
+                        "request_id": row[0],
+                        "status": row[1],
+                        "explanation": json.loads(row[2]) if row[2] is not None else None,
+                        "error": row[3],
+                        "created_at": row[4],
+                        "updated_at": row[5],
+                    }
+            job = self._jobs.get(request_id)
+            return dict(job) if job else None
+
+    def __len__(self) -> int:
+        if self._conn is not None:
+            with self._lock:
+                return self._conn.execute("SELECT COUNT(*) FROM explanation_jobs").fetchone()[0]
+        return len(self._jobs)
+
+
+def jobs_from_env() -> ExplanationJobStore:
+    """Build the job store from EXPLAINER_JOB_STORE_SIZE / EXPLANATION_CACHE_PATH."""
+    return ExplanationJobStore(
+        maxsize=int(os.getenv("EXPLAINER_JOB_STORE_SIZE", "1000")),
+        db_path=os.getenv("EXPLANATION_CACHE_PATH") or None,
+    )
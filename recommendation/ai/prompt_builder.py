@@ -15,10 +15,12 @@ OUTPUT FORMAT:
 {JSON_OUTPUT_FORMAT_INSTRUCTION}
 """
 
-def build_user_prompt(student_profile: Dict[str, Any], engine_output: Dict[str, Any], limit: int = 5) -> str:
+def build_prompt_inputs(student_profile: Dict[str, Any], engine_output: Dict[str, Any], limit: int = 5) -> Dict[str, Any]:
     """
-    Constructs the user prompt from profile and engine results.
-    Truncates recommendations to save tokens.
+    Everything the user prompt is rendered from.
+    
+    Also the content address for cached explanations: two requests with equal
+    inputs get the same prompt, whatever their request_id.
     """
     
     # 1. Sanitize and Format Profile
@@ -38,21 +40,34 @@ def build_user_prompt(student_profile: Dict[str, Any], engine_output: Dict[str,
     # We only want to send the top N programs overall to save context
     recommendations = engine_output.get("recommendations", [])[:limit]
     
-    minimized_recs = _minimize_program_data(recommendations)
-    
-    warnings = engine_output.get("warnings", [])
-    
+    return {
+        "profile": profile_summary,
+        "total_evaluated": engine_output.get("summary", {}).get("total_evaluated"),
+        "total_eligible": engine_output.get("summary", {}).get("total_eligible"),
+        "warnings": engine_output.get("warnings", []),
+        "recommendations": _minimize_program_data(recommendations),
+    }
+
+def build_user_prompt(student_profile: Dict[str, Any], engine_output: Dict[str, Any], limit: int = 5) -> str:
+    """
+    Constructs the user prompt from profile and engine results.
+    Truncates recommendations to save tokens.
+    """
+    return render_user_prompt(build_prompt_inputs(student_profile, engine_output, limit))
+
+def render_user_prompt(inputs: Dict[str, Any]) -> str:
+    """Render the user prompt from build_prompt_inputs output."""
     user_content = f"""
 STUDENT PROFILE:
-{json.dumps(profile_summary, indent=2)}
+{json.dumps(inputs["profile"], indent=2)}
 
 ENGINE OUTPUT SUMMARY:
-- Total Evaluated: {engine_output.get("summary", {}).get("total_evaluated")}
-- Total Eligible: {engine_output.get("summary", {}).get("total_eligible")}
-- Engine Warnings: {json.dumps(warnings)}
+- Total Evaluated: {inputs["total_evaluated"]}
+- Total Eligible: {inputs["total_eligible"]}
+- Engine Warnings: {json.dumps(inputs["warnings"])}
 
 TOP RECOMMENDATIONS (Ranked):
-{json.dumps(minimized_recs, indent=2)}
+{json.dumps(inputs["recommendations"], indent=2)}
 
 TASK:
 Explain these recommendations to the student. Adhere strictly to the safety rules.
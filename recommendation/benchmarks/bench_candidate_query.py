@@ -0,0 +1,139 @@
+"""
+Benchmark: generate_candidates query on the rec_* tables
+
+Compares the previous query (RecProgram -> RecIntake -> RecEligibilitySnapshot
+outer joins, LIMIT over the multiplied rows) with candidate_query (best intake +
+latest snapshot per program via correlated LIMIT 1 subqueries), with and without
+the composite indexes, on seeded SQLite catalogs where every program has several
+intakes and snapshots.
+
+For each scenario it reports rows returned, distinct programs among them and the
+median latency, and prints SQLite's EXPLAIN QUERY PLAN for candidate_query,
+checking that every index in CANDIDATE_INDEXES is used.
+
+Run from backend directory:
+    python -m recommendation.benchmarks.bench_candidate_query [--sizes 1000 10000 50000]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, List
+
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Query, Session
+
+from .synthetic import create_rec_catalog
+from ..logic.candidate_generator import CANDIDATE_INDEXES, candidate_query
+from ..logic.contracts import StudentProfile
+from ..models import RecUniversity, RecProgram, RecIntake, RecEligibilitySnapshot
+
+
+SCENARIOS = [
+    ("masters / any country", StudentProfile(target_degree_level="masters")),
+    ("masters / Ireland+Canada", StudentProfile(target_degree_level="masters", preferred_countries=["Ireland", "Canada"])),
+    ("bachelors / CS domain", StudentProfile(target_degree_level="bachelors", preferred_program_domains=["Computer Science"])),
+    ("masters / 2026 Fall", StudentProfile(target_degree_level="masters", target_intake_year=2026, target_intake_term="Fall")),
+]
+
+
+def legacy_query(db: Session, profile: StudentProfile, max_candidates: int = 200) -> Query:
+    """The previous generate_candidates query: one row per program x intake x snapshot."""
+    query = db.query(RecProgram, RecUniversity, RecIntake, RecEligibilitySnapshot).join(
+        RecUniversity, RecProgram.university_id == RecUniversity.id
+    ).outerjoin(
+        RecIntake, RecIntake.program_id == RecProgram.id
+    ).outerjoin(
+        RecEligibilitySnapshot, RecEligibilitySnapshot.intake_id == RecIntake.id
+    )
+    if profile.preferred_countries:
+        query = query.filter(RecUniversity.country.in_(profile.preferred_countries))
+    degree_types = {
+        "masters": ["masters", "mba", "ms", "ma", "msc", "meng"],
+        "bachelors": ["bachelors", "bs", "ba", "bsc", "beng"],
+    }.get(profile.target_degree_level, ["masters"])
+    query = query.filter(RecProgram.degree_type.in_(degree_types))
+    if profile.preferred_program_domains:
+        query = query.filter(or_(*[RecProgram.program_domain.ilike(f"%{d}%") for d in profile.preferred_program_domains]))
+    if profile.target_intake_year:
+        query = query.filter(RecIntake.intake_year == profile.target_intake_year)
+    if profile.target_intake_term:
+        query = query.filter(RecIntake.intake_term.ilike(f"%{profile.target_intake_term}%"))
+    query = query.filter(RecIntake.intake_status.in_(["open", "upcoming", "active", None]))
+    return query.limit(max_candidates)
+
+
+def explain(db: Session, query: Query) -> List[str]:
+    """SQLite EXPLAIN QUERY PLAN lines for a query."""
+    sql = str(query.statement.compile(db.get_bind(), compile_kwargs={"literal_binds": True}))
+    return [row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+
+def _median_ms(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run(sizes: List[int], repeat: int, limit: int, workdir: str) -> None:
+    for size in sizes:
+        factory = create_rec_catalog(os.path.join(workdir, f"rec_catalog_{size}.db"), size)
+        with factory() as db:
+            bind = db.get_bind()
+            intakes = db.query(RecIntake).count()
+            snapshots = db.query(RecEligibilitySnapshot).count()
+            print(f"\n{size} programs, {intakes} intakes, {snapshots} snapshots (limit {limit})")
+            print(f"  {'scenario':<26} {'variant':<16} {'rows':>5} {'programs':>8} {'median ms':>10}")
+
+            for name, profile in SCENARIOS:
+                results = {}
+                for variant in ("legacy", "no indexes", "indexed"):
+                    build = legacy_query if variant == "legacy" else candidate_query
+                    if variant == "no indexes":
+                        for index in CANDIDATE_INDEXES:
+                            index.drop(bind=bind, checkfirst=True)
+                    else:
+                        for index in CANDIDATE_INDEXES:
+                            index.create(bind=bind, checkfirst=True)
+
+                    rows = build(db, profile, limit).all()
+                    programs = len({program.id for program, *_ in rows})
+                    ms = _median_ms(lambda: build(db, profile, limit).all(), repeat)
+                    results[variant] = [(p.id, i.id if i else None) for p, _, i, _ in rows]
+                    print(f"  {name:<26} {variant:<16} {len(rows):>5} {programs:>8} {ms:>10.2f}")
+
+                # Without ORDER BY the plan decides which programs fill the limit, but
+                # the intake picked for a program must not depend on the plan
+                unindexed, indexed = dict(results["no indexes"]), dict(results["indexed"])
+                assert len(indexed) == len(results["indexed"]), "duplicate programs"
+                assert all(unindexed[p] == indexed[p] for p in unindexed.keys() & indexed.keys()), "index changed the intake"
+
+            plan = explain(db, candidate_query(db, SCENARIOS[1][1], limit))
+            print("  EXPLAIN QUERY PLAN (masters / Ireland+Canada):")
+            for line in plan:
+                print(f"    {line}")
+            missing = [index.name for index in CANDIDATE_INDEXES if not any(index.name in line for line in plan)]
+            assert not missing, f"indexes not used: {missing}"
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--workdir", default=None, help="Directory for catalog files (default: temp dir)")
+    args = parser.parse_args()
+
+    if args.workdir:
+        run(args.sizes, args.repeat, args.limit, args.workdir)
+    else:
+        with tempfile.TemporaryDirectory() as workdir:
+            run(args.sizes, args.repeat, args.limit, workdir)
@@ -0,0 +1,99 @@
+"""
+Benchmark: degree level classification throughput
+
+Classifies the (degree label, program name) pairs of a synthetic catalog with
+the previous substring-list classifier and with classify_degree, without and
+with its (label, name) memo; per-label scans stay memoized in both. The
+"distinct" corpus appends a unique specialisation to every name, so no pair
+repeats (memo worst case).
+
+Also prints how the levels are distributed under both classifiers: substring
+matching files e.g. every "Diploma" and "Mathematics" program under masters.
+
+Run from backend directory:
+    python -m recommendation.benchmarks.bench_degree_classifier [--sizes 10000 100000]
+"""
+
+import argparse
+import statistics
+import time
+from collections import Counter
+from typing import Callable, List, Optional, Tuple
+
+from .synthetic import generate_catalog
+from ..logic.degree_classifier import classify_degree, _scan
+
+
+def legacy_normalize_degree_level(raw_degree_text: Optional[str]) -> str:
+    """The previous normalize_degree_level: ordered substring pattern lists."""
+    if not raw_degree_text:
+        return "unknown"
+    text = raw_degree_text.lower().strip()
+    if any(p in text for p in ["master", "msc", "ma", "mba", "meng", "mtech", "ms", "m.sc", "m.a", "m.eng"]):
+        return "masters"
+    if any(p in text for p in ["phd", "ph.d", "doctorate", "doctoral"]):
+        return "phd"
+    if any(p in text for p in ["bachelor", "bsc", "ba", "beng", "btech", "bs", "b.sc", "b.a", "b.eng", "undergraduate"]):
+        return "bachelors"
+    if any(p in text for p in ["diploma", "certificate", "foundation", "postgraduate diploma", "pgdip"]):
+        return "diploma"
+    return "unknown"
+
+
+def corpus(size: int, distinct: bool) -> List[Tuple[str, str]]:
+    programs = generate_catalog(size)["programs"]
+    pairs = [(p["attributes"]["level"], p["attributes"]["name"]) for p in programs]
+    if distinct:
+        pairs = [(level, f"{name} (Track {i})") for i, (level, name) in enumerate(pairs)]
+    return pairs
+
+
+def _median_ms(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run(sizes: List[int], repeat: int) -> None:
+    compiled = classify_degree.__wrapped__
+    variants = [
+        ("legacy substrings", lambda pairs: [legacy_normalize_degree_level(f"{l} {n}") for l, n in pairs]),
+        ("compiled", lambda pairs: [compiled(l, n) for l, n in pairs]),
+        ("compiled + memo", lambda pairs: [classify_degree(l, n) for l, n in pairs]),
+    ]
+
+    print(f"{'pairs':>8}  {'corpus':<9} {'variant':<18} {'median ms':>10} {'k pairs/s':>10}")
+    for size in sizes:
+        for distinct in (False, True):
+            pairs = corpus(size, distinct)
+            label = "distinct" if distinct else "catalog"
+            for name, classify in variants:
+                classify_degree.cache_clear()
+                _scan.cache_clear()
+                ms = _median_ms(lambda: classify(pairs), repeat)
+                print(f"{size:>8}  {label:<9} {name:<18} {ms:>10.2f} {size / ms:>10.1f}")
+
+        pairs = corpus(size, False)
+        legacy = Counter(legacy_normalize_degree_level(f"{l} {n}") for l, n in pairs)
+        current = Counter(classify_degree(l, n).level for l, n in pairs)
+        changed = sum(
+            legacy_normalize_degree_level(f"{l} {n}") != classify_degree(l, n).level for l, n in pairs
+        )
+        print(f"{'':>10}levels (legacy -> compiled), {changed} of {size} reclassified:")
+        for level in ("masters", "bachelors", "phd", "diploma", "unknown"):
+            print(f"{'':>12}{level:<10} {legacy[level]:>7} -> {current[level]:>7}")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.sizes, args.repeat)
@@ -0,0 +1,143 @@
+"""
+Benchmark: domain / career matching over a candidate pool
+
+Per request, matches the profile's preferred domains and career goals against
+every candidate's program domain and industry tags:
+- "substring loop": the scorers' per-candidate substring rules (no memo)
+- "pairwise tf-idf": the same candidates compared with tf-idf cosine pair by
+  pair in Python (what per-pair similarity heuristics cost)
+- "model product": ProfileSimilarity - one sparse product over the model's
+  term matrix, then a row lookup per distinct domain / tag (TagMatcher memo)
+
+The catalog uses FIELDS / CAREER_GOALS with qualifiers, so there are a few
+hundred distinct terms. "matches" counts matched domains plus matched
+(goal, tag) pairs per variant; also prints the model's build time and size.
+
+Run from backend directory:
+    python -m recommendation.benchmarks.bench_domain_similarity [--sizes 10000 100000]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+from .synthetic import CAREER_GOALS, FIELDS
+from ..logic.domain_similarity import ProfileSimilarity, build_model
+from ..logic.tag_index import TagMatcher, TagVocabulary
+
+QUALIFIERS = ["", "Applied ", "Advanced ", "International ", "Digital ", "Sustainable "]
+SUFFIXES = ["", " and Analytics", " Management", " Studies", " with Data Science"]
+
+# (program domain, industry tags)
+Row = Tuple[str, List[str]]
+
+
+def catalog(size: int, seed: int = 42) -> List[Row]:
+    rng = random.Random(seed)
+    domains = [f"{q}{field}{s}" for field in FIELDS for q in QUALIFIERS for s in SUFFIXES]
+    tags = list(CAREER_GOALS) + ["Data Analytics", "Software Development", "Investment Banking",
+                                 "Public Policy", "Clinical Research", "Product Design"]
+    return [(rng.choice(domains), rng.sample(tags, k=rng.randint(1, 3))) for _ in range(size)]
+
+
+def substring_loop(rows: List[Row], domains: List[str], goals: List[str]) -> int:
+    matched = 0
+    for program_domain, tags in rows:
+        program_domain = program_domain.lower()
+        for domain in domains:
+            domain = domain.lower()
+            if domain in program_domain or program_domain.strip() in domain.strip():
+                matched += 1
+                break
+        tag_keys = [tag.lower().strip() for tag in tags]
+        for goal in goals:
+            goal = goal.lower().strip()
+            matched += sum(1 for tag in tag_keys if goal in tag or tag in goal)
+    return matched
+
+
+def pairwise_tfidf(model, rows: List[Row], domains: List[str], goals: List[str]) -> int:
+    def cosine(a, b):
+        weights = dict(zip(*b))
+        return sum(w * weights.get(f, 0.0) for f, w in zip(*a))
+
+    domain_vectors = [model.vectorize(d) for d in domains]
+    goal_vectors = [model.vectorize(g) for g in goals]
+    matched = 0
+    for program_domain, tags in rows:
+        vector = model.vectorize(program_domain)
+        matched += any(cosine(d, vector) >= 0.5 for d in domain_vectors)
+        for tag in tags:
+            vector = model.vectorize(tag)
+            matched += sum(cosine(g, vector) >= 0.5 for g in goal_vectors)
+    return matched
+
+
+def model_product(model, rows: List[Row], domains: List[str], goals: List[str]) -> int:
+    domain_keys = tuple((d.lower(), d.lower().strip()) for d in domains)
+    goal_keys = tuple(g.lower().strip() for g in goals)
+    tags = TagMatcher(domain_keys, goal_keys, None, frozenset(), vocabulary=TagVocabulary(),
+                      similarity=ProfileSimilarity(model, [k for _, k in domain_keys], goal_keys))
+    matched = 0
+    for program_domain, industry_tags in rows:
+        matched += tags.domain_match(program_domain) > 0.5
+        matched += tags.career_counts(industry_tags)[1]
+    return matched
+
+
+def _median_ms(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run(sizes: List[int], repeat: int) -> None:
+    domains = ["Data Science", "Computer Engineering"]
+    goals = ["Data Analyst", "Software Engineer"]
+
+    print(f"{'pool':>8}  {'variant':<16} {'median ms':>10} {'matches':>9}")
+    for size in sizes:
+        rows = catalog(size)
+        documents = [f"{domain} {' '.join(tags)}" for domain, tags in rows]
+        terms = {domain for domain, _ in rows} | {tag for _, tags in rows for tag in tags}
+
+        started = time.perf_counter()
+        model = build_model(documents, terms)
+        build_ms = (time.perf_counter() - started) * 1000
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "model.npz")
+            model.save(path)
+            file_kb = os.path.getsize(path) / 1024
+
+        variants = [
+            ("substring loop", lambda: substring_loop(rows, domains, goals)),
+            ("pairwise tf-idf", lambda: pairwise_tfidf(model, rows, domains, goals)),
+            ("model product", lambda: model_product(model, rows, domains, goals)),
+        ]
+        for name, fn in variants:
+            started = time.perf_counter()
+            matches = fn()
+            # The pairwise variant is orders of magnitude slower; one run is enough
+            ms = (time.perf_counter() - started) * 1000 if name == "pairwise tf-idf" else _median_ms(fn, repeat)
+            print(f"{size:>8}  {name:<16} {ms:>10.2f} {matches:>9}")
+        print(f"{'':>10}model: {len(model)} terms, {len(model.data)} entries, "
+              f"{file_kb:.1f} KiB on disk, built in {build_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.sizes, args.repeat)
@@ -0,0 +1,148 @@
+"""
+Benchmark: candidate fetch latency vs catalog size
+
+Compares the previous adapter path (ILIKE over cast(Program.attributes, String)
+plus per-request transform_program) with the indexed rec_program_features lookup
+used by fetch_and_transform_programs.
+
+Run from backend directory:
+    python -m recommendation.benchmarks.bench_program_filter [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import or_, cast, String, text
+from sqlalchemy.orm import Session
+
+from .synthetic import create_sqlite_catalog
+from models.models import Program
+from ..logic.adapter import (
+    fetch_and_transform_programs,
+    normalize_degree_level,
+    transform_program,
+)
+
+
+SCENARIOS = [
+    ("masters / Ireland", "Ireland", "masters"),
+    ("bachelors / Canada", "Canada", "bachelors"),
+    ("masters / any country", None, "masters"),
+    ("masters / IE+DE+CA", ["Ireland", "Germany", "Canada"], "masters"),
+]
+
+# The adapter's former hand-kept country map, used by the legacy ILIKE filter
+LEGACY_COUNTRY_NAME_TO_CODES = {
+    "australia": ["AU", "au", "Australia"],
+    "canada": ["CA", "ca", "Canada"],
+    "germany": ["DE", "de", "Germany"],
+    "united kingdom": ["GB", "UK", "gb", "uk", "United Kingdom"],
+    "ireland": ["IE", "ie", "Ireland"],
+    "united states": ["US", "USA", "us", "usa", "United States"],
+    "new zealand": ["NZ", "nz", "New Zealand"],
+    "singapore": ["SG", "sg", "Singapore"],
+    "netherlands": ["NL", "nl", "Netherlands"],
+    "france": ["FR", "fr", "France"],
+}
+
+
+def legacy_fetch(
+    db: Session,
+    limit: int = 100,
+    country_filter: Optional[str] = None,
+    target_degree_level: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """The pre-index adapter path: JSON text scans + per-request transform."""
+    fetch_limit = min(200, limit * 3) if (country_filter or target_degree_level) else limit
+    query = db.query(Program)
+
+    if country_filter:
+        search_terms = list(LEGACY_COUNTRY_NAME_TO_CODES.get(country_filter.lower(), [country_filter]))
+        search_terms.append(country_filter)
+        conditions = []
+        for term in search_terms:
+            conditions.append(cast(Program.attributes, String).ilike(f'%"{term}"%'))
+            if len(term) > 3:
+                conditions.append(cast(Program.attributes, String).ilike(f'%{term}%'))
+        query = query.filter(or_(*conditions))
+
+    if target_degree_level:
+        keywords = {
+            "masters": ["master", "msc", "ma ", "mba", "m.sc", "m.a", "post grad"],
+            "bachelors": ["bachelor", "bsc", "ba ", "undergrad", "b.sc", "b.a"],
+            "phd": ["phd", "doctor", "dphil"],
+            "diploma": ["diploma", "certificate", "associate"],
+        }.get(target_degree_level, [])
+        query = query.filter(or_(*[cast(Program.attributes, String).ilike(f"%{kw}%") for kw in keywords]))
+
+    results = []
+    for program in query.limit(fetch_limit).all():
+        normalized = transform_program(program)
+        if target_degree_level:
+            degree = normalize_degree_level(f"{normalized['degree_level']} {normalized['program_name']}")
+            if degree not in (target_degree_level, "unknown"):
+                continue
+        results.append(normalized)
+        if len(results) >= limit:
+            break
+    return results
+
+
+def legacy_fetch_countries(db: Session, limit: int, countries, target_degree_level: Optional[str]) -> List[Dict[str, Any]]:
+    """Legacy path for a list of countries: one sequential call per country."""
+    if not isinstance(countries, list):
+        return legacy_fetch(db, limit, countries, target_degree_level)
+    results = []
+    for country in countries:
+        results.extend(legacy_fetch(db, limit // len(countries), country, target_degree_level))
+    return results
+
+
+def _time_ms(fn: Callable[[], Any], repeat: int) -> float:
+    """Median wall time of fn in milliseconds."""
+    fn()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run(sizes: List[int], repeat: int, workdir: str) -> None:
+    print(f"{'programs':>9}  {'scenario':<22} {'legacy ms':>10} {'indexed ms':>11} {'speedup':>8}")
+    for size in sizes:
+        factory = create_sqlite_catalog(os.path.join(workdir, f"catalog_{size}.db"), size)
+        with factory() as db:
+            for name, country, degree in SCENARIOS:
+                legacy = _time_ms(lambda: legacy_fetch_countries(db, 100, country, degree), repeat)
+                indexed = _time_ms(lambda: fetch_and_transform_programs(db, 100, 0, country, degree), repeat)
+                print(f"{size:>9}  {name:<22} {legacy:>10.2f} {indexed:>11.2f} {legacy / indexed:>7.1f}x")
+
+            plan = db.execute(text(
+                "EXPLAIN QUERY PLAN SELECT * FROM rec_program_features "
+                "WHERE country_key = 'IE' AND normalized_degree_level = 'masters' "
+                "ORDER BY program_id LIMIT 100"
+            )).fetchall()
+            print(f"{'':>11}plan: {'; '.join(row[-1] for row in plan)}")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.INFO)
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workdir", default=None, help="Directory for catalog files (default: temp dir)")
+    args = parser.parse_args()
+
+    if args.workdir:
+        run(args.sizes, args.repeat, args.workdir)
+    else:
+        with tempfile.TemporaryDirectory() as workdir:
+            run(args.sizes, args.repeat, workdir)
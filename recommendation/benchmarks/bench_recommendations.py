@@ -0,0 +1,181 @@
+"""
+Benchmark: end-to-end and per-stage recommendation latency
+
+Builds seeded SQLite catalogs (see synthetic.py), replays a seeded mix of
+student profiles through run_recommendations and reports throughput plus
+p50/p95/p99 for the whole pipeline and for every PipelineTimer stage.
+
+Results are written as JSON (stdout, or --output). Passing --baseline compares
+end-to-end and per-stage p95 against an earlier result file and exits with
+status 1 when any of them regressed by more than --max-regression, so the
+benchmark can gate a deploy.
+
+Run from backend directory:
+    python -m recommendation.benchmarks.bench_recommendations [--sizes 1000 10000 100000]
+        [--requests 200] [--output bench.json] [--baseline previous.json]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Sequence
+
+from .synthetic import create_sqlite_catalog, generate_profiles
+from ..logic.contracts import StudentProfile
+from ..logic.runner import run_recommendations
+from ..logic.timing import PipelineTimer, STAGES
+
+
+SCHEMA_VERSION = 1
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of a non-empty sample."""
+    ordered = sorted(samples)
+    index = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def bench_catalog(factory, profiles: List[StudentProfile], limit: int, warmup: int) -> Dict[str, Any]:
+    """Replay profiles against one catalog; one session per request, like the API."""
+    for profile in profiles[:warmup]:
+        with factory() as db:
+            run_recommendations(db, profile, limit)
+
+    end_to_end: List[float] = []
+    stage_ms: Dict[str, List[float]] = {}
+    stage_items: Dict[str, List[int]] = {}
+
+    started = time.perf_counter()
+    for profile in profiles:
+        timer = PipelineTimer()
+        with factory() as db:
+            run_recommendations(db, profile, limit, timer)
+        end_to_end.append(timer.total_ms)
+        for name, entry in timer.stages.items():
+            stage_ms.setdefault(name, []).append(entry["ms"])
+            if entry["items"] is not None:
+                stage_items.setdefault(name, []).append(entry["items"])
+    elapsed = time.perf_counter() - started
+
+    order = {name: i for i, name in enumerate(STAGES)}
+    stages = {}
+    for name in sorted(stage_ms, key=lambda n: order.get(n, len(STAGES))):
+        stages[name] = summarize(stage_ms[name])
+        if name in stage_items:
+            stages[name]["items_mean"] = round(statistics.fmean(stage_items[name]), 1)
+
+    return {
+        "requests": len(profiles),
+        "throughput_rps": round(len(profiles) / elapsed, 2),
+        "end_to_end": summarize(end_to_end),
+        "stages": stages,
+    }
+
+
+def run(sizes: List[int], requests: int, limit: int, warmup: int, seed: int, workdir: str) -> Dict[str, Any]:
+    profiles = [StudentProfile(**data) for data in generate_profiles(requests, seed=seed)]
+    results: Dict[str, Any] = {
+        "schema_version": SCHEMA_VERSION,
+        "benchmark": "recommendations",
+        "python": platform.python_version(),
+        "seed": seed,
+        "limit": limit,
+        "sizes": {},
+    }
+    for size in sizes:
+        factory = create_sqlite_catalog(os.path.join(workdir, f"catalog_{size}_{seed}.db"), size, seed=seed)
+        result = bench_catalog(factory, profiles, limit, warmup)
+        results["sizes"][str(size)] = result
+
+        e2e = result["end_to_end"]
+        print(
+            f"{size:>9} programs  {result['throughput_rps']:>8.1f} req/s  "
+            f"p50 {e2e['p50_ms']:>8.2f}  p95 {e2e['p95_ms']:>8.2f}  p99 {e2e['p99_ms']:>8.2f} ms",
+            file=sys.stderr,
+        )
+        for name, stage in result["stages"].items():
+            print(f"{'':>11}{name:<18} p50 {stage['p50_ms']:>8.2f}  p95 {stage['p95_ms']:>8.2f}  p99 {stage['p99_ms']:>8.2f}", file=sys.stderr)
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float, floor_ms: float = 1.0) -> List[str]:
+    """
+    p95 regressions of current vs baseline beyond max_regression (e.g. 0.25 = +25%).
+
+    Stages whose baseline p95 is under floor_ms are skipped - they are too noisy
+    to gate on.
+    """
+    regressions = []
+    for size, result in current["sizes"].items():
+        before = baseline.get("sizes", {}).get(size)
+        if not before:
+            continue
+        pairs = [("end_to_end", result["end_to_end"], before["end_to_end"])]
+        pairs += [
+            (name, stage, before["stages"][name])
+            for name, stage in result["stages"].items()
+            if name in before.get("stages", {})
+        ]
+        for name, now, then in pairs:
+            if then["p95_ms"] < floor_ms:
+                continue
+            change = now["p95_ms"] / then["p95_ms"] - 1
+            if change > max_regression:
+                regressions.append(
+                    f"{size} programs / {name}: p95 {then['p95_ms']:.2f} -> {now['p95_ms']:.2f} ms (+{change:.0%})"
+                )
+    return regressions
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--requests", type=int, default=200, help="Profiles replayed per catalog size")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", default=None, help="Directory for catalog files (default: temp dir)")
+    parser.add_argument("--output", default=None, help="Write JSON results here instead of stdout")
+    parser.add_argument("--baseline", default=None, help="Earlier JSON result to compare p95 against")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    args = parser.parse_args()
+
+    if args.workdir:
+        results = run(args.sizes, args.requests, args.limit, args.warmup, args.seed, args.workdir)
+    else:
+        with tempfile.TemporaryDirectory() as workdir:
+            results = run(args.sizes, args.requests, args.limit, args.warmup, args.seed, workdir)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,135 @@
+"""
+Benchmark: compact scoring records vs pydantic contracts on the scoring hot path
+
+Scores a synthetic candidate pool with the per-candidate path (convert -> score ->
+rank -> diversity penalty -> assemble top-K) twice:
+
+- pydantic: every intermediate is a validated pydantic model, as before
+  (CandidateProgram, DimensionScore/RiskFactor, ScoredCandidate, re-built
+  ScoredCandidate per diversity adjustment)
+- records:  the slotted records from logic.records, converted to contracts
+  only for the returned top-K in output_assembler
+
+The pydantic variant reuses the current scorers and converts their records, so
+it slightly overstates the old cost by the (small) record construction.
+
+Run from backend directory:
+    python -m recommendation.benchmarks.bench_scoring_records [--sizes 1000 10000]
+"""
+
+import argparse
+import gc
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from .synthetic import generate_catalog
+from models.models import Program
+from ..logic.adapter import transform_program
+from ..logic.aggregator import aggregate_scores, batch_aggregate
+from ..logic.constants import SAME_UNIVERSITY_PENALTY
+from ..logic.contracts import StudentProfile, ScoredCandidate
+from ..logic.output_assembler import assemble_output
+from ..logic.ranker import rank_candidates, apply_diversity_penalty
+from ..logic.runner import _adapter_to_candidate
+
+
+PROFILE = StudentProfile(
+    academic_score_band="good",
+    language_score_band="good",
+    background_field="Computer Science",
+    work_experience_years=2,
+    gap_years=0,
+    target_degree_level="masters",
+    preferred_program_domains=["Computer Science", "Data Science"],
+    preferred_countries=["Ireland", "Germany"],
+    tuition_preference_band="moderate",
+    career_goals=["Software Engineering"],
+)
+
+
+def normalized_pool(size: int) -> List[Dict[str, Any]]:
+    """Adapter-normalized programs for a synthetic catalog."""
+    return [transform_program(Program(**entry)) for entry in generate_catalog(size)["programs"]]
+
+
+def pydantic_pipeline(profile: StudentProfile, normalized: List[Dict[str, Any]], limit: int):
+    candidates = [_adapter_to_candidate(n).to_contract() for n in normalized]
+    scored = [aggregate_scores(profile, c).to_contract() for c in candidates]
+    eligible = [s for s in scored if s.is_eligible]
+    ranked = sorted(eligible, key=lambda x: x.overall_score, reverse=True)
+
+    seen: Dict[int, int] = {}
+    adjusted = []
+    for s in ranked:
+        count = seen.get(s.candidate.university_id, 0)
+        adjusted.append(ScoredCandidate(
+            candidate=s.candidate,
+            dimension_scores=s.dimension_scores,
+            overall_score=max(0.1, s.overall_score - count * SAME_UNIVERSITY_PENALTY),
+            is_eligible=s.is_eligible,
+            risk_factors=s.risk_factors,
+        ))
+        seen[s.candidate.university_id] = count + 1
+    adjusted.sort(key=lambda x: x.overall_score, reverse=True)
+
+    return assemble_output(profile, adjusted[:limit], len(candidates), len(eligible))
+
+
+def records_pipeline(profile: StudentProfile, normalized: List[Dict[str, Any]], limit: int):
+    candidates = [_adapter_to_candidate(n) for n in normalized]
+    eligible = [s for s in batch_aggregate(profile, candidates) if s.is_eligible]
+    ranked = apply_diversity_penalty(rank_candidates(eligible))
+    return assemble_output(profile, ranked[:limit], len(candidates), len(eligible))
+
+
+def _measure(fn: Callable[[], Any], repeat: int) -> Tuple[float, float]:
+    """(median wall time in ms, tracemalloc peak in MiB) of fn."""
+    fn()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(samples), peak / (1024 * 1024)
+
+
+def run(sizes: List[int], repeat: int, limit: int) -> None:
+    print(f"{'candidates':>10}  {'variant':<9} {'median ms':>10} {'peak MiB':>9}")
+    for size in sizes:
+        normalized = normalized_pool(size)
+
+        # Both variants must rank identically
+        expected = [(r.program_id, r.overall_score) for r in pydantic_pipeline(PROFILE, normalized, limit).all_recommendations]
+        actual = [(r.program_id, r.overall_score) for r in records_pipeline(PROFILE, normalized, limit).all_recommendations]
+        assert expected == actual, "record pipeline diverged from the pydantic pipeline"
+
+        results = {}
+        for name, pipeline in (("pydantic", pydantic_pipeline), ("records", records_pipeline)):
+            results[name] = _measure(lambda: pipeline(PROFILE, normalized, limit), repeat)
+            ms, mib = results[name]
+            print(f"{size:>10}  {name:<9} {ms:>10.1f} {mib:>9.1f}")
+
+        (old_ms, old_mib), (new_ms, new_mib) = results["pydantic"], results["records"]
+        print(f"{'':>10}  speedup {old_ms / new_ms:.2f}x, peak memory {new_mib / old_mib:.0%} of pydantic")
+
+
+if __name__ == "__main__":
+    import logging
+    logging.disable(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    run(args.sizes, args.repeat, args.limit)
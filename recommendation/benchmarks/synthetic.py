@@ -0,0 +1,327 @@
+"""
+Synthetic Catalog Generator
+
+Seeded generator for `programs` / `universities` rows whose attributes JSON is
+shaped like production data (school, programIntakes, scoreDetails, tuitionFee),
+plus matching student profiles. Used by the recommendation benchmarks to build
+SQLite catalogs of a given size and a reproducible request mix.
+
+generate_rec_catalog builds the normalized rec_* tables (universities, programs,
+intakes, eligibility snapshots) used by candidate_generator.
+"""
+
+import os
+import random
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from db import Base
+from models.models import Program, UniversityModel
+from ..models import RecProgramFeature, RecUniversity, RecProgram, RecIntake, RecEligibilitySnapshot
+from ..logic.adapter import country_key
+from ..services.program_features import build_program_feature
+
+
+# Country codes as they appear in school.country (mix of codes and names, like production)
+COUNTRIES = [
+    ("IE", "Ireland"), ("CA", "Canada"), ("GB", "United Kingdom"), ("US", "United States"),
+    ("AU", "Australia"), ("DE", "Germany"), ("NZ", "New Zealand"), ("FR", "France"),
+    ("NL", "Netherlands"), ("SG", "Singapore"),
+]
+COUNTRY_WEIGHTS = [8, 20, 18, 22, 14, 6, 4, 3, 3, 2]
+
+DEGREE_TEMPLATES = [
+    ("Master's Degree", "Master of Science in {field}"),
+    ("Master's Degree", "MSc {field}"),
+    ("Master's Degree", "MBA - {field}"),
+    ("Bachelor's Degree", "Bachelor of Science in {field}"),
+    ("Bachelor's Degree", "BA (Hons) {field}"),
+    ("Doctoral Degree", "PhD in {field}"),
+    ("Postgraduate Diploma", "Postgraduate Diploma in {field}"),
+    ("Certificate", "Graduate Certificate in {field}"),
+    ("", "{field}"),
+]
+DEGREE_WEIGHTS = [18, 14, 6, 18, 10, 4, 10, 6, 4]
+
+FIELDS = [
+    "Computer Science", "Data Science", "Business Analytics", "Mechanical Engineering",
+    "Finance", "Marketing", "Public Health", "Nursing", "Psychology", "Mathematics",
+    "Artificial Intelligence", "Civil Engineering", "International Business", "Economics",
+    "Software Engineering", "Biotechnology", "Project Management", "Cyber Security",
+]
+
+CITIES = ["Dublin", "Toronto", "London", "Boston", "Sydney", "Berlin", "Auckland", "Paris",
+          "Amsterdam", "Singapore", "Vancouver", "Manchester", "Melbourne", "Cork"]
+
+SCORE_LABELS = ["Conversion Rate", "Seat Availability", "Turnaround Time"]
+
+# rec_* catalog distributions
+REC_DEGREE_TYPES = ["masters", "msc", "mba", "bachelors", "bsc", "phd", "diploma"]
+REC_DEGREE_WEIGHTS = [30, 15, 5, 25, 10, 5, 10]
+REC_INTAKE_TERMS = ["Fall", "Spring", "Summer"]
+REC_INTAKE_STATUSES = ["open", "upcoming", "active", "closed", None]
+REC_INTAKE_STATUS_WEIGHTS = [30, 30, 10, 25, 5]
+REC_BANDS = ["excellent", "good", "average", "minimum", "unknown"]
+
+# Student profile distributions
+TARGET_DEGREES = ["masters", "bachelors", "phd", "diploma"]
+TARGET_DEGREE_WEIGHTS = [60, 25, 5, 10]
+ACADEMIC_BANDS = ["excellent", "good", "average", "below_average", "poor", "unknown"]
+LANGUAGE_BANDS = ["native", "excellent", "good", "adequate", "minimum", "unknown"]
+TUITION_BANDS = ["very_low", "low", "moderate", "high", "very_high", "unknown"]
+CAREER_GOALS = ["Software Engineering", "Machine Learning", "Consulting", "Finance",
+                "Product Management", "Research", "Healthcare", "Manufacturing"]
+
+
+def _date(d: date) -> str:
+    return d.strftime("%Y-%m-%d")
+
+
+def university_attributes(rng: random.Random, school_id: int) -> Dict[str, Any]:
+    """Attributes JSON for a single university (school)."""
+    code, name = rng.choices(COUNTRIES, weights=COUNTRY_WEIGHTS)[0]
+    return {
+        "id": school_id,
+        "name": f"University of {rng.choice(CITIES)} {school_id}",
+        "country": rng.choice([code, name]),
+        "countryCode": code,
+        "city": rng.choice(CITIES),
+        "rank": rng.choice([None, rng.randint(1, 1200)]),
+        "type": rng.choice(["public", "private"]),
+        "logoThumbnailUrl": f"https://cdn.example.com/logos/{school_id}.png",
+    }
+
+
+def program_attributes(rng: random.Random, program_id: int, school: Dict[str, Any]) -> Dict[str, Any]:
+    """Attributes JSON for a single program at the given school."""
+    level, template = rng.choices(DEGREE_TEMPLATES, weights=DEGREE_WEIGHTS)[0]
+    start = date(2026, rng.choice([1, 5, 9]), 1)
+
+    intakes = []
+    for n in range(rng.randint(0, 4)):
+        intake_start = start + timedelta(days=182 * n)
+        intakes.append({
+            "openDate": _date(intake_start - timedelta(days=240)),
+            "startDate": _date(intake_start),
+            "submissionDeadline": _date(intake_start - timedelta(days=60)),
+            "overallScore": rng.randint(0, 100),
+            "intent": rng.choice(["high", "medium", "low"]),
+            "scoreDetails": [
+                {"scoreTypeLabel": label, "score": rng.randint(0, 100)}
+                for label in rng.sample(SCORE_LABELS, k=rng.randint(0, 3))
+            ],
+        })
+
+    return {
+        "id": program_id,
+        "name": template.format(field=rng.choice(FIELDS)),
+        "level": level,
+        "slug": f"program-{program_id}",
+        "tuitionFee": rng.choice([
+            None,
+            rng.randint(6000, 70000),
+            {"amount": rng.randint(6000, 70000), "currency": "USD"},
+        ]),
+        "applicationFee": rng.choice([0, 50, 100, 150]),
+        "overallScore": rng.randint(0, 100),
+        "school": {key: school[key] for key in ("id", "name", "country", "countryCode", "city", "rank", "logoThumbnailUrl")},
+        "programIntakes": intakes,
+        "scoreDetails": [
+            {"scoreTypeLabel": label, "score": rng.randint(0, 100)}
+            for label in rng.sample(SCORE_LABELS, k=rng.randint(0, 2))
+        ],
+    }
+
+
+def generate_catalog(num_programs: int, seed: int = 42, programs_per_school: int = 25) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Generate university and program rows (as upsert-style entries).
+
+    Returns:
+        Dict with "universities" and "programs" lists of {"id", "type", "attributes"}
+    """
+    rng = random.Random(seed)
+    num_schools = max(1, num_programs // programs_per_school)
+
+    schools = [university_attributes(rng, 1000 + i) for i in range(num_schools)]
+    universities = [
+        {"id": str(school["id"]), "type": "schools", "attributes": school}
+        for school in schools
+    ]
+    programs = [
+        {
+            "id": str(i + 1),
+            "type": "programs",
+            "attributes": program_attributes(rng, i + 1, rng.choice(schools)),
+        }
+        for i in range(num_programs)
+    ]
+    return {"universities": universities, "programs": programs}
+
+
+def generate_profiles(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """
+    Generate StudentProfile payloads (as sent to POST /recommendations).
+
+    Preferred countries are drawn with the catalog's country weights, so the
+    request mix hits large and small candidate pools like production traffic.
+    """
+    rng = random.Random(seed)
+    country_names = [name for _, name in COUNTRIES]
+    profiles = []
+    for i in range(count):
+        countries = []
+        for _ in range(rng.choice([0, 1, 1, 1, 2, 2, 3])):
+            country = rng.choices(country_names, weights=COUNTRY_WEIGHTS)[0]
+            if country not in countries:
+                countries.append(country)
+        profiles.append({
+            "student_id": f"bench-{i}",
+            "target_degree_level": rng.choices(TARGET_DEGREES, weights=TARGET_DEGREE_WEIGHTS)[0],
+            "academic_score_band": rng.choice(ACADEMIC_BANDS),
+            "language_score_band": rng.choice(LANGUAGE_BANDS),
+            "background_field": rng.choice(FIELDS + [None]),
+            "work_experience_years": rng.choice([0, 0, 1, 2, 3, 5, 8]),
+            "gap_years": rng.choice([0, 0, 0, 1, 2, 4]),
+            "preferred_countries": countries,
+            "preferred_program_domains": rng.sample(FIELDS, k=rng.randint(0, 3)),
+            "career_goals": rng.sample(CAREER_GOALS, k=rng.randint(0, 2)),
+            "tuition_preference_band": rng.choice(TUITION_BANDS),
+            "internship_importance": rng.choice(["high", "neutral", "low"]),
+        })
+    return profiles
+
+
+def populate_catalog(db: Session, catalog: Dict[str, List[Dict[str, Any]]], batch_size: int = 2000) -> None:
+    """
+    Bulk-insert a generated catalog, including its materialized program features.
+
+    Equivalent to calling UniversityModel.upsert / Program.upsert per row, but
+    fast enough for 100k-program catalogs.
+    """
+    entries = catalog["universities"]
+    for i in range(0, len(entries), batch_size):
+        db.execute(UniversityModel.__table__.insert(), entries[i:i + batch_size])
+
+    entries = catalog["programs"]
+    for i in range(0, len(entries), batch_size):
+        batch = [{**entry, "school_id": Program.school_id_from(entry["attributes"])} for entry in entries[i:i + batch_size]]
+        db.execute(Program.__table__.insert(), batch)
+        db.execute(
+            RecProgramFeature.__table__.insert(),
+            [build_program_feature(Program(**entry)) for entry in batch],
+        )
+    db.commit()
+
+
+def create_sqlite_catalog(path: str, num_programs: int, seed: int = 42) -> sessionmaker:
+    """
+    Create (or reuse) a SQLite catalog file with num_programs programs.
+
+    Returns:
+        Session factory bound to the catalog database
+    """
+    exists = os.path.exists(path)
+    engine = create_engine(f"sqlite:///{path}", future=True)
+    factory = sessionmaker(bind=engine, autoflush=False, future=True, expire_on_commit=False)
+
+    if not exists:
+        Base.metadata.create_all(bind=engine)
+        with factory() as db:
+            populate_catalog(db, generate_catalog(num_programs, seed=seed))
+
+    return factory
+
+
+def generate_rec_catalog(
+    num_programs: int,
+    seed: int = 42,
+    programs_per_university: int = 25,
+    intakes_per_program: int = 6,
+    snapshots_per_intake: int = 3
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Seeded rows for the rec_* tables; every program gets several intakes and snapshots."""
+    rng = random.Random(seed)
+    tables: Dict[str, List[Dict[str, Any]]] = {"universities": [], "programs": [], "intakes": [], "snapshots": []}
+
+    num_universities = max(1, num_programs // programs_per_university)
+    for university_id in range(1, num_universities + 1):
+        _, country = rng.choices(COUNTRIES, weights=COUNTRY_WEIGHTS)[0]
+        tables["universities"].append({
+            "id": university_id,
+            "name": f"University {university_id}",
+            "country": country,
+            "country_key": country_key(country),
+            "city": rng.choice(CITIES),
+            "institution_type": rng.choice(["public", "private"]),
+            "global_reputation_band": rng.choice(["top_10", "top_50", "top_100", "top_200", "top_500", "unranked"]),
+        })
+
+    intake_id = snapshot_id = 0
+    for program_id in range(1, num_programs + 1):
+        field = rng.choice(FIELDS)
+        tables["programs"].append({
+            "id": program_id,
+            "university_id": rng.randint(1, num_universities),
+            "degree_type": rng.choices(REC_DEGREE_TYPES, weights=REC_DEGREE_WEIGHTS)[0],
+            "program_domain": field,
+            "program_name": f"{field} {program_id}",
+            "tuition_fee_band": rng.choice(TUITION_BANDS),
+            "program_competitiveness_band": rng.choice(["low", "moderate", "high"]),
+            "background_preference_tags": [rng.choice(FIELDS).lower()],
+            "industry_alignment_tags": [rng.choice(CAREER_GOALS).lower()],
+        })
+        for _ in range(rng.randint(1, intakes_per_program)):
+            intake_id += 1
+            year = rng.randint(2025, 2028)
+            tables["intakes"].append({
+                "id": intake_id,
+                "program_id": program_id,
+                "intake_term": rng.choice(REC_INTAKE_TERMS),
+                "intake_year": year,
+                "application_close_date": date(year, 1, 1) + timedelta(days=rng.randint(0, 300)),
+                "intake_status": rng.choices(REC_INTAKE_STATUSES, weights=REC_INTAKE_STATUS_WEIGHTS)[0],
+            })
+            for _ in range(rng.randint(1, snapshots_per_intake)):
+                snapshot_id += 1
+                tables["snapshots"].append({
+                    "id": snapshot_id,
+                    "intake_id": intake_id,
+                    "academic_score_band": rng.choice(REC_BANDS),
+                    "language_score_band": rng.choice(REC_BANDS),
+                    "background_match_level": rng.choice(["strong_match", "good_match", "partial_match"]),
+                    "work_experience_preference": rng.choice(["required", "preferred", "neutral"]),
+                    "gap_year_tolerance_level": rng.choice(["high", "moderate", "low"]),
+                    "historical_acceptance_strictness": rng.choice(["lenient", "moderate", "strict"]),
+                    "competition_level_this_intake": rng.choice(["low", "moderate", "high"]),
+                    "last_verified_at": datetime(2025, 1, 1) + timedelta(days=rng.randint(0, 600)),
+                })
+    return tables
+
+
+def create_rec_catalog(path: str, num_programs: int, seed: int = 42, **kwargs) -> sessionmaker:
+    """
+    Create (or reuse) a SQLite database with a generate_rec_catalog catalog.
+
+    Returns:
+        Session factory bound to the catalog database
+    """
+    exists = os.path.exists(path)
+    engine = create_engine(f"sqlite:///{path}", future=True)
+    factory = sessionmaker(bind=engine, autoflush=False, future=True, expire_on_commit=False)
+
+    if not exists:
+        Base.metadata.create_all(bind=engine)
+        tables = generate_rec_catalog(num_programs, seed=seed, **kwargs)
+        with factory() as db:
+            for model, name in ((RecUniversity, "universities"), (RecProgram, "programs"),
+                                (RecIntake, "intakes"), (RecEligibilitySnapshot, "snapshots")):
+                db.execute(model.__table__.insert(), tables[name])
+            db.commit()
+
+    return factory
@@ -11,43 +11,17 @@ This is a pure READ + TRANSFORM layer:
 - NO AI/LLM usage
 """
 
-from typing import List, Dict, Any, Optional
+import weakref
+from typing import List, Dict, Any, Optional, Sequence, Union
 from datetime import date, datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, cast, String
+from sqlalchemy import inspect, select, literal, union_all, func
 
 from models.models import Program, UniversityModel
-
-
-# Country code to name mapping
-COUNTRY_CODE_MAP = {
-    "AU": "Australia",
-    "CA": "Canada", 
-    "DE": "Germany",
-    "GB": "United Kingdom",
-    "UK": "United Kingdom",
-    "IE": "Ireland",
-    "US": "United States",
-    "USA": "United States",
-    "NZ": "New Zealand",
-    "SG": "Singapore",
-    "NL": "Netherlands",
-    "FR": "France",
-}
-
-# Reverse mapping: Full name to codes (for SQL filtering)
-COUNTRY_NAME_TO_CODES = {
-    "australia": ["AU", "au", "Australia"],
-    "canada": ["CA", "ca", "Canada"],
-    "germany": ["DE", "de", "Germany"],
-    "united kingdom": ["GB", "UK", "gb", "uk", "United Kingdom"],
-    "ireland": ["IE", "ie", "Ireland"],
-    "united states": ["US", "USA", "us", "usa", "United States"],
-    "new zealand": ["NZ", "nz", "New Zealand"],
-    "singapore": ["SG", "sg", "Singapore"],
-    "netherlands": ["NL", "nl", "Netherlands"],
-    "france": ["FR", "fr", "France"],
-}
+from ..models import RecProgramFeature
+from .timing import PipelineTimer
+from .degree_classifier import classify_degree
+from .countries import resolve_country, country_key  # country_key re-exported for callers
 
 
 def normalize_degree_level(raw_degree_text: Optional[str]) -> str:
@@ -55,6 +29,7 @@ def normalize_degree_level(raw_degree_text: Optional[str]) -> str:
     Normalize inconsistent degree labels to standard categories.
     
     Returns one of: 'bachelors', 'masters', 'diploma', 'phd', 'unknown'
+    (see degree_classifier.classify_degree for the confidence).
     
     Args:
         raw_degree_text: Raw degree level string from database
@@ -62,41 +37,15 @@ def normalize_degree_level(raw_degree_text: Optional[str]) -> str:
     Returns:
         Normalized degree level
     """
-    if not raw_degree_text:
-        return "unknown"
-    
-    # Convert to lowercase for case-insensitive matching
-    text = raw_degree_text.lower().strip()
-    
-    # Masters patterns
-    masters_patterns = ["master", "msc", "ma", "mba", "meng", "mtech", "ms", "m.sc", "m.a", "m.eng"]
-    if any(pattern in text for pattern in masters_patterns):
-        return "masters"
-    
-    # PhD patterns
-    phd_patterns = ["phd", "ph.d", "doctorate", "doctoral"]
-    if any(pattern in text for pattern in phd_patterns):
-        return "phd"
-    
-    # Bachelors patterns
-    bachelors_patterns = ["bachelor", "bsc", "ba", "beng", "btech", "bs", "b.sc", "b.a", "b.eng", "undergraduate"]
-    if any(pattern in text for pattern in bachelors_patterns):
-        return "bachelors"
-    
-    # Diploma patterns
-    diploma_patterns = ["diploma", "certificate", "foundation", "postgraduate diploma", "pgdip"]
-    if any(pattern in text for pattern in diploma_patterns):
-        return "diploma"
-    
-    return "unknown"
+    return classify_degree(raw_degree_text).level
 
 
 def _get_country_name(code_or_name: str) -> str:
-    """Convert country code to full name."""
+    """Convert a country code, name or alias to its display name (unrecognized values pass through)."""
     if not code_or_name:
         return ""
-    upper = code_or_name.upper()
-    return COUNTRY_CODE_MAP.get(upper, code_or_name)
+    country = resolve_country(code_or_name)
+    return country.name if country else code_or_name
 
 
 def _safe_get(data: Optional[Dict], *keys, default=None):
@@ -328,161 +277,194 @@ def transform_program(program: Program, university: Optional[UniversityModel] =
     }
 
 
+def feature_to_normalized(feature: RecProgramFeature) -> Dict[str, Any]:
+    """
+    Convert a materialized RecProgramFeature row to the normalized program format.
+    
+    Produces the same keys as transform_program for everything the engine consumes.
+    """
+    first_intake = {
+        "open_date": feature.intake_open_date,
+        "start_date": feature.intake_start_date,
+        "deadline": feature.intake_deadline,
+    }
+    has_intake = any(value is not None for value in first_intake.values())
+    
+    return {
+        # IDs
+        "program_id": feature.external_id or feature.program_id,
+        "university_id": feature.school_id,
+        
+        # University info
+        "university_name": feature.university_name or "",
+        "country": feature.country or "",
+        "city": feature.city or "",
+        "rank": feature.rank,
+        "institution_type": feature.institution_type or "",
+        "logo_thumbnail_url": feature.logo_thumbnail_url,
+        
+        # Program info
+        "program_name": feature.program_name or "",
+        "degree_level": feature.degree_level or "",
+        "normalized_degree_level": feature.normalized_degree_level,
+        "tuition_fee": feature.tuition_fee,
+        
+        # Signals (normalized)
+        "conversion_signal": feature.conversion_signal or "UNKNOWN",
+        "seat_availability": feature.seat_availability or "UNKNOWN",
+        "turnaround_time": feature.turnaround_time or "UNKNOWN",
+        
+        # Intakes (first intake only)
+        "intakes": [first_intake] if has_intake else [],
+        
+        # Additional metadata
+        "program_type": feature.program_type,
+    }
+
+
+# Engines on which rec_program_features has been found (checked once per engine)
+_FEATURE_TABLE_ENGINES: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def _feature_table_exists(db: Session) -> bool:
+    """Check (once per engine) that rec_program_features has been created."""
+    engine = db.get_bind().engine
+    if engine not in _FEATURE_TABLE_ENGINES:
+        if not inspect(engine).has_table(RecProgramFeature.__tablename__):
+            return False
+        _FEATURE_TABLE_ENGINES.add(engine)
+    return True
+
+
 def fetch_and_transform_programs(
     db: Session,
     limit: int = 100,
     offset: int = 0,
-    country_filter: Optional[str] = None,
-    target_degree_level: Optional[str] = None
+    country_filter: Optional[Union[str, Sequence[str]]] = None,
+    target_degree_level: Optional[str] = None,
+    timer: Optional[PipelineTimer] = None
 ) -> List[Dict[str, Any]]:
     """
-    Fetch programs from DB and transform to normalized format.
+    Fetch programs from DB in normalized format.
+    
+    Reads the materialized rec_program_features table (built at ingest time by
+    recommendation.services.program_features), so no JSON parsing happens here.
+    Hard filters are equality lookups on (country_key, normalized_degree_level,
+    program_id) indexes. Every (country, degree state) pair becomes one
+    LIMIT-ed index range read, and all of them are combined with UNION ALL into
+    a single query - so several countries cost about the same as one.
     
     HARD FILTERS (applied before scoring):
     - Degree level (if specified) - MANDATORY
-    - Country (if specified)
+    - Country or list of countries (if specified)
+    
+    Within a country, programs whose degree matches exactly come before programs
+    with an unknown degree (which are kept, with a scoring penalty). Countries
+    are interleaved round-robin in preference order, which gives each country an
+    equal share of `limit` and hands the slots a country cannot fill to the
+    others.
     
     Args:
         db: Database session
         limit: Max records to return after filtering
         offset: Pagination offset
-        country_filter: Optional country filter
+        country_filter: Optional country, or list of countries in preference order
         target_degree_level: Optional degree level filter (bachelors/masters/diploma/phd)
+        timer: Optional PipelineTimer (records sql_fetch / transform / degree_filter)
     
     Returns:
         List of normalized program dicts
     """
     import logging
     logger = logging.getLogger(__name__)
+    timer = timer or PipelineTimer()
     
-    # OPTIMIZATION: Use smaller fetch limit and apply SQL-level filtering where possible
-    # This reduces data transfer from DB and speeds up processing
-    fetch_limit = min(200, limit * 3) if (country_filter or target_degree_level) else limit
-    
-    logger.info(f"🔍 Fetching programs from DB (limit={fetch_limit}, offset={offset})")
-    
-    # Build query with SQL-level country filtering if possible
-    query = db.query(Program)
-    
-    # PostgreSQL JSON filtering for country (much faster than Python filtering)
-    # NOTE: We search for BOTH full country names AND country codes
-    if country_filter:
-        country_lower = country_filter.lower()
-        
-        # Get all possible search terms (country codes + full name)
-        search_terms = COUNTRY_NAME_TO_CODES.get(country_lower, [country_filter])
-        search_terms.append(country_filter)  # Include original input
-        
-        # Build OR conditions for all search terms
-        conditions = []
-        for term in search_terms:
-            # Search for the term in JSON attributes
-            # stricter pattern: look for quoted term (e.g. "IE", "USA")
-            pattern = f'%"{term}"%' 
-            conditions.append(cast(Program.attributes, String).ilike(pattern))
-            
-            # Only use broad unquoted matching for longer terms (e.g. "Ireland")
-            # This prevents "ie" matching "science" or "field"
-            if len(term) > 3:
-                pattern2 = f'%{term}%'
-                conditions.append(cast(Program.attributes, String).ilike(pattern2))
-        
-        if conditions:
-            query = query.filter(or_(*conditions))
-        
-        logger.info(f"🔍 Country filter applied for: {search_terms}")
-    
-    # SQL-level Degree Filtering (Heuristic)
-    # This prevents fetching 200 "Bachelors" programs when user wants "Masters"
-    if target_degree_level:
-        degree_keywords = {
-            "masters": ["master", "msc", "ma ", "mba", "m.sc", "m.a", "post grad"],
-            "bachelors": ["bachelor", "bsc", "ba ", "undergrad", "b.sc", "b.a"],
-            "phd": ["phd", "doctor", "dphil"],
-            "diploma": ["diploma", "certificate", "associate"]
-        }
-        
-        keywords = degree_keywords.get(target_degree_level.lower(), [])
-        if keywords:
-            degree_conditions = []
-            for kw in keywords:
-                # Search case-insensitive in the whole JSON dump
-                # This is "good enough" for pre-filtering
-                degree_conditions.append(cast(Program.attributes, String).ilike(f'%{kw}%'))
-            
-            if degree_conditions:
-                query = query.filter(or_(*degree_conditions))
-                logger.info(f"🎓 Degree pre-filter applied for {target_degree_level}: {keywords}")
-
-    programs = query.offset(offset).limit(fetch_limit).all()
-    logger.info(f"📊 Programs fetched from DB: {len(programs)}")
-    
-    results = []
-    degree_filtered_count = 0
-    degree_match_count = 0
-    degree_unknown_count = 0
-    
-    for program in programs:
-        try:
-            normalized = transform_program(program)
-            
-            # HARD FILTER 1: Degree Level (3-state handling)
-            if target_degree_level:
-                # Extract degree from ALL available text sources (CRITICAL FIX)
-                # Degree info is embedded in program names, not in a clean field
-                program_name = normalized.get("program_name", "")
-                raw_degree_field = normalized.get("degree_level", "")
-                
-                # Combine all text sources for degree detection
-                degree_source_text = " ".join([
-                    str(raw_degree_field or ""),
-                    str(program_name or "")
-                ]).strip()
-                
-                # Normalize based on combined text
-                normalized_degree = normalize_degree_level(degree_source_text)
-                
-                # Store normalized degree for later use
-                normalized["normalized_degree_level"] = normalized_degree
-                
-                # Determine degree match status
-                degree_match_status = "unknown"
-                
-                if normalized_degree == target_degree_level:
-                    degree_match_status = "match"
-                    degree_match_count += 1
-                elif normalized_degree == "unknown":
-                    degree_match_status = "unknown"
-                    degree_unknown_count += 1
-                else:
-                    # Clear mismatch (e.g., bachelors vs masters)
-                    degree_filtered_count += 1
-                    continue  # EXCLUDE only clear mismatches
-                
-                # Attach metadata to candidate for scoring penalty
-                normalized["degree_match_status"] = degree_match_status
-            
-            # NOTE: Country filtering is now done at SQL level (see above)
-            # No need for duplicate Python-level filtering
-            
-            results.append(normalized)
-            
-            # Stop once we have enough results
-            if len(results) >= limit:
-                break
-                
-        except Exception as e:
-            # Log but don't fail on individual record errors
-            logger.warning(f"Failed to transform program {program.id}: {e}")
-            continue
+    if not _feature_table_exists(db):
+        logger.error("❌ rec_program_features table missing - run create_all and the feature backfill")
+        return []
     
-    # Debug logging for pipeline visibility
+    if isinstance(country_filter, str):
+        country_filter = [country_filter]
+    
+    # Canonical keys, de-duplicated in preference order ("IE" and "Ireland" are one country)
+    keys: List[Optional[str]] = []
+    for country in country_filter or []:
+        key = country_key(country)
+        if key and key not in keys:
+            keys.append(key)
+    if keys:
+        logger.info(f"🌍 Country filter applied for: {keys}")
+    else:
+        keys = [None]
+    
+    # HARD FILTER: Degree level (3-state handling - only clear mismatches are excluded)
     if target_degree_level:
-        logger.info(f"🎓 Degree matches (exact): {degree_match_count}")
-        logger.info(f"❓ Degree unknown (included with penalty): {degree_unknown_count}")
-        logger.info(f"❌ Degree mismatches (excluded): {degree_filtered_count}")
-    if country_filter:
-        logger.info(f"🌍 Country filter applied at SQL level: {country_filter}")
+        degree_states = [(target_degree_level, "match"), ("unknown", "unknown")]
+    else:
+        degree_states = [(None, None)]
+    
+    # One index-only range read per (country, degree state). Any single country
+    # may end up taking every slot, so each branch reads up to offset + limit ids.
+    branches = []
+    for country_index, key in enumerate(keys):
+        for state, (degree_level, _) in enumerate(degree_states):
+            branch = select(
+                RecProgramFeature.program_id,
+                literal(country_index).label("country_index"),
+                literal(state).label("degree_state"),
+            )
+            if key:
+                branch = branch.where(RecProgramFeature.country_key == key)
+            if degree_level:
+                branch = branch.where(RecProgramFeature.normalized_degree_level == degree_level)
+            branch = branch.order_by(RecProgramFeature.program_id).limit(offset + limit).subquery()
+            branches.append(select(branch))
+    
+    pool = (branches[0] if len(branches) == 1 else union_all(*branches)).subquery()
+    if len(keys) > 1:
+        country_rank = func.row_number().over(
+            partition_by=pool.c.country_index,
+            order_by=(pool.c.degree_state, pool.c.program_id),
+        )
+    else:
+        # Single country (or none): the rank is just the degree-state / program_id order
+        country_rank = pool.c.degree_state
+    ranked = select(pool, country_rank.label("country_rank")).subquery()
+    page = (
+        select(ranked)
+        .order_by(ranked.c.country_rank, ranked.c.country_index, ranked.c.program_id)
+        .offset(offset)
+        .limit(limit)
+        .subquery()
+    )
+    
+    # Only the selected page is joined back to the full feature rows
+    with timer.stage("sql_fetch"):
+        rows = db.execute(
+            select(RecProgramFeature, page.c.country_index, page.c.degree_state)
+            .join(page, page.c.program_id == RecProgramFeature.program_id)
+            .order_by(page.c.country_rank, page.c.country_index, page.c.program_id)
+        ).all()
+    timer.count("sql_fetch", len(rows))
+    
+    with timer.stage("transform", items=len(rows)):
+        results = [feature_to_normalized(feature) for feature, _, _ in rows]
+    
+    degree_counts: Dict[str, int] = {}
+    country_counts: Dict[str, int] = {}
+    with timer.stage("degree_filter", items=len(rows)):
+        for normalized, (_, country_index, degree_state) in zip(results, rows):
+            match_status = degree_states[degree_state][1]
+            if match_status:
+                normalized["degree_match_status"] = match_status
+                degree_counts[match_status] = degree_counts.get(match_status, 0) + 1
+            if keys[country_index]:
+                country_counts[keys[country_index]] = country_counts.get(keys[country_index], 0) + 1
+    
+    for match_status, count in degree_counts.items():
+        logger.info(f"🎓 Degree {match_status}: {count}")
+    if len(keys) > 1:
+        logger.info(f"🌍 Candidates per country: {country_counts}")
     logger.info(f"✅ Final candidate pool sent to scoring engine: {len(results)}")
     
     return results
@@ -517,42 +499,42 @@ def fetch_single_program(db: Session, program_id: str) -> Optional[Dict[str, Any
 def get_programs_by_university(
     db: Session,
     university_id: str,
-    limit: int = 50
+    limit: int = 50,
+    offset: int = 0
 ) -> List[Dict[str, Any]]:
     """
     Get all programs for a specific university.
     
+    One range read on ix_programs_school_id (programs.school_id, id); only the
+    returned page is transformed.
+    
     Args:
         db: Database session
         university_id: University ID
         limit: Max programs to return
+        offset: Programs to skip (pages are in program id order)
     
     Returns:
         List of normalized program dicts
     """
     # Get the university
     university = db.query(UniversityModel).filter(
-        UniversityModel.id == university_id
+        UniversityModel.id == str(university_id)
     ).first()
     
-    # Fetch programs and filter by school.id in Python
-    programs = db.query(Program).limit(limit * 3).all()
+    programs = (
+        db.query(Program)
+        .filter(Program.school_id == str(university_id))
+        .order_by(Program.id)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
     
     results = []
     for program in programs:
         try:
-            attrs = program.attributes or {}
-            school = attrs.get("school", {}) or {}
-            school_id = str(school.get("id", ""))
-            
-            if school_id != university_id:
-                continue
-                
-            normalized = transform_program(program, university)
-            results.append(normalized)
-            
-            if len(results) >= limit:
-                break
+            results.append(transform_program(program, university))
         except Exception as e:
             print(f"Warning: Failed to transform program {program.id}: {e}")
             continue
@@ -5,15 +5,13 @@ Combines individual dimension scores into an overall score.
 Applies weighting and normalization.
 """
 
-from typing import List, Dict
-from .contracts import (
-    StudentProfile, 
-    CandidateProgram, 
-    DimensionScore, 
-    ScoredCandidate,
-    RiskFactor
-)
+import time
+from typing import Callable, List, Dict, Iterable, Optional, Tuple, Union
+from .contracts import StudentProfile
+from .records import Candidate, DimensionRecord, RiskRecord, ScoredRecord
 from .dimension_scorers import (
+    CompiledProfile,
+    compile_profile,
     score_academic_fit,
     score_eligibility,
     score_program_fit,
@@ -21,38 +19,75 @@ from .dimension_scorers import (
     score_career_alignment,
     score_location_preference,
 )
-from .constants import DIMENSION_WEIGHTS, ELIGIBILITY_THRESHOLD
+from .constants import (
+    DIMENSION_WEIGHTS,
+    ELIGIBILITY_THRESHOLD,
+    COLUMNAR_MIN_CANDIDATES,
+    ANYTIME_FIRST_CHUNK,
+    ANYTIME_MIN_CHUNK,
+)
+from . import columnar
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional accelerator
+    np = None
 
-def aggregate_scores(
-    profile: StudentProfile,
-    candidate: CandidateProgram
-) -> ScoredCandidate:
+
+# Dimension name -> scorer, in aggregation order (risk factors are collected in this order)
+SCORERS = {
+    "academic_fit": score_academic_fit,
+    "eligibility": score_eligibility,
+    "program_fit": score_program_fit,
+    "affordability": score_affordability,
+    "career_alignment": score_career_alignment,
+    "location_preference": score_location_preference,
+}
+
+# Per-dimension scorer output: (score, risks raised by that scorer)
+DimensionResult = Tuple[DimensionRecord, List[RiskRecord]]
+
+
+def score_dimensions(
+    profile: Union[StudentProfile, CompiledProfile],
+    candidate: Candidate,
+    dimensions: Optional[Iterable[str]] = None
+) -> Dict[str, DimensionResult]:
     """
-    Compute all dimension scores and aggregate into overall score.
+    Run the scorers for the given dimensions (default: all).
     
     Args:
-        profile: Student's profile
+        profile: Student's profile (or its compile_profile output, when scoring many candidates)
         candidate: Program candidate to score
+        dimensions: Dimension names to score
         
     Returns:
-        ScoredCandidate with all scores and eligibility status
+        Dict of dimension name -> (DimensionRecord, risks)
     """
-    dimension_scores: Dict[str, DimensionScore] = {}
-    all_risks: List[RiskFactor] = []
-    
-    # Score each dimension
-    scorers = [
-        score_academic_fit,
-        score_eligibility,
-        score_program_fit,
-        score_affordability,
-        score_career_alignment,
-        score_location_preference,
-    ]
-    
-    for scorer in scorers:
-        score, risks = scorer(profile, candidate)
+    compiled = compile_profile(profile)
+    names = SCORERS if dimensions is None else dimensions
+    return {name: SCORERS[name](compiled, candidate) for name in names}
+
+
+def combine_dimensions(
+    candidate: Candidate,
+    results: Dict[str, DimensionResult]
+) -> ScoredRecord:
+    """
+    Aggregate per-dimension scorer results into an overall score.
+    
+    Args:
+        candidate: Program candidate the results belong to
+        results: Output of score_dimensions for every dimension
+        
+    Returns:
+        ScoredRecord with all scores and eligibility status
+    """
+    dimension_scores: Dict[str, DimensionRecord] = {}
+    all_risks: List[RiskRecord] = []
+    
+    for name in SCORERS:
+        score, risks = results[name]
         dimension_scores[score.dimension] = score
         all_risks.extend(risks)
     
@@ -83,7 +118,7 @@ def aggregate_scores(
     if len(high_risks) >= 2:
         is_eligible = False
     
-    return ScoredCandidate(
+    return ScoredRecord(
         candidate=candidate,
         dimension_scores=dimension_scores,
         overall_score=overall_score,
@@ -92,10 +127,28 @@ def aggregate_scores(
     )
 
 
+def aggregate_scores(
+    profile: Union[StudentProfile, CompiledProfile],
+    candidate: Candidate
+) -> ScoredRecord:
+    """
+    Compute all dimension scores and aggregate into overall score.
+    
+    Args:
+        profile: Student's profile (or its compile_profile output)
+        candidate: Program candidate to score
+        
+    Returns:
+        ScoredRecord with all scores and eligibility status
+        (converted to ScoredCandidate by output_assembler)
+    """
+    return combine_dimensions(candidate, score_dimensions(profile, candidate))
+
+
 def batch_aggregate(
     profile: StudentProfile,
-    candidates: List[CandidateProgram]
-) -> List[ScoredCandidate]:
+    candidates: List[Candidate]
+) -> List[ScoredRecord]:
     """
     Score multiple candidates in batch.
     
@@ -104,6 +157,151 @@ def batch_aggregate(
         candidates: List of program candidates
         
     Returns:
-        List of ScoredCandidate objects
+        List of ScoredRecord objects
+    """
+    # Profile-side lookups and normalization happen once, not once per candidate
+    compiled = compile_profile(profile)
+    return [aggregate_scores(compiled, c) for c in candidates]
+
+
+def batch_aggregate_dimensions(
+    profile: StudentProfile,
+    candidates: List[Candidate]
+) -> Tuple[List[ScoredRecord], List[Dict[str, DimensionResult]]]:
+    """
+    Score multiple candidates in batch and keep their per-dimension results.
+
+    Same records as batch_aggregate; the scorer results are what what-if
+    re-scoring reuses for the dimensions a profile change does not touch.
+
+    Args:
+        profile: Student's profile
+        candidates: List of program candidates
+
+    Returns:
+        Tuple of (ScoredRecord objects, score_dimensions output per candidate)
+    """
+    compiled = compile_profile(profile)
+    results = [score_dimensions(compiled, c) for c in candidates]
+    return [combine_dimensions(c, r) for c, r in zip(candidates, results)], results
+
+
+def batch_aggregate_top_k(
+    profile: StudentProfile,
+    candidates: List[Candidate],
+    top_k: int
+) -> Tuple[List[ScoredRecord], int]:
+    """
+    Score a candidate pool when only the best top_k eligible candidates are needed.
+    
+    Large pools are scored column-wise with NumPy and only the candidates that can
+    reach the final top_k (after the diversity penalty) are materialized as
+    ScoredRecord objects. Small pools, or environments without NumPy, use the
+    per-candidate path.
+    
+    Args:
+        profile: Student's profile
+        candidates: List of program candidates
+        top_k: Number of final recommendations required
+        
+    Returns:
+        Tuple of (eligible ScoredRecord objects, total eligible count)
+    """
+    if not columnar.is_available() or len(candidates) < COLUMNAR_MIN_CANDIDATES:
+        eligible = [s for s in batch_aggregate(profile, candidates) if s.is_eligible]
+        return eligible, len(eligible)
+    
+    columns = columnar.encode_candidates(candidates)
+    scores = columnar.score_columns(profile, columns)
+    selected = columnar.select_top_k(scores, columns.university_ids, top_k)
+    
+    compiled = compile_profile(profile)
+    eligible = [aggregate_scores(compiled, candidates[i]) for i in selected]
+    return eligible, int(scores.is_eligible.sum())
+
+
+def batch_aggregate_anytime(
+    profile: StudentProfile,
+    candidates: List[Candidate],
+    top_k: int,
+    deadline: float,
+    clock: Callable[[], float] = time.perf_counter
+) -> Tuple[List[ScoredRecord], int, int]:
+    """
+    Score a candidate pool in priority order until a deadline ("anytime" mode).
+    
+    Candidates are scored in chunks, best university reputation first (the
+    candidate-only prior of the score tables; ties keep pool order). After each
+    chunk its cost per candidate decides how many more fit before the deadline;
+    scoring stops once fewer than ANYTIME_MIN_CHUNK would. The first
+    ANYTIME_FIRST_CHUNK candidates are always scored, and so is a remainder of at
+    most ANYTIME_FIRST_CHUNK - pools of up to twice that size are never truncated.
+    
+    The top_k selection over the scored candidates is the one batch_aggregate_top_k
+    makes, so a pool scored completely before the deadline gives the same result.
+    Large pools are scored column-wise per chunk.
+    
+    Args:
+        profile: Student's profile
+        candidates: List of program candidates
+        top_k: Number of final recommendations required
+        deadline: clock() value by which scoring should be done
+        clock: Time source of the deadline (time.perf_counter)
+        
+    Returns:
+        Tuple of (eligible ScoredRecord objects, eligible count among the scored
+        candidates, number of candidates scored)
     """
-    return [aggregate_scores(profile, c) for c in candidates]
+    compiled = compile_profile(profile)
+    reputation = compiled.tables.reputation
+    prior = [reputation.values[reputation.code(c.global_reputation_band)] for c in candidates]
+    order = sorted(range(len(candidates)), key=prior.__getitem__, reverse=True)  # stable
+    use_columns = columnar.is_available() and len(candidates) >= COLUMNAR_MIN_CANDIDATES
+    
+    chunk_started = clock()
+    scored = 0
+    chunk = ANYTIME_FIRST_CHUNK
+    parts = []  # (ColumnScores, university ids) per chunk, or (index, eligible ScoredRecord)
+    while scored < len(order):
+        batch = order[scored:scored + chunk]
+        if use_columns:
+            columns = columnar.encode_candidates([candidates[i] for i in batch])
+            parts.append((columnar.score_columns(compiled.profile, columns), columns.university_ids))
+        else:
+            for i in batch:
+                record = aggregate_scores(compiled, candidates[i])
+                if record.is_eligible:
+                    parts.append((i, record))
+        scored += len(batch)
+        
+        # How many more candidates fit, at the cost per candidate of the last chunk
+        now = clock()
+        chunk = int((deadline - now) * len(batch) / max(now - chunk_started, 1e-9)) if now < deadline else 0
+        chunk_started = now
+        remaining = len(order) - scored
+        if remaining <= ANYTIME_FIRST_CHUNK:
+            # The rest costs no more than the first chunk did: a partial result would save next to nothing
+            chunk = remaining
+        elif chunk < ANYTIME_MIN_CHUNK:
+            break
+    
+    # Back to pool order, so ties rank as they would in a complete run
+    if not use_columns:
+        parts.sort(key=lambda part: part[0])
+        return [record for _, record in parts], len(parts), scored
+    
+    scored_order = np.array(order[:scored])
+    restore = np.argsort(scored_order, kind="stable")
+    
+    def merged(arrays):
+        return np.concatenate(arrays)[restore]
+    
+    scores = columnar.ColumnScores(
+        {name: merged([s.dimensions[name] for s, _ in parts]) for name in parts[0][0].dimensions},
+        merged([s.overall for s, _ in parts]),
+        merged([s.high_risk_count for s, _ in parts]),
+    )
+    selected = columnar.select_top_k(scores, merged([ids for _, ids in parts]), top_k)
+    indices = scored_order[restore]
+    eligible = [aggregate_scores(compiled, candidates[i]) for i in indices[selected].tolist()]
+    return eligible, int(scores.is_eligible.sum()), scored
@@ -6,12 +6,36 @@ Applies initial filtering to reduce the candidate pool before scoring.
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import case, or_, select
+from sqlalchemy.orm import Query, Session, aliased
 
+from .countries import country_key
 from .contracts import StudentProfile, CandidateProgram
 from ..models import RecUniversity, RecProgram, RecIntake, RecEligibilitySnapshot
 
 
+# Intake statuses considered for recommendations (NULL status counts as active)
+ACTIVE_INTAKE_STATUSES = ["open", "upcoming", "active"]
+
+# Indexes generate_candidates relies on (declared on the models; see ensure_candidate_indexes)
+CANDIDATE_INDEXES = [
+    *RecProgram.__table__.indexes,
+    *RecIntake.__table__.indexes,
+    *RecEligibilitySnapshot.__table__.indexes,
+]
+
+
+def ensure_candidate_indexes(bind) -> None:
+    """
+    Create the candidate query indexes on existing databases.
+    
+    create_all only adds indexes together with new tables; intended for
+    application startup and idempotent.
+    """
+    for index in CANDIDATE_INDEXES:
+        index.create(bind=bind, checkfirst=True)
+
+
 def generate_candidates(
     db: Session,
     profile: StudentProfile,
@@ -20,21 +44,88 @@ def generate_candidates(
     """
     Generate candidate programs based on student profile preferences.
     
+    Args:
+        db: Database session
+        profile: Student's profile and preferences
+        max_candidates: Maximum number of candidates to return
+        
+    Returns:
+        List of CandidateProgram objects ready for scoring
+    """
+    results = candidate_query(db, profile, max_candidates).all()
+    
+    return [
+        _build_candidate(program, university, intake, eligibility)
+        for program, university, intake, eligibility in results
+    ]
+
+
+def candidate_query(
+    db: Session,
+    profile: StudentProfile,
+    max_candidates: int = 200
+) -> Query:
+    """
+    Query of (RecProgram, RecUniversity, RecIntake, RecEligibilitySnapshot) rows.
+    
     Applies initial filtering:
     - Country preferences (if specified)
     - Program domain preferences (if specified)  
     - Target degree level
     - Target intake timing
     
+    Returns one row per program: its best matching intake (open, then upcoming,
+    then active / unset status; then the nearest intake year and deadline) and
+    that intake's most recently verified eligibility snapshot. Both are picked in
+    SQL with correlated LIMIT 1 subqueries, so programs with many intakes /
+    snapshots do not multiply into rows before LIMIT max_candidates.
+    
     Args:
         db: Database session
         profile: Student's profile and preferences
-        max_candidates: Maximum number of candidates to return
-        
-    Returns:
-        List of CandidateProgram objects ready for scoring
+        max_candidates: Maximum number of rows (= programs)
     """
-    candidates: List[CandidateProgram] = []
+    # Best intake per program (index: program_id, intake_year, intake_status)
+    intake = aliased(RecIntake)
+    intake_filters = [
+        intake.program_id == RecProgram.id,
+        or_(intake.intake_status.in_(ACTIVE_INTAKE_STATUSES), intake.intake_status.is_(None)),
+    ]
+    if profile.target_intake_year:
+        intake_filters.append(intake.intake_year == profile.target_intake_year)
+    if profile.target_intake_term:
+        intake_filters.append(intake.intake_term.ilike(f"%{profile.target_intake_term}%"))
+    
+    status_priority = case(
+        {status: rank for rank, status in enumerate(ACTIVE_INTAKE_STATUSES)},
+        value=intake.intake_status,
+        else_=len(ACTIVE_INTAKE_STATUSES),
+    )
+    best_intake_id = (
+        select(intake.id)
+        .where(*intake_filters)
+        .order_by(
+            status_priority,
+            intake.intake_year,
+            intake.application_close_date.is_(None),
+            intake.application_close_date,
+            intake.id,
+        )
+        .limit(1)
+        .correlate(RecProgram)
+        .scalar_subquery()
+    )
+    
+    # Latest eligibility snapshot per intake (index: intake_id)
+    snapshot = aliased(RecEligibilitySnapshot)
+    latest_snapshot_id = (
+        select(snapshot.id)
+        .where(snapshot.intake_id == RecIntake.id)
+        .order_by(snapshot.last_verified_at.is_(None), snapshot.last_verified_at.desc(), snapshot.id.desc())
+        .limit(1)
+        .correlate(RecIntake)
+        .scalar_subquery()
+    )
     
     # Build base query joining all recommendation tables
     query = db.query(
@@ -45,20 +136,20 @@ def generate_candidates(
     ).join(
         RecUniversity,
         RecProgram.university_id == RecUniversity.id
-    ).outerjoin(
+    ).join(
         RecIntake,
-        RecIntake.program_id == RecProgram.id
+        RecIntake.id == best_intake_id
     ).outerjoin(
         RecEligibilitySnapshot,
-        RecEligibilitySnapshot.intake_id == RecIntake.id
+        RecEligibilitySnapshot.id == latest_snapshot_id
     )
     
     # Apply filters based on preferences
     
-    # Country filter
+    # Country filter (canonical codes, so "IE" and "Ireland" match the same rows)
     if profile.preferred_countries:
         query = query.filter(
-            RecUniversity.country.in_(profile.preferred_countries)
+            RecUniversity.country_key.in_(sorted({country_key(c) for c in profile.preferred_countries}))
         )
     
     # Degree type filter (map target_degree_level to degree types)
@@ -85,35 +176,11 @@ def generate_candidates(
                 RecProgram.program_domain.ilike(f"%{domain}%")
             )
         if domain_filters:
-            from sqlalchemy import or_
             query = query.filter(or_(*domain_filters))
     
-    # Intake timing filter
-    if profile.target_intake_year:
-        query = query.filter(
-            RecIntake.intake_year == profile.target_intake_year
-        )
-    if profile.target_intake_term:
-        query = query.filter(
-            RecIntake.intake_term.ilike(f"%{profile.target_intake_term}%")
-        )
-    
-    # Active intakes only
-    query = query.filter(
-        RecIntake.intake_status.in_(["open", "upcoming", "active", None])
-    )
-    
-    # Limit results
-    query = query.limit(max_candidates)
-    
-    # Execute query and build candidates
-    results = query.all()
-    
-    for program, university, intake, eligibility in results:
-        candidate = _build_candidate(program, university, intake, eligibility)
-        candidates.append(candidate)
-    
-    return candidates
+    # Limit results (one row per program). No ORDER BY: the scan along
+    # ix_rec_programs_degree_university stops as soon as the limit is reached
+    return query.limit(max_candidates)
 
 
 def _build_candidate(
@@ -151,11 +218,11 @@ def _build_candidate(
         internship_opportunities=program.internship_opportunities or "",
         
         # Intake data
-        intake_term=intake.intake_term if intake else "",
+        intake_term=(intake.intake_term or "") if intake else "",
         intake_year=intake.intake_year if intake else 0,
         application_open_date=intake.application_open_date if intake else None,
         application_close_date=intake.application_close_date if intake else None,
-        intake_status=intake.intake_status if intake else "",
+        intake_status=(intake.intake_status or "") if intake else "",
         
         # Eligibility snapshot data
         academic_score_band=eligibility.academic_score_band if eligibility else "unknown",
@@ -9,11 +9,11 @@ Classifies scored candidates into fit categories:
 """
 
 from typing import List, Tuple
-from .contracts import ScoredCandidate
+from .records import ScoredRecord
 from .constants import FitCategory, CLASSIFICATION_THRESHOLDS
 
 
-def classify_candidate(scored: ScoredCandidate) -> FitCategory:
+def classify_candidate(scored: ScoredRecord) -> FitCategory:
     """
     Classify a single scored candidate into a fit category.
     
@@ -39,8 +39,8 @@ def classify_candidate(scored: ScoredCandidate) -> FitCategory:
 
 
 def classify_all(
-    scored_candidates: List[ScoredCandidate]
-) -> List[Tuple[ScoredCandidate, FitCategory]]:
+    scored_candidates: List[ScoredRecord]
+) -> List[Tuple[ScoredRecord, FitCategory]]:
     """
     Classify all scored candidates.
     
@@ -48,15 +48,15 @@ def classify_all(
         scored_candidates: List of scored candidates
         
     Returns:
-        List of tuples (ScoredCandidate, FitCategory)
+        List of tuples (ScoredRecord, FitCategory)
     """
     return [(scored, classify_candidate(scored)) for scored in scored_candidates]
 
 
 def filter_by_category(
-    classified: List[Tuple[ScoredCandidate, FitCategory]],
+    classified: List[Tuple[ScoredRecord, FitCategory]],
     category: FitCategory
-) -> List[ScoredCandidate]:
+) -> List[ScoredRecord]:
     """
     Filter candidates by a specific category.
     
@@ -65,13 +65,13 @@ def filter_by_category(
         category: Target category
         
     Returns:
-        List of ScoredCandidate in the specified category
+        List of ScoredRecord in the specified category
     """
     return [scored for scored, cat in classified if cat == category]
 
 
 def get_category_counts(
-    classified: List[Tuple[ScoredCandidate, FitCategory]]
+    classified: List[Tuple[ScoredRecord, FitCategory]]
 ) -> dict:
     """
     Count candidates in each category.
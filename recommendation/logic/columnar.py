@@ -0,0 +1,368 @@
+"""
+Columnar Scoring
+
+Vectorized (NumPy) implementation of the dimension scorers for large candidate pools.
+
+The band fields of a candidate pool are encoded once as integer code arrays; all six
+dimensions are then computed for every candidate with array operations. Only the
+final top-K candidates are materialized as ScoredRecord objects (via the regular
+aggregate_scores path), so the per-object cost no longer grows with the pool size.
+
+The numbers produced here must stay identical to dimension_scorers.py - any change to
+a scorer has to be mirrored in score_columns().
+"""
+
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional accelerator
+    np = None
+
+from .contracts import StudentProfile
+from .records import Candidate
+from .tag_index import TagMatcher
+from .countries import country_key
+from .constants import (
+    ACADEMIC_SCORE_BAND_MAP,
+    LANGUAGE_SCORE_BAND_MAP,
+    BACKGROUND_MATCH_LEVEL_MAP,
+    WORK_EXPERIENCE_YEARS_MAP,
+    GAP_YEAR_TOLERANCE_MAP,
+    COMPETITION_LEVEL_MAP,
+    REPUTATION_BAND_MAP,
+    TUITION_FEE_BAND_MAP,
+    DIMENSION_WEIGHTS,
+    ELIGIBILITY_THRESHOLD,
+    SAME_UNIVERSITY_PENALTY,
+    DEFAULT_SCORE,
+)
+from .dimension_scorers import compile_profile
+
+
+# Band fields encoded as integer codes: candidate attribute -> band map
+BAND_FIELDS: Dict[str, Dict[str, float]] = {
+    "academic_score_band": ACADEMIC_SCORE_BAND_MAP,
+    "language_score_band": LANGUAGE_SCORE_BAND_MAP,
+    "background_match_level": BACKGROUND_MATCH_LEVEL_MAP,
+    "gap_year_tolerance_level": GAP_YEAR_TOLERANCE_MAP,
+    "competition_level_this_intake": COMPETITION_LEVEL_MAP,
+    "global_reputation_band": REPUTATION_BAND_MAP,
+    "tuition_fee_band": TUITION_FEE_BAND_MAP,
+}
+
+# Work experience preference only matters as required / preferred / other
+_WORK_PREF_CODES = {"required": 0, "preferred": 1}
+
+
+def is_available() -> bool:
+    """True when NumPy is installed and the columnar path can be used."""
+    return np is not None
+
+
+class CandidateColumns:
+    """
+    Column-encoded view of a candidate pool.
+
+    Band fields are stored as integer codes into the keys of their band map
+    (code == len(keys) means "not in the map" and resolves to the scorer default).
+    Free-text fields (domain, tags, country) are stored as codes into a list of
+    unique values so string matching runs once per distinct value.
+    """
+
+    def __init__(self, candidates: Sequence[Candidate]):
+        self.size = len(candidates)
+        self.band_codes: Dict[str, "np.ndarray"] = {}
+        self.band_keys: Dict[str, List[str]] = {}
+
+        for field, band_map in BAND_FIELDS.items():
+            keys = list(band_map.keys())
+            index = {key: i for i, key in enumerate(keys)}
+            missing = len(keys)
+            self.band_keys[field] = keys
+            self.band_codes[field] = np.fromiter(
+                (index.get(getattr(c, field).lower(), missing) for c in candidates),
+                dtype=np.int16,
+                count=self.size,
+            )
+
+        self.work_pref = np.fromiter(
+            (_WORK_PREF_CODES.get(c.work_experience_preference.lower(), 2) for c in candidates),
+            dtype=np.int8,
+            count=self.size,
+        )
+        self.degree_unknown = np.fromiter(
+            (c.degree_match_status == "unknown" for c in candidates),
+            dtype=bool,
+            count=self.size,
+        )
+        self.university_ids = np.fromiter(
+            (c.university_id for c in candidates), dtype=np.int64, count=self.size
+        )
+
+        self.domains, self.domain_codes = _encode_values(c.program_domain for c in candidates)
+        self.industry_tags, self.industry_codes = _encode_values(
+            tuple(c.industry_alignment_tags) for c in candidates
+        )
+        self.background_tags, self.background_codes = _encode_values(
+            tuple(c.background_preference_tags) for c in candidates
+        )
+        self.internships, self.internship_codes = _encode_values(
+            c.internship_opportunities for c in candidates
+        )
+        self.countries, self.country_codes = _encode_values(c.country for c in candidates)
+
+    def band_values(self, field: str, default: float) -> "np.ndarray":
+        """Resolve a band field's codes to scores through its band map."""
+        band_map = BAND_FIELDS[field]
+        lut = np.array(
+            [band_map[key] for key in self.band_keys[field]] + [default],
+            dtype=np.float64,
+        )
+        return lut[self.band_codes[field]]
+
+
+class ColumnScores:
+    """Per-candidate dimension scores, overall score and eligibility as arrays."""
+
+    def __init__(
+        self,
+        dimensions: Dict[str, "np.ndarray"],
+        overall: "np.ndarray",
+        high_risk_count: "np.ndarray",
+    ):
+        self.dimensions = dimensions
+        self.overall = overall
+        self.high_risk_count = high_risk_count
+        self.is_eligible = (
+            (dimensions["academic_fit"] >= ELIGIBILITY_THRESHOLD)
+            & (dimensions["eligibility"] >= ELIGIBILITY_THRESHOLD)
+            & (high_risk_count < 2)
+        )
+
+
+def encode_candidates(candidates: Sequence[Candidate]) -> CandidateColumns:
+    """Encode a candidate pool into columns (done once per pool)."""
+    return CandidateColumns(candidates)
+
+
+def score_columns(profile: StudentProfile, columns: CandidateColumns) -> ColumnScores:
+    """
+    Compute all six dimension scores for every candidate in the pool.
+
+    Mirrors the scalar scorers in dimension_scorers.py.
+    """
+    dimensions: Dict[str, np.ndarray] = {}
+
+    # --- Academic fit -------------------------------------------------------
+    student_academic = ACADEMIC_SCORE_BAND_MAP.get(profile.academic_score_band.lower(), DEFAULT_SCORE)
+    student_language = LANGUAGE_SCORE_BAND_MAP.get(profile.language_score_band.lower(), DEFAULT_SCORE)
+    program_academic = columns.band_values("academic_score_band", DEFAULT_SCORE)
+    program_language = columns.band_values("language_score_band", DEFAULT_SCORE)
+
+    academic_match = np.minimum(1.0, student_academic / np.maximum(program_academic, 0.1))
+    language_match = np.minimum(1.0, student_language / np.maximum(program_language, 0.1))
+    academic = (academic_match * 0.6) + (language_match * 0.4)
+    dimensions["academic_fit"] = np.where(columns.degree_unknown, academic * 0.7, academic)
+
+    high_risks = (student_academic < program_academic - 0.2).astype(np.int8)
+    high_risks += student_language < program_language - 0.2
+
+    # --- Eligibility --------------------------------------------------------
+    background = columns.band_values("background_match_level", DEFAULT_SCORE)
+    student_work_exp = WORK_EXPERIENCE_YEARS_MAP.get(
+        _work_experience_band(profile.work_experience_years), DEFAULT_SCORE
+    )
+    work_exp_match = np.select(
+        [columns.work_pref == 0, columns.work_pref == 1],
+        [student_work_exp, 0.5 + (student_work_exp * 0.5)],
+        default=0.8,
+    )
+    if student_work_exp < 0.4:
+        high_risks += columns.work_pref == 0
+
+    gap_tolerance = columns.band_values("gap_year_tolerance_level", 0.7)
+    if profile.gap_years > 0:
+        gap_penalty = np.minimum(profile.gap_years * (1.0 - gap_tolerance) * 0.1, 0.3)
+        if profile.gap_years >= 3:
+            high_risks += gap_tolerance < 0.5
+    else:
+        gap_penalty = np.zeros(columns.size)
+    gap_score = np.maximum(0.2, 1.0 - gap_penalty)
+
+    competition = columns.band_values("competition_level_this_intake", 0.5)
+    dimensions["eligibility"] = (
+        background * 0.35 +
+        work_exp_match * 0.25 +
+        gap_score * 0.15 +
+        competition * 0.25
+    )
+
+    # --- Program fit (string matching once per distinct value) --------------
+    # Same TagMatcher as the scalar scorers, so the optional similarity model applies to both
+    tags = compile_profile(profile).tags
+    domain_match = _per_value(columns.domains, columns.domain_codes,
+                              lambda domain: _domain_match(profile, tags, domain))
+    career_match = _per_value(columns.industry_tags, columns.industry_codes,
+                              lambda values: _career_match(profile, tags, values))
+    background_fit = _per_value(columns.background_tags, columns.background_codes,
+                                lambda values: _background_fit(profile, tags, values))
+    internship_match = _per_value(columns.internships, columns.internship_codes,
+                                  lambda text: _internship_match(profile, text))
+    dimensions["program_fit"] = (
+        domain_match * 0.35 +
+        career_match * 0.25 +
+        background_fit * 0.25 +
+        internship_match * 0.15
+    )
+
+    # --- Affordability ------------------------------------------------------
+    program_tuition = columns.band_values("tuition_fee_band", DEFAULT_SCORE)
+    if profile.tuition_preference_band and profile.tuition_preference_band != "unknown":
+        student_budget = TUITION_FEE_BAND_MAP.get(profile.tuition_preference_band.lower(), DEFAULT_SCORE)
+        dimensions["affordability"] = np.where(
+            program_tuition >= student_budget,
+            1.0,
+            np.maximum(0.2, program_tuition / student_budget),
+        )
+    else:
+        dimensions["affordability"] = np.full(columns.size, 0.7)
+
+    # --- Career alignment ---------------------------------------------------
+    reputation = columns.band_values("global_reputation_band", DEFAULT_SCORE)
+    industry_match = _per_value(columns.industry_tags, columns.industry_codes,
+                                lambda values: _industry_match(profile, tags, values))
+    dimensions["career_alignment"] = (reputation * 0.4) + (industry_match * 0.6)
+
+    # --- Location preference ------------------------------------------------
+    preferred = frozenset(country_key(c) for c in profile.preferred_countries)
+    dimensions["location_preference"] = _per_value(
+        columns.countries, columns.country_codes,
+        lambda country: _location_match(preferred, country),
+    )
+
+    overall = sum(
+        dimensions[dimension] * DIMENSION_WEIGHTS[dimension]
+        for dimension in DIMENSION_WEIGHTS
+    )
+    overall = np.clip(overall, 0.0, 1.0)
+
+    return ColumnScores(dimensions, overall, high_risks)
+
+
+def select_top_k(
+    scores: ColumnScores,
+    university_ids: "np.ndarray",
+    top_k: int
+) -> List[int]:
+    """
+    Pick the indices of the top_k eligible candidates after the diversity penalty.
+
+    Reproduces ranker.rank_candidates + apply_diversity_penalty on the arrays, so
+    running those functions again on the returned subset yields the same order.
+
+    Returns:
+        Candidate indices, ordered by raw overall score (descending)
+    """
+    eligible_idx = np.flatnonzero(scores.is_eligible)
+    if eligible_idx.size == 0 or top_k <= 0:
+        return []
+
+    # rank_candidates: stable sort by overall score, descending
+    ranked = eligible_idx[np.argsort(-scores.overall[eligible_idx], kind="stable")]
+
+    # apply_diversity_penalty: penalty grows with each repeat of the same university
+    unis = university_ids[ranked]
+    by_uni = np.argsort(unis, kind="stable")
+    sorted_unis = unis[by_uni]
+    group_start = np.flatnonzero(np.r_[True, sorted_unis[1:] != sorted_unis[:-1]])
+    group_sizes = np.diff(np.r_[group_start, sorted_unis.size])
+    repeat_count = np.empty(ranked.size, dtype=np.int64)
+    repeat_count[by_uni] = np.arange(ranked.size) - np.repeat(group_start, group_sizes)
+
+    adjusted = np.maximum(0.1, scores.overall[ranked] - repeat_count * SAME_UNIVERSITY_PENALTY)
+    keep = np.sort(np.argsort(-adjusted, kind="stable")[:top_k])
+
+    return ranked[keep].tolist()
+
+
+# =============================================================================
+# HELPER FUNCTIONS
+# =============================================================================
+
+def _encode_values(values) -> Tuple[list, "np.ndarray"]:
+    """Map each value to the index of its first occurrence in a unique list."""
+    uniques: list = []
+    index: dict = {}
+    codes = []
+    for value in values:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(uniques)
+            uniques.append(value)
+        codes.append(code)
+    return uniques, np.asarray(codes, dtype=np.int64)
+
+
+def _per_value(uniques: list, codes: "np.ndarray", fn) -> "np.ndarray":
+    """Evaluate fn once per distinct value and broadcast back to the pool."""
+    lut = np.fromiter((fn(value) for value in uniques), dtype=np.float64, count=len(uniques))
+    return lut[codes]
+
+
+def _work_experience_band(years: float) -> str:
+    """Convert years of work experience to a WORK_EXPERIENCE_YEARS_MAP band."""
+    if years >= 5:
+        return "extensive"
+    elif years >= 3:
+        return "significant"
+    elif years >= 1:
+        return "moderate"
+    elif years > 0:
+        return "minimal"
+    return "none"
+
+
+def _domain_match(profile: StudentProfile, tags: TagMatcher, program_domain: str) -> float:
+    if not profile.preferred_program_domains:
+        return 0.5
+    return tags.domain_match(program_domain)
+
+
+def _career_match(profile: StudentProfile, tags: TagMatcher, values: tuple) -> float:
+    if not (profile.career_goals and values):
+        return 0.5
+    matches, _ = tags.career_counts(values)
+    return min(1.0, 0.5 + (matches * 0.25)) if matches > 0 else 0.5
+
+
+def _background_fit(profile: StudentProfile, tags: TagMatcher, values: tuple) -> float:
+    if not (profile.background_field and values):
+        return 0.5
+    return tags.background_fit(values)
+
+
+def _internship_match(profile: StudentProfile, internship_opportunities: str) -> float:
+    if profile.internship_importance != "high":
+        return 0.7
+    if "strong" in internship_opportunities.lower():
+        return 1.0
+    elif "available" in internship_opportunities.lower():
+        return 0.8
+    return 0.5
+
+
+def _industry_match(profile: StudentProfile, tags: TagMatcher, values: tuple) -> float:
+    if not (profile.career_goals and values):
+        return 0.5
+    _, matches = tags.career_counts(values)
+    return min(1.0, 0.5 + (matches * 0.2))
+
+
+def _location_match(preferred: FrozenSet[str], country: str) -> float:
+    # preferred holds country_key values, as CompiledProfile.countries does
+    if not preferred:
+        return 0.7
+    elif country_key(country) in preferred:
+        return 1.0
+    return 0.4
@@ -163,6 +163,34 @@ MAX_TOTAL_RECOMMENDATIONS = 15
 # Diversity penalty - reduce score for programs from same university
 SAME_UNIVERSITY_PENALTY = 0.1
 
+# Candidate pool fetched per request (at least `limit`). The whole pool's eligible
+# programs are ranked and kept for cursor pagination, beyond the first `limit`
+CANDIDATE_POOL_SIZE = 200
+
+# Pools at least this large are scored column-wise (NumPy) when only the top-K is needed
+COLUMNAR_MIN_CANDIDATES = 256
+
+# Anytime scoring (time_budget_ms, see aggregator.batch_aggregate_anytime):
+# candidates scored before the first deadline check (scored even past the deadline);
+# a remainder this small is scored too rather than returned as a partial result
+ANYTIME_FIRST_CHUNK = 64
+# stop once fewer candidates than this still fit in the remaining budget
+ANYTIME_MIN_CHUNK = 32
+# share of the budget kept for ranking, assembly and serialization
+ANYTIME_RESERVE_FRACTION = 0.15
+
+# =============================================================================
+# DOMAIN SIMILARITY MODEL (optional, see domain_similarity.py)
+# =============================================================================
+
+# Program domains at least this similar to a preferred domain score
+# 0.5 + (DOMAIN_SIMILARITY_MAX_SCORE - 0.5) * similarity (substring matches still score 1.0 / 0.7)
+DOMAIN_SIMILARITY_THRESHOLD = 0.5
+DOMAIN_SIMILARITY_MAX_SCORE = 0.9
+
+# A career goal counts as matched by an industry tag at least this similar
+CAREER_SIMILARITY_THRESHOLD = 0.5
+
 # =============================================================================
 # RISK FACTORS
 # =============================================================================
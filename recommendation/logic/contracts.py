@@ -152,11 +152,17 @@ class RecommendationOutput(BaseModel):
     total_candidates_evaluated: int = 0
     total_eligible: int = 0
     total_recommended: int = 0
+    candidates_by_country: Dict[str, int] = Field(default_factory=dict)  # Pool size per preferred country
     
     # Processing metadata
     processing_time_ms: Optional[float] = None
     engine_version: str = "1.0.0"
     
+    # Anytime mode (time_budget_ms): partial = scoring stopped at the deadline,
+    # coverage = share of the candidate pool that was scored
+    partial: bool = False
+    coverage: float = Field(default=1.0, ge=0.0, le=1.0)
+    
     # Warnings/Notes
     warnings: List[str] = Field(default_factory=list)
 
@@ -0,0 +1,190 @@
+"""
+Country Registry
+
+Immutable ISO 3166-1 registry (alpha-2, alpha-3, common English name) plus
+aliases seen in catalog data and student input ("UK", "USA", "Holland", ...).
+
+Catalog rows and filters both resolve countries here, so "IE", "IRL", "ie" and
+"Ireland" all map to one canonical alpha-2 code, stored at ingest and compared
+by equality at request time.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+
+@dataclass(slots=True, frozen=True)
+class Country:
+    code: str      # ISO 3166-1 alpha-2
+    alpha3: str    # ISO 3166-1 alpha-3
+    name: str      # Common English name (display)
+
+
+# (alpha-2, alpha-3, name)
+_ISO_COUNTRIES = (
+    ("AD", "AND", "Andorra"), ("AE", "ARE", "United Arab Emirates"), ("AF", "AFG", "Afghanistan"),
+    ("AG", "ATG", "Antigua and Barbuda"), ("AI", "AIA", "Anguilla"), ("AL", "ALB", "Albania"),
+    ("AM", "ARM", "Armenia"), ("AO", "AGO", "Angola"), ("AQ", "ATA", "Antarctica"),
+    ("AR", "ARG", "Argentina"), ("AS", "ASM", "American Samoa"), ("AT", "AUT", "Austria"),
+    ("AU", "AUS", "Australia"), ("AW", "ABW", "Aruba"), ("AX", "ALA", "Åland Islands"),
+    ("AZ", "AZE", "Azerbaijan"), ("BA", "BIH", "Bosnia and Herzegovina"), ("BB", "BRB", "Barbados"),
+    ("BD", "BGD", "Bangladesh"), ("BE", "BEL", "Belgium"), ("BF", "BFA", "Burkina Faso"),
+    ("BG", "BGR", "Bulgaria"), ("BH", "BHR", "Bahrain"), ("BI", "BDI", "Burundi"),
+    ("BJ", "BEN", "Benin"), ("BL", "BLM", "Saint Barthélemy"), ("BM", "BMU", "Bermuda"),
+    ("BN", "BRN", "Brunei"), ("BO", "BOL", "Bolivia"), ("BQ", "BES", "Caribbean Netherlands"),
+    ("BR", "BRA", "Brazil"), ("BS", "BHS", "Bahamas"), ("BT", "BTN", "Bhutan"),
+    ("BV", "BVT", "Bouvet Island"), ("BW", "BWA", "Botswana"), ("BY", "BLR", "Belarus"),
+    ("BZ", "BLZ", "Belize"), ("CA", "CAN", "Canada"), ("CC", "CCK", "Cocos (Keeling) Islands"),
+    ("CD", "COD", "DR Congo"), ("CF", "CAF", "Central African Republic"), ("CG", "COG", "Republic of the Congo"),
+    ("CH", "CHE", "Switzerland"), ("CI", "CIV", "Côte d'Ivoire"), ("CK", "COK", "Cook Islands"),
+    ("CL", "CHL", "Chile"), ("CM", "CMR", "Cameroon"), ("CN", "CHN", "China"),
+    ("CO", "COL", "Colombia"), ("CR", "CRI", "Costa Rica"), ("CU", "CUB", "Cuba"),
+    ("CV", "CPV", "Cape Verde"), ("CW", "CUW", "Curaçao"), ("CX", "CXR", "Christmas Island"),
+    ("CY", "CYP", "Cyprus"), ("CZ", "CZE", "Czechia"), ("DE", "DEU", "Germany"),
+    ("DJ", "DJI", "Djibouti"), ("DK", "DNK", "Denmark"), ("DM", "DMA", "Dominica"),
+    ("DO", "DOM", "Dominican Republic"), ("DZ", "DZA", "Algeria"), ("EC", "ECU", "Ecuador"),
+    ("EE", "EST", "Estonia"), ("EG", "EGY", "Egypt"), ("EH", "ESH", "Western Sahara"),
+    ("ER", "ERI", "Eritrea"), ("ES", "ESP", "Spain"), ("ET", "ETH", "Ethiopia"),
+    ("FI", "FIN", "Finland"), ("FJ", "FJI", "Fiji"), ("FK", "FLK", "Falkland Islands"),
+    ("FM", "FSM", "Micronesia"), ("FO", "FRO", "Faroe Islands"), ("FR", "FRA", "France"),
+    ("GA", "GAB", "Gabon"), ("GB", "GBR", "United Kingdom"), ("GD", "GRD", "Grenada"),
+    ("GE", "GEO", "Georgia"), ("GF", "GUF", "French Guiana"), ("GG", "GGY", "Guernsey"),
+    ("GH", "GHA", "Ghana"), ("GI", "GIB", "Gibraltar"), ("GL", "GRL", "Greenland"),
+    ("GM", "GMB", "Gambia"), ("GN", "GIN", "Guinea"), ("GP", "GLP", "Guadeloupe"),
+    ("GQ", "GNQ", "Equatorial Guinea"), ("GR", "GRC", "Greece"),
+    ("GS", "SGS", "South Georgia and the South Sandwich Islands"), ("GT", "GTM", "Guatemala"),
+    ("GU", "GUM", "Guam"), ("GW", "GNB", "Guinea-Bissau"), ("GY", "GUY", "Guyana"),
+    ("HK", "HKG", "Hong Kong"), ("HM", "HMD", "Heard Island and McDonald Islands"), ("HN", "HND", "Honduras"),
+    ("HR", "HRV", "Croatia"), ("HT", "HTI", "Haiti"), ("HU", "HUN", "Hungary"),
+    ("ID", "IDN", "Indonesia"), ("IE", "IRL", "Ireland"), ("IL", "ISR", "Israel"),
+    ("IM", "IMN", "Isle of Man"), ("IN", "IND", "India"), ("IO", "IOT", "British Indian Ocean Territory"),
+    ("IQ", "IRQ", "Iraq"), ("IR", "IRN", "Iran"), ("IS", "ISL", "Iceland"),
+    ("IT", "ITA", "Italy"), ("JE", "JEY", "Jersey"), ("JM", "JAM", "Jamaica"),
+    ("JO", "JOR", "Jordan"), ("JP", "JPN", "Japan"), ("KE", "KEN", "Kenya"),
+    ("KG", "KGZ", "Kyrgyzstan"), ("KH", "KHM", "Cambodia"), ("KI", "KIR", "Kiribati"),
+    ("KM", "COM", "Comoros"), ("KN", "KNA", "Saint Kitts and Nevis"), ("KP", "PRK", "North Korea"),
+    ("KR", "KOR", "South Korea"), ("KW", "KWT", "Kuwait"), ("KY", "CYM", "Cayman Islands"),
+    ("KZ", "KAZ", "Kazakhstan"), ("LA", "LAO", "Laos"), ("LB", "LBN", "Lebanon"),
+    ("LC", "LCA", "Saint Lucia"), ("LI", "LIE", "Liechtenstein"), ("LK", "LKA", "Sri Lanka"),
+    ("LR", "LBR", "Liberia"), ("LS", "LSO", "Lesotho"), ("LT", "LTU", "Lithuania"),
+    ("LU", "LUX", "Luxembourg"), ("LV", "LVA", "Latvia"), ("LY", "LBY", "Libya"),
+    ("MA", "MAR", "Morocco"), ("MC", "MCO", "Monaco"), ("MD", "MDA", "Moldova"),
+    ("ME", "MNE", "Montenegro"), ("MF", "MAF", "Saint Martin"), ("MG", "MDG", "Madagascar"),
+    ("MH", "MHL", "Marshall Islands"), ("MK", "MKD", "North Macedonia"), ("ML", "MLI", "Mali"),
+    ("MM", "MMR", "Myanmar"), ("MN", "MNG", "Mongolia"), ("MO", "MAC", "Macau"),
+    ("MP", "MNP", "Northern Mariana Islands"), ("MQ", "MTQ", "Martinique"), ("MR", "MRT", "Mauritania"),
+    ("MS", "MSR", "Montserrat"), ("MT", "MLT", "Malta"), ("MU", "MUS", "Mauritius"),
+    ("MV", "MDV", "Maldives"), ("MW", "MWI", "Malawi"), ("MX", "MEX", "Mexico"),
+    ("MY", "MYS", "Malaysia"), ("MZ", "MOZ", "Mozambique"), ("NA", "NAM", "Namibia"),
+    ("NC", "NCL", "New Caledonia"), ("NE", "NER", "Niger"), ("NF", "NFK", "Norfolk Island"),
+    ("NG", "NGA", "Nigeria"), ("NI", "NIC", "Nicaragua"), ("NL", "NLD", "Netherlands"),
+    ("NO", "NOR", "Norway"), ("NP", "NPL", "Nepal"), ("NR", "NRU", "Nauru"),
+    ("NU", "NIU", "Niue"), ("NZ", "NZL", "New Zealand"), ("OM", "OMN", "Oman"),
+    ("PA", "PAN", "Panama"), ("PE", "PER", "Peru"), ("PF", "PYF", "French Polynesia"),
+    ("PG", "PNG", "Papua New Guinea"), ("PH", "PHL", "Philippines"), ("PK", "PAK", "Pakistan"),
+    ("PL", "POL", "Poland"), ("PM", "SPM", "Saint Pierre and Miquelon"), ("PN", "PCN", "Pitcairn Islands"),
+    ("PR", "PRI", "Puerto Rico"), ("PS", "PSE", "Palestine"), ("PT", "PRT", "Portugal"),
+    ("PW", "PLW", "Palau"), ("PY", "PRY", "Paraguay"), ("QA", "QAT", "Qatar"),
+    ("RE", "REU", "Réunion"), ("RO", "ROU", "Romania"), ("RS", "SRB", "Serbia"),
+    ("RU", "RUS", "Russia"), ("RW", "RWA", "Rwanda"), ("SA", "SAU", "Saudi Arabia"),
+    ("SB", "SLB", "Solomon Islands"), ("SC", "SYC", "Seychelles"), ("SD", "SDN", "Sudan"),
+    ("SE", "SWE", "Sweden"), ("SG", "SGP", "Singapore"), ("SH", "SHN", "Saint Helena"),
+    ("SI", "SVN", "Slovenia"), ("SJ", "SJM", "Svalbard and Jan Mayen"), ("SK", "SVK", "Slovakia"),
+    ("SL", "SLE", "Sierra Leone"), ("SM", "SMR", "San Marino"), ("SN", "SEN", "Senegal"),
+    ("SO", "SOM", "Somalia"), ("SR", "SUR", "Suriname"), ("SS", "SSD", "South Sudan"),
+    ("ST", "STP", "São Tomé and Príncipe"), ("SV", "SLV", "El Salvador"), ("SX", "SXM", "Sint Maarten"),
+    ("SY", "SYR", "Syria"), ("SZ", "SWZ", "Eswatini"), ("TC", "TCA", "Turks and Caicos Islands"),
+    ("TD", "TCD", "Chad"), ("TF", "ATF", "French Southern Territories"), ("TG", "TGO", "Togo"),
+    ("TH", "THA", "Thailand"), ("TJ", "TJK", "Tajikistan"), ("TK", "TKL", "Tokelau"),
+    ("TL", "TLS", "Timor-Leste"), ("TM", "TKM", "Turkmenistan"), ("TN", "TUN", "Tunisia"),
+    ("TO", "TON", "Tonga"), ("TR", "TUR", "Turkey"), ("TT", "TTO", "Trinidad and Tobago"),
+    ("TV", "TUV", "Tuvalu"), ("TW", "TWN", "Taiwan"), ("TZ", "TZA", "Tanzania"),
+    ("UA", "UKR", "Ukraine"), ("UG", "UGA", "Uganda"), ("UM", "UMI", "United States Minor Outlying Islands"),
+    ("US", "USA", "United States"), ("UY", "URY", "Uruguay"), ("UZ", "UZB", "Uzbekistan"),
+    ("VA", "VAT", "Vatican City"), ("VC", "VCT", "Saint Vincent and the Grenadines"), ("VE", "VEN", "Venezuela"),
+    ("VG", "VGB", "British Virgin Islands"), ("VI", "VIR", "U.S. Virgin Islands"), ("VN", "VNM", "Vietnam"),
+    ("VU", "VUT", "Vanuatu"), ("WF", "WLF", "Wallis and Futuna"), ("WS", "WSM", "Samoa"),
+    ("YE", "YEM", "Yemen"), ("YT", "MYT", "Mayotte"), ("ZA", "ZAF", "South Africa"),
+    ("ZM", "ZMB", "Zambia"), ("ZW", "ZWE", "Zimbabwe"),
+)
+
+# Alternative spellings, formal names and non-ISO codes -> alpha-2
+_ALIASES = {
+    "uk": "GB", "great britain": "GB", "britain": "GB", "england": "GB", "scotland": "GB",
+    "wales": "GB", "northern ireland": "GB",
+    "united kingdom of great britain and northern ireland": "GB",
+    "usa": "US", "united states of america": "US", "america": "US",
+    "republic of ireland": "IE", "eire": "IE",
+    "holland": "NL", "the netherlands": "NL",
+    "uae": "AE", "emirates": "AE",
+    "korea": "KR", "republic of korea": "KR", "korea, republic of": "KR",
+    "democratic people's republic of korea": "KP",
+    "russian federation": "RU", "viet nam": "VN",
+    "iran, islamic republic of": "IR", "islamic republic of iran": "IR",
+    "syrian arab republic": "SY", "lao people's democratic republic": "LA",
+    "bolivia, plurinational state of": "BO", "venezuela, bolivarian republic of": "VE",
+    "tanzania, united republic of": "TZ", "united republic of tanzania": "TZ",
+    "moldova, republic of": "MD", "republic of moldova": "MD",
+    "czech republic": "CZ", "turkiye": "TR", "türkiye": "TR",
+    "ivory coast": "CI", "cote d'ivoire": "CI",
+    "macao": "MO", "hong kong sar": "HK", "macau sar": "MO",
+    "taiwan, province of china": "TW", "chinese taipei": "TW",
+    "state of palestine": "PS", "palestine, state of": "PS",
+    "holy see": "VA", "vatican": "VA", "brunei darussalam": "BN",
+    "cabo verde": "CV", "swaziland": "SZ", "burma": "MM",
+    "micronesia, federated states of": "FM", "macedonia": "MK",
+    "democratic republic of the congo": "CD", "congo, democratic republic of the": "CD", "drc": "CD",
+    "congo": "CG", "east timor": "TL", "the bahamas": "BS", "the gambia": "GM",
+}
+
+
+def _normalize(value: str) -> str:
+    return " ".join(value.replace(".", "").lower().split())
+
+
+COUNTRIES: Tuple[Country, ...] = tuple(Country(*row) for row in _ISO_COUNTRIES)
+BY_CODE: Mapping[str, Country] = MappingProxyType({country.code: country for country in COUNTRIES})
+
+
+def _build_lookup() -> Mapping[str, Country]:
+    lookup = {}
+    for country in COUNTRIES:
+        for key in (country.code, country.alpha3, country.name):
+            lookup[_normalize(key)] = country
+    for alias, code in _ALIASES.items():
+        lookup[_normalize(alias)] = BY_CODE[code]
+    return MappingProxyType(lookup)
+
+
+_LOOKUP = _build_lookup()
+
+
+def resolve_country(code_or_name: Optional[str]) -> Optional[Country]:
+    """
+    Country for an ISO code, name or known alias (case, dots and spacing ignored).
+
+    Returns:
+        Country, or None if unrecognized
+    """
+    if not code_or_name:
+        return None
+    return _LOOKUP.get(_normalize(code_or_name))
+
+
+def country_code(code_or_name: Optional[str]) -> Optional[str]:
+    """ISO 3166-1 alpha-2 code, or None if unrecognized."""
+    country = resolve_country(code_or_name)
+    return country.code if country else None
+
+
+def country_key(code_or_name: Optional[str]) -> str:
+    """
+    Canonical lookup key for a country: its ISO 3166-1 alpha-2 code.
+
+    Used both when materializing catalog rows and when filtering, so that
+    "IE", "ie", "IRL" and "Ireland" all resolve to the same indexed value.
+    Unrecognized values fall back to their lower-cased text.
+    """
+    value = (code_or_name or "").strip()
+    return country_code(value) or value.lower()
@@ -0,0 +1,113 @@
+"""
+Degree Level Classifier
+
+Maps free-text degree labels and program names to a standard degree level
+('bachelors', 'masters', 'diploma', 'phd' or 'unknown') with a confidence.
+
+- Text is split into word tokens which are looked up in one table: "ma", "ms",
+  "ba" and "bs" only match as whole tokens, never inside "Mathematics",
+  "Diploma" or "Business".
+- The degree label decides when it names a level; the program name is only a
+  fallback, with lower confidence.
+- Results are memoized on (degree text, program name); catalogs repeat a small
+  set of labels and names.
+
+Configuration (environment):
+    RECOMMENDATION_DEGREE_MEMO_SIZE   memoized (degree text, program name) pairs (default 8192)
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+# Precedence when one text names several levels (e.g. "MSc/PhD")
+LEVEL_PRECEDENCE = ("masters", "phd", "bachelors", "diploma")
+
+# token -> (level, full word?); abbreviations only ever match as whole tokens.
+# Dots and apostrophes are stripped first: "M.Sc." -> "msc", "Master's" -> "masters"
+_TOKEN_LEVELS = {
+    **{t: ("masters", True) for t in ("master", "masters")},
+    **{t: ("masters", False) for t in ("msc", "ma", "ms", "mba", "meng", "mtech", "mres", "mphil", "llm", "mfa", "mph", "mpa")},
+    **{t: ("phd", True) for t in ("doctorate", "doctoral")},
+    **{t: ("phd", False) for t in ("phd", "dphil", "edd")},
+    **{t: ("bachelors", True) for t in ("bachelor", "bachelors", "undergraduate")},
+    **{t: ("bachelors", False) for t in ("bsc", "ba", "bs", "bba", "beng", "btech", "bcom", "llb")},
+    **{t: ("diploma", True) for t in ("diploma", "certificate", "foundation")},
+    **{t: ("diploma", False) for t in ("pgdip", "pgcert")},
+}
+_PHRASE_LEVELS = [("doctor of philosophy", ("phd", True))]
+
+_STRIP = str.maketrans("", "", ".'’")
+_WORD = re.compile(r"[a-z]+")
+
+# Confidence by evidence: a full word in the degree label is certain
+CONFIDENCE_WORD = 1.0
+CONFIDENCE_ABBREVIATION = 0.9
+PROGRAM_NAME_FACTOR = 0.8     # level only found in the program name
+CONFLICT_FACTOR = 0.6         # several levels in the deciding text
+
+
+@dataclass(slots=True, frozen=True)
+class DegreeClassification:
+    level: str
+    confidence: float
+    # "degree_text", "program_name" or None when unknown
+    source: Optional[str] = None
+
+
+UNKNOWN = DegreeClassification("unknown", 0.0)
+
+
+@lru_cache(maxsize=1024)
+def _result(level: str, confidence: float, source: Optional[str]) -> DegreeClassification:
+    # A handful of distinct results; shared instead of rebuilt per program
+    return DegreeClassification(level, confidence, source)
+
+
+@lru_cache(maxsize=4096)
+def _scan(text: str) -> Tuple[Optional[str], float]:
+    """Level and confidence named by one text, or (None, 0.0); degree labels repeat, so memoized on their own."""
+    text = text.lower().translate(_STRIP)
+    found = {}
+    for token in _WORD.findall(text):
+        hit = _TOKEN_LEVELS.get(token)
+        if hit:
+            found[hit[0]] = found.get(hit[0], False) or hit[1]
+    for phrase, (level, full_word) in _PHRASE_LEVELS:
+        if phrase in text:
+            found[level] = found.get(level, False) or full_word
+    if not found:
+        return None, 0.0
+
+    level = next(level for level in LEVEL_PRECEDENCE if level in found)
+    confidence = CONFIDENCE_WORD if found[level] else CONFIDENCE_ABBREVIATION
+    if len(found) > 1:
+        confidence *= CONFLICT_FACTOR
+    return level, round(confidence, 4)
+
+
+@lru_cache(maxsize=int(os.getenv("RECOMMENDATION_DEGREE_MEMO_SIZE", "8192")))
+def classify_degree(degree_text: Optional[str], program_name: Optional[str] = None) -> DegreeClassification:
+    """
+    Classify a program's degree level.
+
+    Args:
+        degree_text: Raw degree level label (e.g. "Master's Degree")
+        program_name: Program name (e.g. "MSc Data Science"), used when the label
+            does not name a level
+
+    Returns:
+        DegreeClassification (level, confidence in [0, 1], source)
+    """
+    level, confidence = _scan(degree_text or "")
+    if level:
+        return _result(level, confidence, "degree_text")
+
+    level, confidence = _scan(program_name or "")
+    if level:
+        return _result(level, round(confidence * PROGRAM_NAME_FACTOR, 4), "program_name")
+
+    return UNKNOWN
@@ -0,0 +1,327 @@
+"""
+Domain Similarity Model
+
+Character n-gram TF-IDF vectors for the catalog's program domains and industry
+alignment tags, built offline (services.domain_model) and stored as one compact
+sparse matrix file. With the model, "Data Analyst" and "Data Analytics" are
+related even though neither contains the other, which the substring rules of
+the program-fit and career-alignment scorers miss.
+
+- Terms are lower-cased, split into words and padded with spaces; every 3..5
+  character n-gram is hashed (crc32, stable across processes) into a fixed
+  number of features and weighted tf * idf. Rows are L2-normalized, so a dot
+  product is a cosine similarity.
+- Per request, ProfileSimilarity multiplies the term matrix with the profile's
+  domain / goal vectors once: one sparse matrix - (terms x profile terms)
+  product gives the similarity of every catalog term, so the whole candidate
+  pool is served by row lookups. Terms missing from the model (added after the
+  last build) are vectorized on the fly.
+
+The model is optional: it is used only while the file exists (default
+recommendation_domain_model.npz in the working directory) and NumPy is
+installed; otherwise the scorers keep their substring rules alone.
+
+Configuration (environment):
+    RECOMMENDATION_DOMAIN_MODEL_PATH  model file (default recommendation_domain_model.npz)
+"""
+
+import math
+import os
+import re
+import threading
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional accelerator
+    np = None
+
+
+MODEL_FORMAT_VERSION = 1
+DEFAULT_N_FEATURES = 1 << 20
+NGRAM_RANGE = (3, 5)
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Sparse term vector: (hashed features, tf-idf weights), L2-normalized
+TermVector = Tuple[Tuple[int, ...], Tuple[float, ...]]
+
+
+def term_key(text: str) -> str:
+    """Model key of a term (lower-cased, stripped)."""
+    return text.lower().strip()
+
+
+def ngram_counts(text: str, n_features: int) -> Counter:
+    """Hashed character n-gram counts of a term (n-grams never span words)."""
+    min_n, max_n = NGRAM_RANGE
+    counts: Counter = Counter()
+    for word in _WORD.findall(text.lower()):
+        padded = f" {word} "
+        for n in range(min_n, max_n + 1):
+            if len(padded) <= n:
+                # Short words contribute themselves once
+                counts[zlib.crc32(padded.encode()) % n_features] += 1
+                break
+            for start in range(len(padded) - n + 1):
+                counts[zlib.crc32(padded[start:start + n].encode()) % n_features] += 1
+    return counts
+
+
+class DomainSimilarityModel:
+    """
+    TF-IDF term matrix (CSR) plus the idf table needed to vectorize new text.
+
+    Args:
+        terms: term keys, one per matrix row
+        indptr, indices, data: CSR arrays of the L2-normalized term vectors
+        idf_features, idf_values: idf of every feature seen while building (sorted)
+        unseen_idf: idf of features that never occurred in the build corpus
+        n_features: hash space size
+    """
+
+    def __init__(
+        self,
+        terms: Sequence[str],
+        indptr: "np.ndarray",
+        indices: "np.ndarray",
+        data: "np.ndarray",
+        idf_features: "np.ndarray",
+        idf_values: "np.ndarray",
+        unseen_idf: float,
+        n_features: int,
+    ):
+        if len(indptr) != len(terms) + 1 or len(indices) != len(data) or indptr[-1] != len(data):
+            raise ValueError("inconsistent term matrix")
+        self.terms = list(terms)
+        self.rows: Dict[str, int] = {term: row for row, term in enumerate(self.terms)}
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.idf: Dict[int, float] = dict(zip(idf_features.tolist(), idf_values.tolist()))
+        self.unseen_idf = unseen_idf
+        self.n_features = n_features
+        # Row of every stored entry, for the product's per-row sums
+        self._entry_rows = np.repeat(np.arange(len(self.terms)), np.diff(indptr))
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def vectorize(self, text: str) -> TermVector:
+        """Normalized tf-idf vector of any text (empty for text without n-grams)."""
+        weights = {
+            feature: count * self.idf.get(feature, self.unseen_idf)
+            for feature, count in ngram_counts(text, self.n_features).items()
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        if not norm:
+            return (), ()
+        return tuple(weights), tuple(w / norm for w in weights.values())
+
+    def similarities(self, vectors: Sequence[TermVector]) -> "np.ndarray":
+        """
+        Cosine similarity of every model term with every query vector.
+
+        Returns:
+            float32 array of shape (terms, queries)
+        """
+        table = np.zeros((len(self.terms), len(vectors)), dtype=np.float32)
+        query_features = np.unique(np.fromiter(
+            (f for features, _ in vectors for f in features), dtype=np.int64
+        ))
+        if not len(self.data) or not len(query_features):
+            return table
+
+        # Query weights as a (query features x queries) block
+        block = np.zeros((len(query_features), len(vectors)), dtype=np.float32)
+        for column, (features, weights) in enumerate(vectors):
+            if features:
+                block[np.searchsorted(query_features, features), column] = weights
+
+        # One pass over the stored entries: keep those whose feature occurs in any query
+        position = np.minimum(np.searchsorted(query_features, self.indices), len(query_features) - 1)
+        entries = np.flatnonzero(query_features[position] == self.indices)
+        products = self.data[entries, None] * block[position[entries]]
+        rows = self._entry_rows[entries]
+        for column in range(len(vectors)):
+            table[:, column] = np.bincount(rows, weights=products[:, column], minlength=len(self.terms))
+        return table
+
+    def save(self, path: str) -> None:
+        """Write the model as a compressed .npz (atomically replaces an existing file)."""
+        features = np.fromiter(self.idf.keys(), dtype=np.int32, count=len(self.idf))
+        values = np.fromiter(self.idf.values(), dtype=np.float32, count=len(self.idf))
+        order = np.argsort(features)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                format_version=np.int32(MODEL_FORMAT_VERSION),
+                n_features=np.int64(self.n_features),
+                terms=np.array(self.terms, dtype=str),
+                indptr=self.indptr.astype(np.int32),
+                indices=self.indices.astype(np.int32),
+                data=self.data.astype(np.float32),
+                idf_features=features[order],
+                idf_values=values[order],
+                unseen_idf=np.float32(self.unseen_idf),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "DomainSimilarityModel":
+        with np.load(path, allow_pickle=False) as f:
+            if int(f["format_version"]) != MODEL_FORMAT_VERSION:
+                raise ValueError(f"unsupported domain model format {int(f['format_version'])}")
+            return cls(
+                terms=f["terms"].tolist(),
+                indptr=f["indptr"],
+                indices=f["indices"],
+                data=f["data"],
+                idf_features=f["idf_features"],
+                idf_values=f["idf_values"],
+                unseen_idf=float(f["unseen_idf"]),
+                n_features=int(f["n_features"]),
+            )
+
+
+def build_model(
+    documents: Iterable[str],
+    terms: Iterable[str],
+    n_features: int = DEFAULT_N_FEATURES
+) -> DomainSimilarityModel:
+    """
+    Fit idf on a document corpus and vectorize the terms into the term matrix.
+
+    Args:
+        documents: one text per catalog program (name, domain, tags)
+        terms: domains / tags the scorers look up (deduplicated by term_key;
+            iterated after documents is exhausted)
+        n_features: hash space size
+    """
+    document_count = 0
+    document_frequency: Counter = Counter()
+    for document in documents:
+        document_count += 1
+        document_frequency.update(ngram_counts(document, n_features).keys())
+
+    # Smoothed idf, as if one extra document contained every feature once
+    idf_features = np.array(sorted(document_frequency), dtype=np.int32)
+    idf_values = np.array(
+        [math.log((1 + document_count) / (1 + document_frequency[f])) + 1 for f in idf_features.tolist()],
+        dtype=np.float32,
+    )
+    unseen_idf = math.log(1 + document_count) + 1
+
+    model = DomainSimilarityModel(
+        terms=[], indptr=np.zeros(1, dtype=np.int32),
+        indices=np.zeros(0, dtype=np.int32), data=np.zeros(0, dtype=np.float32),
+        idf_features=idf_features, idf_values=idf_values,
+        unseen_idf=unseen_idf, n_features=n_features,
+    )
+
+    keys: List[str] = []
+    indptr, indices, data = [0], [], []
+    for term in sorted({term_key(t) for t in terms}):
+        features, weights = model.vectorize(term)
+        if not features:
+            continue
+        keys.append(term)
+        indices.extend(features)
+        data.extend(weights)
+        indptr.append(len(indices))
+
+    return DomainSimilarityModel(
+        terms=keys,
+        indptr=np.array(indptr, dtype=np.int32),
+        indices=np.array(indices, dtype=np.int32),
+        data=np.array(data, dtype=np.float32),
+        idf_features=idf_features,
+        idf_values=idf_values,
+        unseen_idf=unseen_idf,
+        n_features=n_features,
+    )
+
+
+class ProfileSimilarity:
+    """
+    Similarities between one profile's domains / career goals and catalog terms.
+
+    The term table (one product over the whole model) is computed on first use.
+    """
+
+    def __init__(self, model: DomainSimilarityModel, domains: Sequence[str], goals: Sequence[str]):
+        self.model = model
+        self._domains = [model.vectorize(d) for d in domains]
+        self._goals = [model.vectorize(g) for g in goals]
+        self._table: Optional["np.ndarray"] = None
+
+    def domain(self, term: str) -> float:
+        """Best cosine similarity of a term with any preferred domain."""
+        similarities = self._row(term)[:len(self._domains)]
+        return max(similarities) if similarities else 0.0
+
+    def goals(self, term: str) -> List[float]:
+        """Cosine similarity of a term with each career goal (in profile order)."""
+        return self._row(term)[len(self._domains):]
+
+    def _row(self, term: str) -> List[float]:
+        row = self.model.rows.get(term_key(term))
+        if row is not None:
+            if self._table is None:
+                self._table = self.model.similarities(self._domains + self._goals)
+            return self._table[row].tolist()
+        features, weights = self.model.vectorize(term)
+        term_weights = dict(zip(features, weights))
+        return [
+            sum(w * term_weights.get(f, 0.0) for f, w in zip(*vector))
+            for vector in self._domains + self._goals
+        ]
+
+
+class DomainModelStore:
+    """Lazily loaded model file; reloaded when the file changes, None while it is missing."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._model: Optional[DomainSimilarityModel] = None
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[DomainSimilarityModel]:
+        if np is None:
+            return None
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            self._model = self._mtime = None
+            return None
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    self._load(mtime)
+        return self._model
+
+    def _load(self, mtime: float) -> None:
+        import logging
+        logger = logging.getLogger(__name__)
+        try:
+            self._model = DomainSimilarityModel.load(self.path)
+            logger.info(f"🧭 Domain similarity model loaded: {len(self._model)} terms from {self.path}")
+        except Exception as e:
+            self._model = None
+            logger.warning(f"⚠️ Domain similarity model {self.path} not loaded: {e}")
+        self._mtime = mtime
+
+    def profile_similarity(self, domains: Sequence[str], goals: Sequence[str]) -> Optional[ProfileSimilarity]:
+        """ProfileSimilarity for a profile's terms, or None without a model."""
+        model = self.get()
+        if model is None or not (domains or goals):
+            return None
+        return ProfileSimilarity(model, domains, goals)
+
+
+# Singleton instance
+domain_model = DomainModelStore(os.getenv("RECOMMENDATION_DOMAIN_MODEL_PATH", "recommendation_domain_model.npz"))
@@ -11,11 +11,11 @@ from sqlalchemy.orm import Session
 
 from .contracts import StudentProfile, RecommendationOutput, CandidateProgram
 from .candidate_generator import generate_candidates, generate_mock_candidates
-from .aggregator import batch_aggregate
+from .aggregator import batch_aggregate, batch_aggregate_anytime
 from .classifier import classify_all
 from .ranker import rank_candidates, apply_diversity_penalty, select_top_per_category, get_final_ranked_list
 from .output_assembler import assemble_output
-from .constants import FitCategory
+from .constants import FitCategory, ANYTIME_RESERVE_FRACTION
 
 
 class RecommendationEngine:
@@ -45,7 +45,8 @@ class RecommendationEngine:
         self,
         profile: StudentProfile,
         max_candidates: int = 200,
-        use_mock: bool = False
+        use_mock: bool = False,
+        time_budget_ms: Optional[float] = None
     ) -> RecommendationOutput:
         """
         Generate recommendations for a student profile.
@@ -54,6 +55,9 @@ class RecommendationEngine:
             profile: Student's profile and preferences
             max_candidates: Maximum candidates to evaluate
             use_mock: If True, use mock data instead of DB
+            time_budget_ms: Optional pipeline budget; scoring stops when it is
+                nearly spent and the output is marked partial (see
+                aggregator.batch_aggregate_anytime)
             
         Returns:
             RecommendationOutput with categorized recommendations
@@ -76,11 +80,16 @@ class RecommendationEngine:
                 warnings=["No programs found matching your criteria."],
             )
         
-        # Step 2 & 3: Score and aggregate
-        scored_candidates = batch_aggregate(profile, candidates)
-        
-        # Filter eligible only for further processing
-        eligible = [s for s in scored_candidates if s.is_eligible]
+        # Step 2 & 3: Score and aggregate (within the time budget, if any)
+        if time_budget_ms is None:
+            scored_candidates = batch_aggregate(profile, candidates)
+            scored = len(candidates)
+            
+            # Filter eligible only for further processing
+            eligible = [s for s in scored_candidates if s.is_eligible]
+        else:
+            deadline = start_time + time_budget_ms * (1 - ANYTIME_RESERVE_FRACTION) / 1000
+            eligible, _, scored = batch_aggregate_anytime(profile, candidates, len(candidates), deadline)
         
         # Step 4: Classify
         classified = classify_all(eligible)
@@ -106,12 +115,17 @@ class RecommendationEngine:
         
         output = assemble_output(
             profile=profile,
-            by_category=by_category,
             all_ranked=all_ranked,
-            total_evaluated=len(candidates),
+            total_evaluated=scored,
             total_eligible=len(eligible),
             processing_time_ms=round(processing_time, 2)
         )
+        if scored < len(candidates):
+            output.partial = True
+            output.coverage = round(scored / len(candidates), 4)
+            output.warnings.append(
+                f"Time budget reached: ranked the best {scored} of {len(candidates)} candidate programs."
+            )
         
         return output
     
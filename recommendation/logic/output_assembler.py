@@ -5,7 +5,7 @@ Transforms internal scoring data into the final RecommendationOutput contract.
 Generates improvement suggestions based on risk factors.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import uuid
 from datetime import date
 
@@ -18,15 +18,25 @@ from .contracts import (
     ProgramRecommendation,
     RecommendationOutput,
 )
+from .records import ScoredRecord
 from .constants import FitCategory
 
 
+def _as_contract(item):
+    """Pydantic contract for a compact record (contracts pass through unchanged)."""
+    to_contract = getattr(item, "to_contract", None)
+    return to_contract() if to_contract else item
+
+
 def assemble_recommendation(
-    scored: ScoredCandidate,
+    scored: Union[ScoredRecord, ScoredCandidate],
     global_rank: int
 ) -> ProgramRecommendation:
     """
-    Convert a ScoredCandidate into a ProgramRecommendation.
+    Convert a scored candidate into a ProgramRecommendation.
+    
+    This is the only place compact scoring records become pydantic models,
+    so only the returned top-K pay for validation.
     
     Args:
         scored: The scored candidate
@@ -38,7 +48,8 @@ def assemble_recommendation(
     candidate = scored.candidate
     
     # Convert dimension scores dict to list
-    dimension_scores_list = list(scored.dimension_scores.values())
+    dimension_scores_list = [_as_contract(score) for score in scored.dimension_scores.values()]
+    risk_factors = [_as_contract(risk) for risk in scored.risk_factors]
     
     # Generate improvement suggestions from risk factors
     suggestions = _generate_suggestions(scored.risk_factors)
@@ -69,7 +80,7 @@ def assemble_recommendation(
         confidence_level=confidence,
         
         # Risk & Explainability
-        risk_factors=scored.risk_factors,
+        risk_factors=risk_factors,
         improvement_suggestions=suggestions,
         
         # Additional Context
@@ -86,10 +97,11 @@ def assemble_recommendation(
 
 def assemble_output(
     profile: StudentProfile,
-    all_ranked: List[ScoredCandidate],
+    all_ranked: List[ScoredRecord],
     total_evaluated: int,
     total_eligible: int,
-    processing_time_ms: Optional[float] = None
+    processing_time_ms: Optional[float] = None,
+    candidates_by_country: Optional[Dict[str, int]] = None
 ) -> RecommendationOutput:
     """
     Assemble the final RecommendationOutput.
@@ -100,6 +112,7 @@ def assemble_output(
         total_evaluated: Total candidates evaluated
         total_eligible: Total eligible candidates
         processing_time_ms: Processing time in milliseconds
+        candidates_by_country: Candidate pool size per preferred country
         
     Returns:
         Complete RecommendationOutput
@@ -128,6 +141,7 @@ def assemble_output(
         total_candidates_evaluated=total_evaluated,
         total_eligible=total_eligible,
         total_recommended=len(all_recommendations),
+        candidates_by_country=candidates_by_country or {},
         
         processing_time_ms=processing_time_ms,
         engine_version="1.0.0",
@@ -137,7 +151,7 @@ def assemble_output(
 
 
 def _build_all_list(
-    all_ranked: List[ScoredCandidate]
+    all_ranked: List[ScoredRecord]
 ) -> List[ProgramRecommendation]:
     """Build complete ranked list of all recommendations."""
     recommendations = []
@@ -205,7 +219,7 @@ def _generate_suggestions(
     return suggestions
 
 
-def _calculate_confidence(scored: ScoredCandidate) -> float:
+def _calculate_confidence(scored: ScoredRecord) -> float:
     """Calculate confidence level for this recommendation."""
     base_confidence = 0.7
     
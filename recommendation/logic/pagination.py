@@ -0,0 +1,118 @@
+"""
+Ranked List Pagination
+
+Keeps the ranked and diversity-adjusted recommendation list of recent runs by
+request_id, so further pages are served with
+GET /recommendations/{request_id}?cursor=... without DB access or scoring.
+
+- A list covers every eligible program of the run's candidate pool (see
+  runner.score_run), not just the `limit` in the response: the response's items
+  are reused as they are and later ones are serialized when their page is read.
+
+- Entries are a snapshot: a catalog upsert does not drop them (unlike the result
+  cache), so a client paging through a list never sees it re-ranked mid-way.
+- Cursors are opaque (URL-safe base64 of request_id, offset and page size) and
+  only valid for the list they were issued for.
+- In-memory and per worker process, like the result cache.
+
+Configuration (environment):
+    RECOMMENDATION_PAGE_STORE_SIZE   ranked lists kept (default 200, 0 disables)
+    RECOMMENDATION_PAGE_TTL_SECONDS  list lifetime (default 1800)
+"""
+
+import base64
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .result_cache import ResultCache
+
+
+# Ranked lists are never invalidated by catalog version
+_SNAPSHOT_VERSION = 0
+
+
+@dataclass(slots=True)
+class RankedList:
+    """A run's full-format response and its whole ranked list."""
+    response: Dict[str, Any]
+    # Ranked ScoredRecords of the run (the response holds the first `limit`, serialized)
+    ranked: List[Any]
+
+
+def encode_cursor(request_id: str, offset: int, page_size: int) -> str:
+    raw = f"{request_id}:{offset}:{page_size}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(request_id: str, cursor: str) -> Tuple[int, int]:
+    """
+    Returns:
+        (offset, page_size)
+
+    Raises:
+        ValueError: malformed cursor, or a cursor issued for another request_id
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        cursor_request_id, offset, page_size = raw.rsplit(":", 2)
+        offset, page_size = int(offset), int(page_size)
+    except Exception:
+        raise ValueError("Malformed cursor")
+    if cursor_request_id != request_id or offset < 0 or page_size < 1:
+        raise ValueError("Cursor does not belong to this request_id")
+    return offset, page_size
+
+
+def save_ranked_list(response_data: Dict[str, Any], ranked: Optional[List[Any]] = None) -> None:
+    """
+    Keep a full-format response and the run's ranked records for paging
+    (no-op without a request_id). Without `ranked` only the response's items are paged.
+    """
+    request_id = response_data.get("request_id")
+    if request_id:
+        ranked_lists.set(request_id, RankedList(response_data, ranked or []), _SNAPSHOT_VERSION)
+
+
+def get_ranked_list(request_id: str) -> Optional[RankedList]:
+    return ranked_lists.get(request_id, _SNAPSHOT_VERSION)
+
+
+def page_of(
+    response_data: Dict[str, Any],
+    offset: int,
+    page_size: int,
+    ranked: Optional[List[Any]] = None,
+    serialize: Optional[Callable[[Any, int], Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Copy of a full-format response holding one page of recommendations.
+
+    Items past the response's own list are taken from `ranked` and converted
+    with serialize(record, rank).
+
+    Adds `page` (offset, page_size, total) and `next_cursor` (None on the last page).
+    """
+    recommendations = response_data["recommendations"]
+    ranked = ranked or []
+    total = max(len(recommendations), len(ranked))
+    end = offset + page_size
+    page = recommendations[offset:end] + [
+        serialize(ranked[i], i + 1) for i in range(max(offset, len(recommendations)), min(end, total))
+    ]
+    return {
+        **response_data,
+        "recommendations": page,
+        "page": {"offset": offset, "page_size": page_size, "total": total},
+        "next_cursor": (
+            encode_cursor(response_data["request_id"], end, page_size)
+            if end < total else None
+        ),
+    }
+
+
+# Singleton instance
+ranked_lists = ResultCache(
+    maxsize=int(os.getenv("RECOMMENDATION_PAGE_STORE_SIZE", "200")),
+    ttl_seconds=float(os.getenv("RECOMMENDATION_PAGE_TTL_SECONDS", "1800")),
+)
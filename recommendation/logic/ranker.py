@@ -6,7 +6,7 @@ Applies diversity rules to ensure varied recommendations.
 """
 
 from typing import List, Tuple, Dict
-from .contracts import ScoredCandidate
+from .records import ScoredRecord
 from .constants import (
     FitCategory,
     MAX_RECOMMENDATIONS_PER_CATEGORY,
@@ -16,8 +16,8 @@ from .constants import (
 
 
 def rank_candidates(
-    scored_candidates: List[ScoredCandidate]
-) -> List[ScoredCandidate]:
+    scored_candidates: List[ScoredRecord]
+) -> List[ScoredRecord]:
     """
     Rank candidates by overall score (descending).
     
@@ -35,8 +35,8 @@ def rank_candidates(
 
 
 def apply_diversity_penalty(
-    ranked: List[ScoredCandidate]
-) -> List[ScoredCandidate]:
+    ranked: List[ScoredRecord]
+) -> List[ScoredRecord]:
     """
     Apply penalty to reduce score for multiple programs from same university.
     This encourages diversity in recommendations.
@@ -59,7 +59,7 @@ def apply_diversity_penalty(
         adjusted_score = max(0.1, scored.overall_score - penalty)
         
         # Create new scored candidate with adjusted score
-        adjusted_scored = ScoredCandidate(
+        adjusted_scored = ScoredRecord(
             candidate=scored.candidate,
             dimension_scores=scored.dimension_scores,
             overall_score=adjusted_score,
@@ -75,9 +75,9 @@ def apply_diversity_penalty(
 
 
 def select_top_per_category(
-    classified: List[Tuple[ScoredCandidate, FitCategory]],
+    classified: List[Tuple[ScoredRecord, FitCategory]],
     max_per_category: int = MAX_RECOMMENDATIONS_PER_CATEGORY
-) -> Dict[FitCategory, List[ScoredCandidate]]:
+) -> Dict[FitCategory, List[ScoredRecord]]:
     """
     Select top N candidates per category.
     
@@ -88,7 +88,7 @@ def select_top_per_category(
     Returns:
         Dict mapping category to list of top candidates
     """
-    by_category: Dict[FitCategory, List[ScoredCandidate]] = {
+    by_category: Dict[FitCategory, List[ScoredRecord]] = {
         FitCategory.AMBITIOUS: [],
         FitCategory.TARGET: [],
         FitCategory.SAFE: [],
@@ -112,9 +112,9 @@ def select_top_per_category(
 
 
 def get_final_ranked_list(
-    by_category: Dict[FitCategory, List[ScoredCandidate]],
+    by_category: Dict[FitCategory, List[ScoredRecord]],
     max_total: int = MAX_TOTAL_RECOMMENDATIONS
-) -> List[ScoredCandidate]:
+) -> List[ScoredRecord]:
     """
     Create final ranked list from all categories.
     Interleaves categories to ensure diversity.
@@ -126,7 +126,7 @@ def get_final_ranked_list(
     Returns:
         Final ranked list
     """
-    final_list: List[ScoredCandidate] = []
+    final_list: List[ScoredRecord] = []
     
     # Collect all with original scores
     all_candidates = []
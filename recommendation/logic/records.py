@@ -0,0 +1,134 @@
+"""
+Compact Scoring Records
+
+Slotted dataclass counterparts of the pydantic contracts used on the scoring hot
+path (candidate -> dimension scores / risks -> scored candidate). They carry the
+same attribute names as CandidateProgram, DimensionScore, RiskFactor and
+ScoredCandidate, so scorers, the classifier and the ranker work with either.
+
+No validation or copying happens here. Conversion to the pydantic contracts is
+done once, in output_assembler, for the returned top-K only.
+"""
+
+from dataclasses import dataclass, field, fields
+from datetime import date
+from typing import Dict, List, Optional, Union
+
+from .contracts import CandidateProgram, DimensionScore, RiskFactor, ScoredCandidate
+
+
+@dataclass(slots=True)
+class CandidateRecord:
+    """Compact CandidateProgram (same fields and defaults)."""
+    # IDs
+    program_id: int
+    university_id: int
+    intake_id: Optional[int] = None
+
+    # University data
+    university_name: str = ""
+    country: str = ""
+    city: str = ""
+    global_reputation_band: str = "unknown"
+    institution_type: str = ""
+    logo_thumbnail_url: Optional[str] = None
+
+    # Program data
+    program_name: str = ""
+    degree_type: str = ""
+    program_domain: str = ""
+    tuition_fee_band: str = "unknown"
+    program_competitiveness_band: str = "unknown"
+    delivery_mode: str = ""
+    typical_duration_months: int = 0
+    background_preference_tags: List[str] = field(default_factory=list)
+    industry_alignment_tags: List[str] = field(default_factory=list)
+    internship_opportunities: str = ""
+
+    # Intake data
+    intake_term: str = ""
+    intake_year: int = 0
+    application_open_date: Optional[date] = None
+    application_close_date: Optional[date] = None
+    intake_status: str = ""
+
+    # Eligibility snapshot data
+    academic_score_band: str = "unknown"
+    language_score_band: str = "unknown"
+    background_match_level: str = "unknown"
+    work_experience_preference: str = "neutral"
+    gap_year_tolerance_level: str = "moderate"
+    historical_acceptance_strictness: str = "moderate"
+    competition_level_this_intake: str = "moderate"
+
+    # Degree match metadata (for 3-state degree handling)
+    degree_match_status: str = "unknown"
+
+    @classmethod
+    def from_contract(cls, candidate: CandidateProgram) -> "CandidateRecord":
+        return cls(**{name: getattr(candidate, name) for name in _CANDIDATE_FIELDS})
+
+    def to_contract(self) -> CandidateProgram:
+        return CandidateProgram(**{name: getattr(self, name) for name in _CANDIDATE_FIELDS})
+
+
+_CANDIDATE_FIELDS = tuple(f.name for f in fields(CandidateRecord))
+
+# Anything the scorers accept as a candidate
+Candidate = Union[CandidateRecord, CandidateProgram]
+
+
+@dataclass(slots=True)
+class DimensionRecord:
+    """Compact DimensionScore."""
+    dimension: str
+    score: float
+    weight: float
+    weighted_score: float
+    explanation: str = ""
+
+    def to_contract(self) -> DimensionScore:
+        return DimensionScore(
+            dimension=self.dimension,
+            score=self.score,
+            weight=self.weight,
+            weighted_score=self.weighted_score,
+            explanation=self.explanation,
+        )
+
+
+@dataclass(slots=True)
+class RiskRecord:
+    """Compact RiskFactor."""
+    factor: str
+    severity: str
+    description: str
+
+    def to_contract(self) -> RiskFactor:
+        return RiskFactor(factor=self.factor, severity=self.severity, description=self.description)
+
+
+@dataclass(slots=True)
+class ScoredRecord:
+    """Compact ScoredCandidate."""
+    candidate: Candidate
+    dimension_scores: Dict[str, DimensionRecord] = field(default_factory=dict)
+    overall_score: float = 0.0
+    is_eligible: bool = True
+    risk_factors: List[RiskRecord] = field(default_factory=list)
+
+    def with_score(self, overall_score: float) -> "ScoredRecord":
+        """Copy with a different overall score (shares candidate, dimensions and risks)."""
+        return ScoredRecord(self.candidate, self.dimension_scores, overall_score, self.is_eligible, self.risk_factors)
+
+    def to_contract(self) -> ScoredCandidate:
+        candidate = self.candidate
+        if isinstance(candidate, CandidateRecord):
+            candidate = candidate.to_contract()
+        return ScoredCandidate(
+            candidate=candidate,
+            dimension_scores={name: d.to_contract() for name, d in self.dimension_scores.items()},
+            overall_score=self.overall_score,
+            is_eligible=self.is_eligible,
+            risk_factors=[r.to_contract() for r in self.risk_factors],
+        )
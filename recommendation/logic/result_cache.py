@@ -0,0 +1,141 @@
+"""
+Recommendation Result Cache
+
+Bounded LRU + TTL cache for serialized recommendation responses.
+
+- Keyed by a canonical hash of the normalized StudentProfile plus limit/format,
+  so page refreshes and counsellor re-runs skip the pipeline entirely.
+- Tagged with the catalog version (see services.catalog_version); entries are
+  dropped as soon as programs or universities are upserted.
+- Hit/miss/eviction counters are exposed via GET /recommendations/cache/stats.
+
+Configuration (environment):
+    RECOMMENDATION_CACHE_SIZE         max entries (default 256, 0 disables)
+    RECOMMENDATION_CACHE_TTL_SECONDS  entry lifetime (default 300)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .contracts import StudentProfile
+
+
+# Free-text list fields the scorers compare case-insensitively and order-independently
+_CASE_INSENSITIVE_LIST_FIELDS = ("preferred_program_domains", "career_goals")
+
+
+def profile_cache_key(profile: StudentProfile, limit: int, format: str) -> str:
+    """
+    Canonical cache key for a recommendation request.
+
+    student_id is excluded (it does not affect scoring), and list fields that are
+    matched case-insensitively are case-folded and sorted so that equivalent
+    payloads share an entry.
+    """
+    data = profile.dict(exclude={"student_id"})
+    for field in _CASE_INSENSITIVE_LIST_FIELDS:
+        data[field] = sorted(value.strip().casefold() for value in data.get(field) or [])
+
+    payload = json.dumps({"profile": data, "limit": limit, "format": format}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with per-entry TTL and catalog-version invalidation.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def _sync_version(self, version: int) -> None:
+        # Caller holds the lock
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self._version = version
+
+    def get(self, key: str, version: int) -> Optional[Any]:
+        """Return the cached value for key, or None on miss / expiry / stale catalog."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            self._sync_version(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, version: int) -> None:
+        """Store value for key, evicting the least recently used entries when full."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._sync_version(version)
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "catalog_version": self._version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+# Singleton instance
+result_cache = ResultCache(
+    maxsize=int(os.getenv("RECOMMENDATION_CACHE_SIZE", "256")),
+    ttl_seconds=float(os.getenv("RECOMMENDATION_CACHE_TTL_SECONDS", "300")),
+)
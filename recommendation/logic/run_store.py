@@ -0,0 +1,78 @@
+"""
+Recommendation Run Store
+
+Keeps the inputs of recent recommendation runs by request_id (profile, limit,
+candidate pool) so follow-up requests - what-if re-scoring - can reuse them
+instead of re-running the pipeline. The per-dimension scorer results of a run
+are kept from scoring (attached on first use for time-budgeted runs) and reused
+by every what-if on that run.
+
+Bounded (oldest runs are evicted first) and in-memory, so a run is visible only
+to the worker process that produced it.
+
+Configuration (environment):
+    RECOMMENDATION_RUN_STORE_SIZE  runs kept per process (default 200, 0 disables)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .contracts import StudentProfile
+from .records import CandidateRecord, ScoredRecord
+
+
+@dataclass(slots=True)
+class ScoringRun:
+    """Everything needed to re-score a finished run."""
+    request_id: str
+    profile: StudentProfile
+    limit: int
+    normalized_programs: List[Dict[str, Any]]
+    candidates: List[CandidateRecord]
+    # Per candidate: dimension -> (DimensionRecord, risks); None until first needed (time-budgeted runs)
+    dimension_results: Optional[List[Dict[str, Any]]] = None
+    # Ranked, diversity-adjusted eligible records of the whole pool (the output holds the first `limit`)
+    ranked: Optional[List[ScoredRecord]] = None
+
+
+class RunStore:
+    """Thread-safe, bounded map of request_id -> ScoringRun."""
+
+    def __init__(self, maxsize: int = 200):
+        self.maxsize = maxsize
+        self._runs: "OrderedDict[str, ScoringRun]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def save(self, run: ScoringRun) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._runs[run.request_id] = run
+            self._runs.move_to_end(run.request_id)
+            while len(self._runs) > self.maxsize:
+                self._runs.popitem(last=False)
+
+    def get(self, request_id: str) -> Optional[ScoringRun]:
+        with self._lock:
+            run = self._runs.get(request_id)
+            if run is not None:
+                self._runs.move_to_end(request_id)
+            return run
+
+    def clear(self) -> None:
+        with self._lock:
+            self._runs.clear()
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+
+# Singleton instance
+run_store = RunStore(maxsize=int(os.getenv("RECOMMENDATION_RUN_STORE_SIZE", "200")))
@@ -10,20 +10,25 @@ Orchestrates the recommendation pipeline:
 This is a pure orchestration layer - NO scoring, NO DB queries, NO business logic.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
 
-from .adapter import fetch_and_transform_programs, fetch_single_program
-from .contracts import StudentProfile, RecommendationOutput, CandidateProgram
+from .adapter import fetch_and_transform_programs, fetch_single_program, country_key
+from .contracts import StudentProfile, RecommendationOutput
+from .records import CandidateRecord
+from .timing import PipelineTimer
+from .run_store import ScoringRun, run_store
 from .engine import RecommendationEngine
-from .constants import FitCategory
+from .constants import FitCategory, CANDIDATE_POOL_SIZE
 
 
-def _adapter_to_candidate(normalized: Dict[str, Any]) -> CandidateProgram:
+def _adapter_to_candidate(normalized: Dict[str, Any]) -> CandidateRecord:
     """
-    Convert adapter output to CandidateProgram for engine input.
+    Convert adapter output to a CandidateRecord for engine input.
     
-    Maps normalized dict fields to CandidateProgram fields.
+    Maps normalized dict fields to CandidateProgram fields. The adapter has
+    already normalized the values, so the compact record skips pydantic
+    validation.
     """
     # Map conversion signal to academic band
     signal_to_band = {
@@ -77,7 +82,7 @@ def _adapter_to_candidate(normalized: Dict[str, Any]) -> CandidateProgram:
         else:
             reputation_band = "unranked"
     
-    return CandidateProgram(
+    return CandidateRecord(
         program_id=int(normalized.get("program_id") or 0),
         university_id=int(normalized.get("university_id") or 0),
         intake_id=None,
@@ -126,39 +131,171 @@ def _adapter_to_candidate(normalized: Dict[str, Any]) -> CandidateProgram:
     )
 
 
-def run_recommendations(
+def _count_by_country(
+    preferred_countries: List[str],
+    normalized_programs: List[Dict[str, Any]]
+) -> Dict[str, int]:
+    """
+    Candidate pool size per preferred country, keyed by the country as the student wrote it.
+    """
+    counts: Dict[str, int] = {}
+    for program in normalized_programs:
+        key = country_key(program.get("country"))
+        counts[key] = counts.get(key, 0) + 1
+    
+    by_country: Dict[str, int] = {}
+    seen = set()
+    for country in preferred_countries:
+        key = country_key(country)
+        if key and key not in seen:
+            seen.add(key)
+            by_country[country] = counts.get(key, 0)
+    return by_country
+
+
+def candidate_pool_key(profile: StudentProfile) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """
+    Hard filters that determine a profile's candidate pool.
+    
+    Profiles with the same key get exactly the same programs from
+    fetch_candidates, so the pool can be fetched once and shared.
+    """
+    keys = []
+    for country in profile.preferred_countries:
+        key = country_key(country)
+        if key and key not in keys:
+            keys.append(key)
+    return profile.target_degree_level, tuple(keys)
+
+
+def fetch_candidates(
     db: Session,
     profile: StudentProfile,
-    limit: int = 100
-) -> RecommendationOutput:
+    limit: int = 100,
+    timer: Optional[PipelineTimer] = None
+) -> Tuple[List[Dict[str, Any]], List[CandidateRecord]]:
     """
-    Main entry point: run full recommendation pipeline.
+    Pipeline stage 1: fetch the candidate pool for a profile's hard filters.
+    
+    The pool holds up to max(limit, CANDIDATE_POOL_SIZE) programs, so a run ranks
+    more eligible programs than it returns and cursor pages can go past `limit`.
     
     Args:
         db: Database session
-        profile: Student profile with preferences
-        limit: Max programs to evaluate
+        profile: Student profile (only the hard filters are used)
+        limit: Max recommendations to return
+        timer: Optional PipelineTimer for per-stage timings
     
     Returns:
-        RecommendationOutput with ranked recommendations
+        (normalized program dicts, converted CandidateRecords)
     """
     import logging
     logger = logging.getLogger(__name__)
+    timer = timer or PipelineTimer()
     
-    logger.info(f"🚀 Starting recommendation pipeline for student: {profile.student_id or 'anonymous'}")
-    logger.info(f"🎯 Target degree level: {profile.target_degree_level}")
-    logger.info(f"🌍 Preferred countries: {profile.preferred_countries}")
-    
-    # Step 1: Fetch programs via adapter with HARD FILTERS
-    # Use optimized fetch limit - adapter now does SQL-level filtering
-    fetch_limit = min(100, limit)  # Reduced since adapter filters at SQL level now
+    # Fetch programs via adapter with HARD FILTERS
+    fetch_limit = max(limit, CANDIDATE_POOL_SIZE)
     
     normalized_programs = fetch_and_transform_programs(
         db=db,
         limit=fetch_limit,
-        country_filter=profile.preferred_countries[0] if profile.preferred_countries else None,
-        target_degree_level=profile.target_degree_level  # HARD FILTER: Degree level
+        country_filter=profile.preferred_countries or None,  # All preferred countries, one query
+        target_degree_level=profile.target_degree_level,  # HARD FILTER: Degree level
+        timer=timer
+    )
+    
+    # Convert to compact candidate records
+    candidates = []
+    with timer.stage("candidate_convert", items=len(normalized_programs)):
+        for normalized in normalized_programs:
+            try:
+                candidate = _adapter_to_candidate(normalized)
+                candidates.append(candidate)
+            except Exception as e:
+                # Skip programs that fail conversion
+                logger.debug(f"Failed to convert program {normalized.get('program_id')}: {e}")
+                continue
+    
+    if candidates:
+        logger.info(f"📦 Candidates converted for scoring: {len(candidates)}")
+    
+    return normalized_programs, candidates
+
+
+def score_candidates(
+    profile: StudentProfile,
+    normalized_programs: List[Dict[str, Any]],
+    candidates: List[CandidateRecord],
+    limit: int = 100,
+    timer: Optional[PipelineTimer] = None,
+    deadline: Optional[float] = None
+) -> RecommendationOutput:
+    """
+    Pipeline stage 2: score, rank and assemble a fetched candidate pool.
+    
+    Needs no DB access, so a pool from fetch_candidates can be scored for any
+    number of profiles that share its hard filters.
+    
+    Args:
+        profile: Student profile with preferences
+        normalized_programs: Normalized program dicts from fetch_candidates
+        candidates: CandidateRecords from fetch_candidates
+        limit: Max recommendations to return
+        timer: Optional PipelineTimer for per-stage timings
+        deadline: Optional time.perf_counter() value to stop scoring at; the
+            output is then marked partial with the scored share as coverage
+    
+    Returns:
+        RecommendationOutput with ranked recommendations
+    """
+    output, _, _ = _score_pool(profile, normalized_programs, candidates, limit, timer, deadline, keep_run=False)
+    return output
+
+
+def score_run(
+    profile: StudentProfile,
+    normalized_programs: List[Dict[str, Any]],
+    candidates: List[CandidateRecord],
+    limit: int = 100,
+    timer: Optional[PipelineTimer] = None,
+    deadline: Optional[float] = None
+) -> Tuple[RecommendationOutput, ScoringRun]:
+    """
+    score_candidates for a run that is kept in the run store.
+    
+    Every candidate is scored per dimension (no columnar top-K shortcut). The
+    returned ScoringRun keeps the scorer results, so the first what-if on the run
+    recomputes only the dimensions it changes, and the ranked list of every
+    eligible candidate, which cursor pages beyond `limit` are served from.
+    Time-budgeted scoring keeps no scorer results; what-if computes them on
+    first use.
+    
+    Returns:
+        (RecommendationOutput, ScoringRun to save under its request_id)
+    """
+    output, results, ranked = _score_pool(profile, normalized_programs, candidates, limit, timer, deadline, keep_run=True)
+    run = ScoringRun(
+        output.request_id, profile, limit, normalized_programs, candidates,
+        dimension_results=results, ranked=ranked,
     )
+    return output, run
+
+
+def _score_pool(
+    profile: StudentProfile,
+    normalized_programs: List[Dict[str, Any]],
+    candidates: List[CandidateRecord],
+    limit: int,
+    timer: Optional[PipelineTimer],
+    deadline: Optional[float],
+    keep_run: bool
+) -> Tuple[RecommendationOutput, Optional[List[Dict[str, Any]]], List[Any]]:
+    """Shared body of score_candidates / score_run: (output, per-dimension results or None, ranked records)."""
+    import logging
+    logger = logging.getLogger(__name__)
+    timer = timer or PipelineTimer()
+    
+    candidates_by_country = _count_by_country(profile.preferred_countries, normalized_programs)
     
     if not normalized_programs:
         logger.warning(f"⚠️ No programs found matching criteria")
@@ -167,19 +304,9 @@ def run_recommendations(
             total_candidates_evaluated=0,
             total_eligible=0,
             total_recommended=0,
+            candidates_by_country=candidates_by_country,
             warnings=["No programs found matching criteria."],
-        )
-    
-    # Step 2: Convert to CandidateProgram format
-    candidates = []
-    for normalized in normalized_programs:
-        try:
-            candidate = _adapter_to_candidate(normalized)
-            candidates.append(candidate)
-        except Exception as e:
-            # Skip programs that fail conversion
-            logger.debug(f"Failed to convert program {normalized.get('program_id')}: {e}")
-            continue
+        ), None, []
     
     if not candidates:
         logger.warning(f"⚠️ Failed to process any programs")
@@ -188,38 +315,90 @@ def run_recommendations(
             total_candidates_evaluated=len(normalized_programs),
             total_eligible=0,
             total_recommended=0,
+            candidates_by_country=candidates_by_country,
             warnings=["Failed to process any programs."],
-        )
-    
-    logger.info(f"📦 Candidates converted for scoring: {len(candidates)}")
-    
-    # Step 3: Run engine with candidates
-    engine = RecommendationEngine(db=None)  # Engine doesn't need DB - we provide candidates
+        ), None, []
     
     # Use engine's internal pipeline with our candidates
-    from .aggregator import batch_aggregate
-    from .ranker import rank_candidates, apply_diversity_penalty, get_final_ranked_list
-    from .output_assembler import assemble_output
+    from .aggregator import batch_aggregate_top_k, batch_aggregate_anytime, batch_aggregate_dimensions
     import time
     
     start_time = time.perf_counter()
+    results = None
     
-    # Score all candidates
+    # Score all candidates (or as many as the deadline allows), keeping only the
+    # eligible ones that can reach the final list (a kept run ranks all of them)
     logger.info(f"🎲 Scoring candidates...")
-    scored_candidates = batch_aggregate(profile, candidates)
-    logger.info(f"📊 Candidates scored: {len(scored_candidates)}")
+    with timer.stage("scoring", items=len(candidates)):
+        if deadline is not None:
+            top_k = len(candidates) if keep_run else limit
+            eligible, total_eligible, scored = batch_aggregate_anytime(profile, candidates, top_k, deadline)
+        elif keep_run:
+            records, results = batch_aggregate_dimensions(profile, candidates)
+            eligible = [s for s in records if s.is_eligible]
+            total_eligible, scored = len(eligible), len(candidates)
+        else:
+            eligible, total_eligible = batch_aggregate_top_k(profile, candidates, top_k=limit)
+            scored = len(candidates)
+    logger.info(f"📊 Candidates scored: {scored}")
     
-    # Filter eligible
-    eligible = [s for s in scored_candidates if s.is_eligible]
-    logger.info(f"✅ Eligible candidates: {len(eligible)}")
+    output, ranked = rank_and_assemble(
+        profile, eligible, total_eligible, scored, limit,
+        candidates_by_country, timer, start_time
+    )
+    if scored < len(candidates):
+        logger.warning(f"⏱️ Time budget reached: scored {scored} of {len(candidates)} candidates")
+        output.partial = True
+        output.coverage = round(scored / len(candidates), 4)
+        output.warnings.append(
+            f"Time budget reached: ranked the best {scored} of {len(candidates)} candidate programs."
+        )
+    return output, results, ranked
+
+
+def rank_and_assemble(
+    profile: StudentProfile,
+    eligible: List[Any],
+    total_eligible: int,
+    total_evaluated: int,
+    limit: int,
+    candidates_by_country: Dict[str, int],
+    timer: PipelineTimer,
+    start_time: float
+) -> Tuple[RecommendationOutput, List[Any]]:
+    """
+    Pipeline stage 3: rank scored eligible candidates, apply the diversity
+    penalty and assemble the top `limit` into a RecommendationOutput.
     
-    if len(eligible) < 5:
-        logger.warning(f"⚠️ Low eligible count: {len(eligible)} (expected > 5)")
+    Args:
+        profile: Student profile
+        eligible: Eligible ScoredRecords (at least every one that can reach the top `limit`)
+        total_eligible: Eligible count over the whole pool
+        total_evaluated: Candidate pool size
+        limit: Max recommendations to return
+        candidates_by_country: Pool size per preferred country
+        timer: PipelineTimer for per-stage timings
+        start_time: time.perf_counter() when scoring started
+    
+    Returns:
+        (RecommendationOutput with the top `limit`, all of `eligible` in rank order)
+    """
+    import logging
+    import time
+    from .ranker import rank_candidates, apply_diversity_penalty
+    from .output_assembler import assemble_output
+    logger = logging.getLogger(__name__)
+    
+    logger.info(f"✅ Eligible candidates: {total_eligible}")
+    
+    if total_eligible < 5:
+        logger.warning(f"⚠️ Low eligible count: {total_eligible} (expected > 5)")
     
     # Rank
     logger.info(f"📈 Ranking candidates...")
-    ranked = rank_candidates(eligible)
-    ranked = apply_diversity_penalty(ranked)
+    with timer.stage("diversity", items=len(eligible)):
+        ranked = rank_candidates(eligible)
+        ranked = apply_diversity_penalty(ranked)
     logger.info(f"🏆 Candidates ranked: {len(ranked)}")
     
     # Final ranked list (take top N based on original limit)
@@ -230,16 +409,67 @@ def run_recommendations(
     processing_time = (time.perf_counter() - start_time) * 1000
     
     # Assemble output
-    output = assemble_output(
-        profile=profile,
-        all_ranked=all_ranked,
-        total_evaluated=len(candidates),
-        total_eligible=len(eligible),
-        processing_time_ms=round(processing_time, 2)
-    )
+    with timer.stage("assembly", items=len(all_ranked)):
+        output = assemble_output(
+            profile=profile,
+            all_ranked=all_ranked,
+            total_evaluated=total_evaluated,
+            total_eligible=total_eligible,
+            processing_time_ms=round(processing_time, 2),
+            candidates_by_country=candidates_by_country
+        )
     
     logger.info(f"✨ Recommendation pipeline complete ({processing_time:.2f}ms)")
     
+    return output, ranked
+
+
+def run_recommendations(
+    db: Session,
+    profile: StudentProfile,
+    limit: int = 100,
+    timer: Optional[PipelineTimer] = None,
+    time_budget_ms: Optional[float] = None
+) -> RecommendationOutput:
+    """
+    Main entry point: run full recommendation pipeline.
+    
+    Args:
+        db: Database session
+        profile: Student profile with preferences
+        limit: Max recommendations to return
+        timer: Optional PipelineTimer for per-stage timings
+        time_budget_ms: Optional budget for the whole pipeline ("anytime" mode).
+            Scoring stops when it is nearly spent (ANYTIME_RESERVE_FRACTION is
+            kept for ranking and assembly) and the best of the scored candidates
+            are returned with partial=True and the scored share as coverage.
+    
+    Returns:
+        RecommendationOutput with ranked recommendations
+    """
+    import logging
+    import time
+    from .constants import ANYTIME_RESERVE_FRACTION
+    logger = logging.getLogger(__name__)
+    
+    deadline = None
+    if time_budget_ms is not None:
+        deadline = time.perf_counter() + time_budget_ms * (1 - ANYTIME_RESERVE_FRACTION) / 1000
+    
+    logger.info(f"🚀 Starting recommendation pipeline for student: {profile.student_id or 'anonymous'}")
+    logger.info(f"🎯 Target degree level: {profile.target_degree_level}")
+    logger.info(f"🌍 Preferred countries: {profile.preferred_countries}")
+    
+    # Step 1: Fetch + convert candidates (HARD FILTERS)
+    normalized_programs, candidates = fetch_candidates(db, profile, limit, timer)
+    
+    # Step 2: Score, rank and assemble
+    output, run = score_run(profile, normalized_programs, candidates, limit, timer, deadline)
+    
+    # Keep the pool, its dimension scores and ranked list for what-if re-scoring
+    # (POST /recommendations/{request_id}/what-if) and cursor pagination
+    if output.request_id:
+        run_store.save(run)
     return output
 
 
@@ -254,7 +484,7 @@ def run_recommendations_from_dict(
     Args:
         db: Database session
         profile_data: Dict matching StudentProfile fields
-        limit: Max programs to evaluate
+        limit: Max recommendations to return
     
     Returns:
         RecommendationOutput
@@ -266,15 +496,22 @@ def run_recommendations_from_dict(
 def get_recommendations_simple(
     db: Session,
     profile: StudentProfile,
-    limit: int = 100
+    limit: int = 100,
+    timer: Optional[PipelineTimer] = None
 ) -> List[Dict[str, Any]]:
     """
     Simplified output format for easier consumption.
     
     Returns list of dicts instead of full RecommendationOutput.
     """
-    output = run_recommendations(db, profile, limit)
-    
+    timer = timer or PipelineTimer()
+    output = run_recommendations(db, profile, limit, timer)
+    with timer.stage("serialization", items=len(output.all_recommendations)):
+        return simplify_output(output)
+
+
+def simplify_output(output: RecommendationOutput) -> List[Dict[str, Any]]:
+    """Convert a RecommendationOutput to the simplified list-of-dicts format."""
     results = []
     for rec in output.all_recommendations:
         results.append({
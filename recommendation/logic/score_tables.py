@@ -0,0 +1,364 @@
+"""
+Score Tables
+
+Dense lookup tables for the band-driven dimensions: academic_fit, eligibility,
+affordability and career_alignment.
+
+Every input of these scorers is a band from constants.py, or a count that
+saturates (gap years, matched career goal / tag pairs), so each dimension
+result is a pure function of a small tuple of codes. For every combination of
+the profile-side codes the tables hold one cell per combination of the
+candidate-side codes:
+
+    (score, weighted score, explanation, risk bitmask)
+
+compile_profile resolves the profile side once per request; a scorer then maps
+the candidate's bands to codes (memoized per raw string) and indexes the slice.
+Profile-side slices are enumerated on first use.
+
+The cell functions below are the only scalar implementation of these formulas
+(columnar.py mirrors them with arrays). Tables carry a fingerprint of the band
+maps, DEFAULT_SCORE and DIMENSION_WEIGHTS; score_tables.get() rebuilds them
+when any of those change.
+"""
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import constants
+from .records import Candidate, RiskRecord
+
+
+# Scorer defaults for bands missing from their map (besides DEFAULT_SCORE)
+GAP_TOLERANCE_DEFAULT = 0.7
+COMPETITION_DEFAULT = 0.5
+
+# Gap years at which a strict tolerance becomes a high risk
+EXCESSIVE_GAP_YEARS = 3
+
+# (score, weighted score, explanation, risk bitmask)
+Cell = Tuple[float, float, str, int]
+
+# Risk factors of the tabled dimensions; bits are listed in the order the scorers report them
+RISK_UNCERTAIN_DEGREE_MATCH = 1 << 0
+RISK_GPA_BELOW_MINIMUM = 1 << 1
+RISK_BORDERLINE_GPA = 1 << 2
+RISK_LANGUAGE_BELOW_REQUIREMENT = 1 << 3
+RISK_BORDERLINE_LANGUAGE = 1 << 4
+RISK_NO_WORK_EXPERIENCE = 1 << 5
+RISK_LIMITED_WORK_EXPERIENCE = 1 << 6
+RISK_EXCESSIVE_GAP_YEARS = 1 << 7
+
+# bit -> (factor, severity, description template)
+RISK_FACTORS: Tuple[Tuple[int, str, str, str], ...] = (
+    (RISK_UNCERTAIN_DEGREE_MATCH, "uncertain_degree_match", "low",
+     "Program degree information is unclear - included with penalty"),
+    (RISK_GPA_BELOW_MINIMUM, "gpa_below_minimum", "high",
+     "Academic score ({student_academic}) below program requirement ({program_academic})"),
+    (RISK_BORDERLINE_GPA, "borderline_gpa", "moderate",
+     "Academic score is borderline for this program"),
+    (RISK_LANGUAGE_BELOW_REQUIREMENT, "language_below_requirement", "high",
+     "Language score ({student_language}) below requirement ({program_language})"),
+    (RISK_BORDERLINE_LANGUAGE, "borderline_language", "moderate",
+     "Language score is borderline for this program"),
+    (RISK_NO_WORK_EXPERIENCE, "no_work_experience_required", "high",
+     "Program requires work experience but student has minimal/none"),
+    (RISK_LIMITED_WORK_EXPERIENCE, "limited_work_experience", "moderate",
+     "Program prefers work experience"),
+    (RISK_EXCESSIVE_GAP_YEARS, "excessive_gap_years", "high",
+     "{gap_years} gap years with strict tolerance"),
+)
+
+
+# =============================================================================
+# CELL FUNCTIONS
+# =============================================================================
+
+def academic_cell(
+    student_academic: float,
+    student_language: float,
+    program_academic: float,
+    program_language: float,
+    degree_unknown: bool,
+    weight: float
+) -> Cell:
+    # How well the student meets the requirements, capped at 1.0
+    academic_match = min(1.0, student_academic / max(program_academic, 0.1))
+    language_match = min(1.0, student_language / max(program_language, 0.1))
+
+    # Academic 60%, language 40%; unknown degree data is penalized
+    # ("match" and "mismatch" remain at 1.0, mismatches are filtered in the adapter)
+    raw_score = (academic_match * 0.6) + (language_match * 0.4)
+    raw_score = raw_score * (0.7 if degree_unknown else 1.0)
+
+    risks = RISK_UNCERTAIN_DEGREE_MATCH if degree_unknown else 0
+    if student_academic < program_academic - 0.2:
+        risks |= RISK_GPA_BELOW_MINIMUM
+    elif student_academic < program_academic:
+        risks |= RISK_BORDERLINE_GPA
+    if student_language < program_language - 0.2:
+        risks |= RISK_LANGUAGE_BELOW_REQUIREMENT
+    elif student_language < program_language:
+        risks |= RISK_BORDERLINE_LANGUAGE
+
+    explanation = f"Academic match: {academic_match:.2f}, Language match: {language_match:.2f}"
+    return raw_score, raw_score * weight, explanation, risks
+
+
+def gap_penalty(gap_years: int, gap_tolerance: float) -> float:
+    if gap_years <= 0:
+        return 0.0
+    return min(gap_years * (1.0 - gap_tolerance) * 0.1, 0.3)
+
+
+def eligibility_cell(
+    student_work_exp: float,
+    gap_years: int,
+    background_score: float,
+    work_preference: Optional[str],
+    gap_tolerance: float,
+    competition_score: float,
+    weight: float
+) -> Cell:
+    risks = 0
+    if work_preference == "required":
+        work_exp_match = student_work_exp
+        if student_work_exp < 0.4:
+            risks |= RISK_NO_WORK_EXPERIENCE
+    elif work_preference == "preferred":
+        work_exp_match = 0.5 + (student_work_exp * 0.5)  # Boost but not required
+        if student_work_exp < 0.4:
+            risks |= RISK_LIMITED_WORK_EXPERIENCE
+    else:
+        work_exp_match = 0.8  # Not a factor
+
+    if gap_years >= EXCESSIVE_GAP_YEARS and gap_tolerance < 0.5:
+        risks |= RISK_EXCESSIVE_GAP_YEARS
+    gap_score = max(0.2, 1.0 - gap_penalty(gap_years, gap_tolerance))
+
+    raw_score = (
+        background_score * 0.35 +
+        work_exp_match * 0.25 +
+        gap_score * 0.15 +
+        competition_score * 0.25
+    )
+    explanation = (
+        f"Background: {background_score:.2f}, Work exp: {work_exp_match:.2f}, "
+        f"Gap: {gap_score:.2f}, Competition: {competition_score:.2f}"
+    )
+    return raw_score, raw_score * weight, explanation, risks
+
+
+def affordability_cell(student_budget: Optional[float], program_tuition: float, weight: float) -> Cell:
+    """Explanation is the budget fit only; the scorer prefixes the program's tuition band."""
+    if student_budget is None:
+        raw_score = 0.7  # No budget preference - neutral
+    elif program_tuition >= student_budget:
+        raw_score = 1.0  # Higher tuition score = cheaper: within or below budget
+    else:
+        raw_score = max(0.2, program_tuition / student_budget)
+    return raw_score, raw_score * weight, f"Budget fit: {raw_score:.2f}", 0
+
+
+def industry_match(matches: int) -> float:
+    """Industry alignment from matching (career goal, tag) pairs (0 = none or no goals/tags)."""
+    return min(1.0, 0.5 + (matches * 0.2))
+
+
+def career_cell(reputation_score: float, matches: int, weight: float) -> Cell:
+    industry = industry_match(matches)
+    raw_score = (reputation_score * 0.4) + (industry * 0.6)
+    explanation = f"Reputation: {reputation_score:.2f}, Industry match: {industry:.2f}"
+    return raw_score, raw_score * weight, explanation, 0
+
+
+# =============================================================================
+# TABLES
+# =============================================================================
+
+class BandAxis:
+    """Codes of one band map: index of the lower-cased band, len(keys) = not in the map."""
+
+    def __init__(self, band_map: Dict[str, float], default: float):
+        self.keys = tuple(band_map)
+        self.values = tuple(band_map.values()) + (default,)
+        self.size = len(self.values)
+        self._index = {key: code for code, key in enumerate(self.keys)}
+        # Raw (not yet lower-cased) band -> code
+        self._codes: Dict[str, int] = {}
+
+    def code(self, band: str) -> int:
+        code = self._codes.get(band)
+        if code is None:
+            code = self._codes[band] = self._index.get(band.lower(), len(self.keys))
+        return code
+
+
+def _saturation(fn, start: int, limit: int = 1000) -> int:
+    """Smallest n >= start from which fn(n) no longer changes (fn is monotone and capped)."""
+    n = start
+    while fn(n) != fn(n + 1):
+        n += 1
+        if n > limit:
+            raise ValueError("score table axis does not saturate")
+    return n
+
+
+def constants_fingerprint() -> int:
+    """Hash of every constant the tables are derived from."""
+    return hash((
+        tuple(constants.ACADEMIC_SCORE_BAND_MAP.items()),
+        tuple(constants.LANGUAGE_SCORE_BAND_MAP.items()),
+        tuple(constants.BACKGROUND_MATCH_LEVEL_MAP.items()),
+        tuple(constants.WORK_EXPERIENCE_YEARS_MAP.items()),
+        tuple(constants.GAP_YEAR_TOLERANCE_MAP.items()),
+        tuple(constants.COMPETITION_LEVEL_MAP.items()),
+        tuple(constants.REPUTATION_BAND_MAP.items()),
+        tuple(constants.TUITION_FEE_BAND_MAP.items()),
+        tuple(constants.DIMENSION_WEIGHTS.items()),
+        constants.DEFAULT_SCORE,
+    ))
+
+
+class ScoreTables:
+    """
+    Lookup tables for one set of constants.
+
+    Profile-side slices are flat tuples of cells, indexed with the candidate-side
+    codes in row-major order (see the *_cell methods).
+    """
+
+    def __init__(self, fingerprint: int):
+        self.fingerprint = fingerprint
+        self.weights = dict(constants.DIMENSION_WEIGHTS)
+
+        self.academic = BandAxis(constants.ACADEMIC_SCORE_BAND_MAP, constants.DEFAULT_SCORE)
+        self.language = BandAxis(constants.LANGUAGE_SCORE_BAND_MAP, constants.DEFAULT_SCORE)
+        self.background = BandAxis(constants.BACKGROUND_MATCH_LEVEL_MAP, constants.DEFAULT_SCORE)
+        self.work_experience = BandAxis(constants.WORK_EXPERIENCE_YEARS_MAP, constants.DEFAULT_SCORE)
+        # Only "required" / "preferred" change the work experience score
+        self.work_preference = BandAxis({"required": 0.0, "preferred": 0.0}, 0.0)
+        self.gap_tolerance = BandAxis(constants.GAP_YEAR_TOLERANCE_MAP, GAP_TOLERANCE_DEFAULT)
+        self.competition = BandAxis(constants.COMPETITION_LEVEL_MAP, COMPETITION_DEFAULT)
+        self.reputation = BandAxis(constants.REPUTATION_BAND_MAP, constants.DEFAULT_SCORE)
+        self.tuition = BandAxis(constants.TUITION_FEE_BAND_MAP, constants.DEFAULT_SCORE)
+
+        # Counts beyond these give the same cells as the cap itself
+        self.gap_years_cap = _saturation(
+            lambda years: tuple(gap_penalty(years, t) for t in self.gap_tolerance.values),
+            start=EXCESSIVE_GAP_YEARS,
+        )
+        self.career_matches_cap = _saturation(industry_match, start=0)
+
+        weight = self.weights["career_alignment"]
+        self.career: Tuple[Cell, ...] = tuple(
+            career_cell(reputation, matches, weight)
+            for reputation in self.reputation.values
+            for matches in range(self.career_matches_cap + 1)
+        )
+
+        self._academic: Dict[Tuple[int, int], Tuple[Cell, ...]] = {}
+        self._eligibility: Dict[Tuple[int, int], Tuple[Cell, ...]] = {}
+        self._affordability: Dict[Optional[int], Tuple[Cell, ...]] = {}
+
+    # --- Profile-side slices (built on first use) ---------------------------
+
+    def academic_slice(self, academic_band: str, language_band: str) -> Tuple[Cell, ...]:
+        key = (self.academic.code(academic_band), self.language.code(language_band))
+        cells = self._academic.get(key)
+        if cells is None:
+            student_academic, student_language = self.academic.values[key[0]], self.language.values[key[1]]
+            weight = self.weights["academic_fit"]
+            cells = self._academic.setdefault(key, tuple(
+                academic_cell(student_academic, student_language, program_academic, program_language,
+                              degree_unknown, weight)
+                for program_academic in self.academic.values
+                for program_language in self.language.values
+                for degree_unknown in (False, True)
+            ))
+        return cells
+
+    def eligibility_slice(self, work_experience_band: str, gap_years: int) -> Tuple[Cell, ...]:
+        key = (self.work_experience.code(work_experience_band), max(0, min(gap_years, self.gap_years_cap)))
+        cells = self._eligibility.get(key)
+        if cells is None:
+            student_work_exp = self.work_experience.values[key[0]]
+            preferences: Sequence[Optional[str]] = self.work_preference.keys + (None,)
+            weight = self.weights["eligibility"]
+            cells = self._eligibility.setdefault(key, tuple(
+                eligibility_cell(student_work_exp, key[1], background, preference, tolerance, competition, weight)
+                for background in self.background.values
+                for preference in preferences
+                for tolerance in self.gap_tolerance.values
+                for competition in self.competition.values
+            ))
+        return cells
+
+    def affordability_slice(self, budget_band: Optional[str]) -> Tuple[Cell, ...]:
+        """budget_band None = no budget preference."""
+        key = None if budget_band is None else self.tuition.code(budget_band)
+        cells = self._affordability.get(key)
+        if cells is None:
+            budget = None if key is None else self.tuition.values[key]
+            weight = self.weights["affordability"]
+            cells = self._affordability.setdefault(key, tuple(
+                affordability_cell(budget, tuition, weight) for tuition in self.tuition.values
+            ))
+        return cells
+
+    # --- Candidate-side lookups ---------------------------------------------
+
+    def academic_cell(self, cells: Tuple[Cell, ...], candidate: Candidate) -> Cell:
+        return cells[
+            (self.academic.code(candidate.academic_score_band) * self.language.size
+             + self.language.code(candidate.language_score_band)) * 2
+            + (candidate.degree_match_status == "unknown")
+        ]
+
+    def eligibility_cell(self, cells: Tuple[Cell, ...], candidate: Candidate) -> Cell:
+        return cells[
+            ((self.background.code(candidate.background_match_level) * self.work_preference.size
+              + self.work_preference.code(candidate.work_experience_preference)) * self.gap_tolerance.size
+             + self.gap_tolerance.code(candidate.gap_year_tolerance_level)) * self.competition.size
+            + self.competition.code(candidate.competition_level_this_intake)
+        ]
+
+    def affordability_cell(self, cells: Tuple[Cell, ...], candidate: Candidate) -> Cell:
+        return cells[self.tuition.code(candidate.tuition_fee_band)]
+
+    def career_cell(self, candidate: Candidate, matches: int) -> Cell:
+        return self.career[
+            self.reputation.code(candidate.global_reputation_band) * (self.career_matches_cap + 1)
+            + min(matches, self.career_matches_cap)
+        ]
+
+
+def risk_records(risks: int, **fields) -> List[RiskRecord]:
+    """RiskRecords for a risk bitmask; fields fill the description templates."""
+    return [
+        RiskRecord(factor=factor, severity=severity, description=description.format(**fields))
+        for bit, factor, severity, description in RISK_FACTORS
+        if risks & bit
+    ]
+
+
+class ScoreTableCache:
+    """The tables for the current constants (rebuilt when the fingerprint changes)."""
+
+    def __init__(self):
+        self._tables: Optional[ScoreTables] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> ScoreTables:
+        fingerprint = constants_fingerprint()
+        tables = self._tables
+        if tables is None or tables.fingerprint != fingerprint:
+            with self._lock:
+                tables = self._tables
+                if tables is None or tables.fingerprint != fingerprint:
+                    tables = self._tables = ScoreTables(fingerprint)
+        return tables
+
+
+# Singleton instance
+score_tables = ScoreTableCache()
@@ -0,0 +1,289 @@
+"""
+Materialized Segment Recommendations
+
+Most of a StudentProfile is categorical (degree level, countries, bands,
+tuition band), so the same few hundred combinations - segments - account for
+most requests. The store precomputes the ranked results of the most requested
+segments so cold requests for them skip the pipeline:
+
+- A profile's segment is its SEGMENT_FIELDS (everything the pool or the
+  band-driven scorers read); LIVE_FIELDS (free-text background, domains,
+  career goals) and unscored fields are left out of the key.
+- Every POST /recommendations is counted under its (segment, limit) - the
+  request log. refresh() materializes the top RECOMMENDATION_SEGMENT_TOP_N
+  segments: candidate pool, per-dimension results and the serialized
+  responses, tagged with the catalog version.
+- A profile with no live fields is served the stored response as-is. With live
+  fields, only the dimensions that read them are rescored on the stored run
+  (what_if.run_what_if), so the DB fetch and the band scorers are skipped.
+- When the catalog version changes, stored segments are no longer served and
+  the next request schedules a refresh (routes run it as a background task).
+
+In-memory and per worker process, like the result cache.
+
+Configuration (environment):
+    RECOMMENDATION_SEGMENT_TOP_N            segments materialized (default 50, 0 disables)
+    RECOMMENDATION_SEGMENT_MIN_REQUESTS     requests before a segment is materialized (default 3)
+    RECOMMENDATION_SEGMENT_REFRESH_SECONDS  min interval between refreshes for newly popular
+                                            segments (default 60; catalog changes refresh at once)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .contracts import StudentProfile, RecommendationOutput
+from .run_store import ScoringRun
+
+
+# Profile fields that make up a segment: the hard filters plus every field read by a band-driven scorer
+SEGMENT_FIELDS = (
+    "target_degree_level",
+    "preferred_countries",
+    "academic_score_band",
+    "language_score_band",
+    "work_experience_years",
+    "gap_years",
+    "tuition_preference_band",
+    "internship_importance",
+)
+
+# Free-text fields rescored per request on top of a materialized segment
+LIVE_FIELDS = ("background_field", "preferred_program_domains", "career_goals")
+
+_DEFAULT_PROFILE = StudentProfile()
+
+
+def segment_profile(profile: StudentProfile) -> StudentProfile:
+    """The segment's representative profile: segment fields kept, everything else default."""
+    return StudentProfile(**{name: getattr(profile, name) for name in SEGMENT_FIELDS})
+
+
+def segment_key(profile: StudentProfile, limit: int) -> str:
+    """Stable key of a profile's segment for a given limit."""
+    data = {name: getattr(profile, name) for name in SEGMENT_FIELDS}
+    payload = json.dumps({"segment": data, "limit": limit}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+
+def live_fields(profile: StudentProfile) -> List[str]:
+    """LIVE_FIELDS the profile sets (an empty list means the segment response fits as-is)."""
+    return [name for name in LIVE_FIELDS if getattr(profile, name) != getattr(_DEFAULT_PROFILE, name)]
+
+
+def live_delta(profile: StudentProfile) -> Dict[str, Any]:
+    """Profile fields outside the segment, as a what-if delta on the segment's run."""
+    return profile.dict(exclude=set(SEGMENT_FIELDS))
+
+
+@dataclass(slots=True)
+class Segment:
+    """A materialized segment: the scored run plus its serialized responses."""
+    key: str
+    version: int
+    run: ScoringRun
+    full: Dict[str, Any]
+    simple: List[Dict[str, Any]]
+
+
+class SegmentStore:
+    """
+    Request counts per segment and the materialized top segments.
+
+    Thread-safe; refresh() runs at most once at a time.
+    """
+
+    def __init__(
+        self,
+        top_n: int = 50,
+        min_requests: int = 3,
+        refresh_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.top_n = top_n
+        self.min_requests = min_requests
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._requests: Counter = Counter()
+        self._profiles: Dict[str, Tuple[StudentProfile, int]] = {}
+        self._segments: Dict[str, Segment] = {}
+        self._version: Optional[int] = None
+        self._refreshed_at: Optional[float] = None
+        self._pending = False
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+        self.hits = 0
+        self.rescored = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.top_n > 0
+
+    def record(self, profile: StudentProfile, limit: int) -> str:
+        """Count a request for the profile's segment; returns the segment key."""
+        key = segment_key(profile, limit)
+        with self._lock:
+            self._requests[key] += 1
+            if key not in self._profiles:
+                self._profiles[key] = (segment_profile(profile), limit)
+            # Keep the request log bounded: drop the long tail
+            if len(self._requests) > self.top_n * 20:
+                kept = dict(self._requests.most_common(self.top_n * 10))
+                self._requests = Counter(kept)
+                self._profiles = {k: v for k, v in self._profiles.items() if k in kept}
+        return key
+
+    def get(self, key: str, version: int) -> Optional[Segment]:
+        """The materialized segment, or None if it is not stored for this catalog version."""
+        with self._lock:
+            segment = self._segments.get(key) if version == self._version else None
+            if segment is None:
+                self.misses += 1
+            return segment
+
+    def count_hit(self, rescored: bool) -> None:
+        with self._lock:
+            if rescored:
+                self.rescored += 1
+            else:
+                self.hits += 1
+
+    def claim_refresh(self, version: int) -> bool:
+        """
+        True if the caller should schedule refresh(): the catalog changed, or a
+        popular segment is not materialized yet and the refresh interval passed.
+        Only one refresh is claimed at a time.
+        """
+        if not self.enabled:
+            return False
+        with self._lock:
+            if self._pending:
+                return False
+            if version == self._version:
+                missing = any(key not in self._segments for key in self._top_keys())
+                if not missing or (
+                    self._refreshed_at is not None
+                    and self._clock() - self._refreshed_at < self.refresh_seconds
+                ):
+                    return False
+            elif not self._top_keys():
+                return False
+            self._pending = True
+            return True
+
+    def _top_keys(self) -> List[str]:
+        # Caller holds the lock
+        return [
+            key for key, count in self._requests.most_common(self.top_n)
+            if count >= self.min_requests
+        ]
+
+    def refresh(self, bind: Any, serialize: Callable[[RecommendationOutput], Dict[str, Any]]) -> int:
+        """
+        Materialize the top segments for the current catalog version.
+
+        Segments already stored for this version are kept; segments that left
+        the top N are dropped.
+
+        Args:
+            bind: Engine (or connection) to open the job's own session on
+            serialize: RecommendationOutput -> full-format response dict
+
+        Returns:
+            Number of segments computed
+        """
+        import logging
+        from sqlalchemy.orm import Session
+        from ..services.catalog_version import get_catalog_version
+        logger = logging.getLogger(__name__)
+
+        computed = 0
+        try:
+            with self._refresh_lock, Session(bind=bind) as db:
+                version = get_catalog_version(db)
+                with self._lock:
+                    targets = [(key, *self._profiles[key]) for key in self._top_keys()]
+                    current = dict(self._segments) if version == self._version else {}
+
+                started = time.perf_counter()
+                segments = {}
+                for key, profile, limit in targets:
+                    segment = current.get(key)
+                    if segment is None:
+                        try:
+                            segment = _materialize(db, key, version, profile, limit, serialize)
+                        except Exception as e:
+                            logger.warning(f"⚠️ Segment {key} not materialized: {e}")
+                            continue
+                        computed += 1
+                    segments[key] = segment
+
+                with self._lock:
+                    self._segments = segments
+                    self._version = version
+                    self._refreshed_at = self._clock()
+                    self.refreshes += 1
+                logger.info(
+                    f"🧊 Segments refreshed for catalog v{version}: {len(segments)} stored, "
+                    f"{computed} computed in {(time.perf_counter() - started) * 1000:.0f}ms"
+                )
+        finally:
+            with self._lock:
+                self._pending = False
+        return computed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._profiles.clear()
+            self._segments.clear()
+            self._version = None
+            self._refreshed_at = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "top_n": self.top_n,
+                "min_requests": self.min_requests,
+                "tracked": len(self._requests),
+                "materialized": len(self._segments),
+                "catalog_version": self._version,
+                "hits": self.hits,
+                "rescored": self.rescored,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+            }
+
+
+def _materialize(
+    db: Any,
+    key: str,
+    version: int,
+    profile: StudentProfile,
+    limit: int,
+    serialize: Callable[[RecommendationOutput], Dict[str, Any]]
+) -> Segment:
+    """Run the pipeline for a segment profile and keep everything a hit needs."""
+    from .runner import fetch_candidates, score_run, simplify_output
+
+    normalized_programs, candidates = fetch_candidates(db, profile, limit)
+    # The run keeps its per-dimension results, so live-field rescoring only pays for its dimensions
+    output, run = score_run(profile, normalized_programs, candidates, limit)
+    return Segment(key, version, run, serialize(output), simplify_output(output))
+
+
+# Singleton instance
+segment_store = SegmentStore(
+    top_n=int(os.getenv("RECOMMENDATION_SEGMENT_TOP_N", "50")),
+    min_requests=int(os.getenv("RECOMMENDATION_SEGMENT_MIN_REQUESTS", "3")),
+    refresh_seconds=float(os.getenv("RECOMMENDATION_SEGMENT_REFRESH_SECONDS", "60")),
+)
@@ -0,0 +1,182 @@
+"""
+Tag Index
+
+Interned vocabulary of the free-text catalog terms the program-fit and
+career-alignment scorers match against (program domains, industry alignment
+tags, background preference tags).
+
+- TagVocabulary (process-wide): every distinct tag string is lower-cased,
+  stripped and split into words once, and gets an integer id; every distinct
+  tag list is interned as a tuple of ids. Catalogs repeat a small vocabulary
+  across many programs, so this happens once per value, not per candidate.
+- TagMatcher (per request, built by compile_profile): relates the profile's
+  terms to tag ids and memoizes the result per distinct domain / tag list.
+  Per-tag goal matches are bitmasks over the career goals, so "goals matched
+  by any tag" and "matching (goal, tag) pairs" are an OR and a popcount.
+
+Matching keeps the scorers' substring semantics: a term matches a tag when
+either one contains the other (after lower-casing and stripping). With a
+domain similarity model (domain_similarity.py), sufficiently similar domains
+and goal / tag pairs match as well.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from .constants import CAREER_SIMILARITY_THRESHOLD, DOMAIN_SIMILARITY_MAX_SCORE, DOMAIN_SIMILARITY_THRESHOLD
+
+if TYPE_CHECKING:
+    from .domain_similarity import ProfileSimilarity
+
+
+def _keys_overlap(key1: str, key2: str) -> bool:
+    """Substring either way, on terms that are already lower-cased and stripped."""
+    return key1 in key2 or key2 in key1
+
+
+class TagVocabulary:
+    """Process-wide interned tag strings and tag lists (append-only, thread-safe)."""
+
+    def __init__(self):
+        # tag id -> normalized forms
+        self.lowered: List[str] = []
+        self.keys: List[str] = []
+        self.words: List[FrozenSet[str]] = []
+
+        self._tag_ids: Dict[str, int] = {}
+        self._tag_sets: Dict[Tuple[str, ...], Tuple[int, ...]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def tag_id(self, tag: str) -> int:
+        tag_id = self._tag_ids.get(tag)
+        if tag_id is None:
+            with self._lock:
+                tag_id = self._tag_ids.get(tag)
+                if tag_id is None:
+                    lowered = tag.lower()
+                    self.lowered.append(lowered)
+                    self.keys.append(lowered.strip())
+                    self.words.append(frozenset(lowered.split()))
+                    # Published last: readers only index the lists with ids from the dict
+                    tag_id = self._tag_ids[tag] = len(self.keys) - 1
+        return tag_id
+
+    def tag_set(self, tags: Sequence[str]) -> Tuple[int, ...]:
+        """Tag ids of a tag list (interned per distinct list)."""
+        key = tuple(tags)
+        ids = self._tag_sets.get(key)
+        if ids is None:
+            ids = self._tag_sets.setdefault(key, tuple(self.tag_id(tag) for tag in key))
+        return ids
+
+
+class TagMatcher:
+    """
+    Profile terms matched against a TagVocabulary, memoized per tag / tag list.
+
+    Args:
+        domains: (lower-cased, lower-cased + stripped) preferred program domains
+        career_goals: lower-cased + stripped career goals
+        background_key: lower-cased + stripped background field (None = not set)
+        background_words: words of the lower-cased background field
+        similarity: the profile's domains / goals in the domain similarity model (None = no model)
+    """
+
+    def __init__(
+        self,
+        domains: Tuple[Tuple[str, str], ...],
+        career_goals: Tuple[str, ...],
+        background_key: Optional[str],
+        background_words: FrozenSet[str],
+        vocabulary: Optional[TagVocabulary] = None,
+        similarity: Optional["ProfileSimilarity"] = None,
+    ):
+        self.vocabulary = vocabulary if vocabulary is not None else tag_vocabulary
+        self.domains = domains
+        self.career_goals = career_goals
+        self.background_key = background_key
+        self.background_words = background_words
+        self.similarity = similarity
+
+        # Results by raw value: a hit costs one dict lookup, the vocabulary is only consulted on a miss
+        self._domain_scores: Dict[str, float] = {}
+        self._career_counts: Dict[Tuple[str, ...], Tuple[int, int]] = {}
+        self._background_fits: Dict[Tuple[str, ...], float] = {}
+        self._goal_masks: Dict[int, int] = {}
+
+    def domain_match(self, program_domain: str) -> float:
+        """
+        1.0 if a preferred domain is contained in the program domain, 0.7 on overlap,
+        up to DOMAIN_SIMILARITY_MAX_SCORE for similar domains, else 0.5.
+        """
+        score = self._domain_scores.get(program_domain)
+        if score is None:
+            tag_id = self.vocabulary.tag_id(program_domain)
+            lowered, key = self.vocabulary.lowered[tag_id], self.vocabulary.keys[tag_id]
+            score = 0.5
+            for domain, domain_key in self.domains:
+                if domain in lowered:
+                    score = 1.0
+                    break
+                elif _keys_overlap(domain_key, key):
+                    score = 0.7
+            if score < 1.0 and self.similarity is not None:
+                similarity = self.similarity.domain(key)
+                if similarity >= DOMAIN_SIMILARITY_THRESHOLD:
+                    score = max(score, 0.5 + (DOMAIN_SIMILARITY_MAX_SCORE - 0.5) * similarity)
+            self._domain_scores[program_domain] = score
+        return score
+
+    def career_counts(self, tags: Sequence[str]) -> Tuple[int, int]:
+        """
+        Returns:
+            (career goals matched by at least one tag, matching (goal, tag) pairs)
+        """
+        key = tuple(tags)
+        counts = self._career_counts.get(key)
+        if counts is None:
+            matched = pairs = 0
+            for tag_id in self.vocabulary.tag_set(key):
+                mask = self._goal_mask(tag_id)
+                matched |= mask
+                pairs += mask.bit_count()
+            counts = self._career_counts[key] = (matched.bit_count(), pairs)
+        return counts
+
+    def background_fit(self, tags: Sequence[str]) -> float:
+        """1.0 if a tag overlaps the background field, 0.7 if they share a word, else 0.5."""
+        key = tuple(tags)
+        fit = self._background_fits.get(key)
+        if fit is None:
+            fit = 0.5
+            for tag_id in self.vocabulary.tag_set(key):
+                if _keys_overlap(self.background_key, self.vocabulary.keys[tag_id]):
+                    fit = 1.0
+                    break
+                elif not self.background_words.isdisjoint(self.vocabulary.words[tag_id]):
+                    fit = 0.7
+            self._background_fits[key] = fit
+        return fit
+
+    def _goal_mask(self, tag_id: int) -> int:
+        """Bit i set if career goal i overlaps (or is similar to) the tag."""
+        mask = self._goal_masks.get(tag_id)
+        if mask is None:
+            key = self.vocabulary.keys[tag_id]
+            mask = 0
+            for bit, goal in enumerate(self.career_goals):
+                if _keys_overlap(goal, key):
+                    mask |= 1 << bit
+            if self.similarity is not None:
+                for bit, similarity in enumerate(self.similarity.goals(key)):
+                    if similarity >= CAREER_SIMILARITY_THRESHOLD:
+                        mask |= 1 << bit
+            self._goal_masks[tag_id] = mask
+        return mask
+
+
+# Singleton instance (grows with the catalog's distinct tags and tag lists)
+tag_vocabulary = TagVocabulary()
@@ -0,0 +1,186 @@
+"""
+Pipeline Timing
+
+Per-stage wall time and item counts for one recommendation request
+(PipelineTimer), aggregated across requests into fixed-bucket latency
+histograms (PipelineMetrics).
+
+Stages, in pipeline order:
+    cache_lookup       result cache lookup (incl. catalog version read)
+    sql_fetch          candidate query in fetch_and_transform_programs
+    transform          feature row -> normalized program dict
+    degree_filter      3-state degree match annotation
+    candidate_convert  _adapter_to_candidate
+    scoring            dimension scoring + eligibility (batch_aggregate_top_k)
+    diversity          ranking + same-university penalty
+    assembly           output_assembler (pydantic conversion of the top-K)
+    serialization      response dict building
+    explainer          LLM explanation call (background, metrics only)
+
+The per-request breakdown is returned in `summary.timings` when requested;
+the histograms are served by GET /recommendations/metrics.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+STAGES = (
+    "cache_lookup",
+    "sql_fetch",
+    "transform",
+    "degree_filter",
+    "candidate_convert",
+    "scoring",
+    "diversity",
+    "assembly",
+    "serialization",
+    "explainer",
+)
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +inf)
+LATENCY_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PipelineTimer:
+    """
+    Collects stage timings for a single request.
+
+    Repeated stages accumulate (e.g. one sql_fetch per candidate pool).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._created = clock()
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    @contextmanager
+    def stage(self, name: str, items: Optional[int] = None) -> Iterator["PipelineTimer"]:
+        """Time the enclosed block as stage `name`."""
+        start = self._clock()
+        try:
+            yield self
+        finally:
+            self.record(name, (self._clock() - start) * 1000, items)
+
+    def record(self, name: str, ms: float, items: Optional[int] = None) -> None:
+        entry = self.stages.setdefault(name, {"ms": 0.0, "items": None})
+        entry["ms"] += ms
+        if items is not None:
+            self.count(name, items)
+
+    def count(self, name: str, items: int) -> None:
+        """Add to the item count of a stage."""
+        entry = self.stages.setdefault(name, {"ms": 0.0, "items": None})
+        entry["items"] = (entry["items"] or 0) + items
+
+    @property
+    def total_ms(self) -> float:
+        return (self._clock() - self._created) * 1000
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-ready breakdown for summary.timings (stages in pipeline order)."""
+        order = {name: i for i, name in enumerate(STAGES)}
+        stages = {
+            name: {"ms": round(entry["ms"], 3), "items": entry["items"]}
+            for name, entry in sorted(self.stages.items(), key=lambda kv: order.get(kv[0], len(STAGES)))
+        }
+        return {"stages": stages, "total_ms": round(self.total_ms, 3)}
+
+
+class StageHistogram:
+    """Cumulative latency histogram for one stage. Not thread-safe on its own."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self.items = 0
+
+    def observe(self, ms: float, items: Optional[int] = None) -> None:
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        if items:
+            self.items += items
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max_ms
+                estimate = lower + (upper - lower) * (rank - cumulative) / bucket_count
+                return min(estimate, self.max_ms)
+            cumulative += bucket_count
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {f"le_{bound:g}": n for bound, n in zip(self.buckets, self.counts)}
+        buckets["le_inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "mean_ms": round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.quantile(0.50), 3),
+            "p95_ms": round(self.quantile(0.95), 3),
+            "p99_ms": round(self.quantile(0.99), 3),
+            "items": self.items,
+            "buckets": buckets,
+        }
+
+
+class PipelineMetrics:
+    """Thread-safe registry of per-stage (and whole-request) histograms."""
+
+    def __init__(self):
+        self._stages: Dict[str, StageHistogram] = {}
+        self._requests = StageHistogram()
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, ms: float, items: Optional[int] = None) -> None:
+        with self._lock:
+            self._stages.setdefault(stage, StageHistogram()).observe(ms, items)
+
+    def observe_timer(self, timer: PipelineTimer) -> None:
+        """Fold a finished request's stages into the histograms."""
+        total_ms = timer.total_ms
+        with self._lock:
+            for name, entry in timer.stages.items():
+                self._stages.setdefault(name, StageHistogram()).observe(entry["ms"], entry["items"])
+            self._requests.observe(total_ms)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._requests = StageHistogram()
+
+    def snapshot(self) -> Dict[str, Any]:
+        order = {name: i for i, name in enumerate(STAGES)}
+        with self._lock:
+            return {
+                "requests": self._requests.snapshot(),
+                "stages": {
+                    name: histogram.snapshot()
+                    for name, histogram in sorted(self._stages.items(), key=lambda kv: order.get(kv[0], len(STAGES)))
+                },
+            }
+
+
+# Singleton instance
+pipeline_metrics = PipelineMetrics()
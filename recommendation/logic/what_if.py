@@ -0,0 +1,158 @@
+"""
+What-If Re-Scoring
+
+Re-scores a stored run (see run_store) for a profile delta such as
+{"language_score_band": "good"} without re-running the pipeline:
+
+- The candidate pool of the original run is reused as-is.
+- Only the dimensions whose scorers read a changed field are recomputed; the
+  other DimensionRecords (and their risk factors) are reused.
+- Scores are re-aggregated, re-ranked and assembled as usual.
+
+Changing a hard filter (degree level, preferred countries) changes the pool,
+so those deltas fall back to a full fetch + score.
+
+Every what-if result is stored as a new run, so deltas can be chained.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .contracts import StudentProfile, RecommendationOutput
+from .aggregator import SCORERS, score_dimensions, combine_dimensions
+from .dimension_scorers import compile_profile
+from .run_store import ScoringRun, run_store
+from .runner import fetch_candidates, score_run, rank_and_assemble, _count_by_country
+from .timing import PipelineTimer
+
+
+# Profile fields that select the candidate pool
+HARD_FILTER_FIELDS = frozenset({"target_degree_level", "preferred_countries"})
+
+# Profile field -> dimensions whose scorer reads it (keep in sync with dimension_scorers.py)
+FIELD_DIMENSIONS: Dict[str, frozenset] = {
+    "academic_score_band": frozenset({"academic_fit"}),
+    "language_score_band": frozenset({"academic_fit"}),
+    "work_experience_years": frozenset({"eligibility"}),
+    "gap_years": frozenset({"eligibility"}),
+    "background_field": frozenset({"program_fit"}),
+    "preferred_program_domains": frozenset({"program_fit"}),
+    "internship_importance": frozenset({"program_fit"}),
+    "career_goals": frozenset({"program_fit", "career_alignment"}),
+    "tuition_preference_band": frozenset({"affordability"}),
+    "preferred_countries": frozenset({"location_preference"}),
+    # Not read by any scorer
+    "student_id": frozenset(),
+    "current_degree_level": frozenset(),
+    "target_degree_level": frozenset(),
+    "has_research_experience": frozenset(),
+    "graduation_year": frozenset(),
+    "max_tuition_budget_usd": frozenset(),
+    "target_intake_year": frozenset(),
+    "target_intake_term": frozenset(),
+    "preferred_class_size": frozenset(),
+}
+
+
+def apply_delta(profile: StudentProfile, delta: Dict[str, Any]) -> Tuple[StudentProfile, List[str]]:
+    """
+    Apply a partial profile update.
+
+    Returns:
+        (updated profile, names of the fields whose value actually changed)
+
+    Raises:
+        ValueError: unknown fields or an invalid resulting profile
+    """
+    unknown = sorted(set(delta) - set(StudentProfile.model_fields))
+    if unknown:
+        raise ValueError(f"Unknown profile fields: {', '.join(unknown)}")
+
+    updated = StudentProfile(**{**profile.dict(), **delta})
+    changed = [
+        name for name in StudentProfile.model_fields
+        if getattr(updated, name) != getattr(profile, name)
+    ]
+    return updated, changed
+
+
+def affected_dimensions(changed_fields: List[str]) -> List[str]:
+    """Dimensions to recompute for the changed fields, in aggregation order."""
+    affected = set()
+    for name in changed_fields:
+        # Unmapped field: be safe and rescore everything
+        affected |= FIELD_DIMENSIONS.get(name, frozenset(SCORERS))
+    return [name for name in SCORERS if name in affected]
+
+
+def run_what_if(
+    db: Session,
+    run: ScoringRun,
+    delta: Dict[str, Any],
+    timer: Optional[PipelineTimer] = None
+) -> Tuple[RecommendationOutput, Dict[str, Any]]:
+    """
+    Re-score a stored run for a profile delta.
+
+    Args:
+        db: Database session (used only when a hard filter changed)
+        run: The run to start from
+        delta: Changed StudentProfile fields
+        timer: Optional PipelineTimer for per-stage timings
+
+    Returns:
+        (RecommendationOutput, what-if details: changed fields, rescored dimensions, full_rerun)
+    """
+    import logging
+    logger = logging.getLogger(__name__)
+    timer = timer or PipelineTimer()
+
+    profile, changed = apply_delta(run.profile, delta)
+    details = {
+        "base_request_id": run.request_id,
+        "changed_fields": changed,
+        "full_rerun": bool(HARD_FILTER_FIELDS.intersection(changed)),
+    }
+
+    if details["full_rerun"] or not run.candidates:
+        logger.info(f"🔁 What-if changes the candidate pool ({changed}) - full rerun")
+        normalized_programs, candidates = fetch_candidates(db, profile, run.limit, timer)
+        output, new_run = score_run(profile, normalized_programs, candidates, run.limit, timer)
+        details["rescored_dimensions"] = list(SCORERS)
+    else:
+        dimensions = affected_dimensions(changed)
+        logger.info(f"🎚️ What-if on {run.request_id}: {changed} -> rescoring {dimensions or 'nothing'}")
+        start_time = time.perf_counter()
+
+        with timer.stage("scoring", items=len(run.candidates)):
+            # Per-dimension results of the base run (time-budgeted runs have none yet)
+            if run.dimension_results is None:
+                base_profile = compile_profile(run.profile)
+                run.dimension_results = [score_dimensions(base_profile, c) for c in run.candidates]
+
+            results = run.dimension_results
+            if dimensions:
+                compiled = compile_profile(profile)
+                results = [
+                    {**base, **score_dimensions(compiled, candidate, dimensions)}
+                    for base, candidate in zip(results, run.candidates)
+                ]
+            scored = [combine_dimensions(c, r) for c, r in zip(run.candidates, results)]
+            eligible = [s for s in scored if s.is_eligible]
+
+        output, ranked = rank_and_assemble(
+            profile, eligible, len(eligible), len(run.candidates), run.limit,
+            _count_by_country(profile.preferred_countries, run.normalized_programs),
+            timer, start_time
+        )
+        details["rescored_dimensions"] = dimensions
+        new_run = ScoringRun(
+            output.request_id, profile, run.limit, run.normalized_programs, run.candidates,
+            dimension_results=results, ranked=ranked
+        )
+
+    if output.request_id:
+        run_store.save(new_run)
+    return output, details
@@ -5,6 +5,8 @@ from .program import RecProgram
 from .intake import RecIntake
 from .eligibility_snapshot import RecEligibilitySnapshot
 from .context_knowledge import RecContextKnowledge
+from .program_feature import RecProgramFeature
+from .catalog_version import RecCatalogVersion
 
 __all__ = [
     "Base",
@@ -13,4 +15,6 @@ __all__ = [
     "RecIntake",
     "RecEligibilitySnapshot",
     "RecContextKnowledge",
+    "RecProgramFeature",
+    "RecCatalogVersion",
 ]
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, DateTime
+
+from .base import Base
+
+
+class RecCatalogVersion(Base):
+    """
+    Single-row counter bumped whenever catalog rows (programs / universities) change.
+
+    Cached recommendation results are tagged with the version they were computed
+    against and dropped as soon as it moves.
+    """
+    __tablename__ = "rec_catalog_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import Column, Index, Integer, String, Text, DateTime, JSON
 
 from .base import Base
 
@@ -37,3 +37,8 @@ class RecEligibilitySnapshot(Base):
     last_verified_at = Column(DateTime)
     data_source = Column(String)
     eligibility_notes = Column(Text)
+
+    __table_args__ = (
+        # generate_candidates: latest snapshot per intake
+        Index("ix_rec_eligibility_snapshots_intake", "intake_id"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, Text
+from sqlalchemy import Column, Index, Integer, String, Date, DateTime, Text
 
 from .base import Base
 
@@ -18,3 +18,8 @@ class RecIntake(Base):
     last_verified_at = Column(DateTime)
     data_source = Column(String)
     notes = Column(Text)
+
+    __table_args__ = (
+        # generate_candidates: best intake per program
+        Index("ix_rec_intakes_program_year_status", "program_id", "intake_year", "intake_status"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, JSON
+from sqlalchemy import Column, Index, Integer, String, Text, JSON
 
 from .base import Base
 
@@ -22,3 +22,8 @@ class RecProgram(Base):
     typical_class_size_band = Column(String)
     internship_opportunities = Column(String)
     career_outcomes_focus = Column(Text)
+
+    __table_args__ = (
+        # generate_candidates: degree filter, then join to rec_universities
+        Index("ix_rec_programs_degree_university", "degree_type", "university_id"),
+    )
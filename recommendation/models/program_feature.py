@@ -0,0 +1,53 @@
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Index
+
+from .base import Base
+
+
+class RecProgramFeature(Base):
+    """
+    Materialized, normalized view of a `programs` row for the recommendation hot path.
+
+    Built offline from Program.attributes by recommendation.services.program_features
+    so that requests never parse the raw JSON.
+    """
+    __tablename__ = "rec_program_features"
+
+    # Identifiers
+    program_id = Column(String, primary_key=True)  # programs.id
+    external_id = Column(String)                   # attributes.id (falls back to programs.id)
+    school_id = Column(String, index=True)
+
+    # University data
+    university_name = Column(String)
+    country = Column(String)
+    country_key = Column(String)  # adapter.country_key(country): ISO alpha-2 code, used for filtering
+    city = Column(String)
+    institution_type = Column(String)
+    logo_thumbnail_url = Column(String)
+    rank = Column(Integer)
+
+    # Program data
+    program_name = Column(String)
+    program_type = Column(String)
+    degree_level = Column(String)
+    normalized_degree_level = Column(String)
+    tuition_fee = Column(Float)
+
+    # Signals (normalized)
+    conversion_signal = Column(String)
+    seat_availability = Column(String)
+    turnaround_time = Column(String)
+
+    # First intake
+    intake_open_date = Column(Date)
+    intake_start_date = Column(Date)
+    intake_deadline = Column(Date)
+
+    # Meta
+    updated_at = Column(DateTime)
+
+    __table_args__ = (
+        # Ordered range reads for fetch_and_transform_programs (with / without country filter)
+        Index("ix_rec_program_features_country_degree", "country_key", "normalized_degree_level", "program_id"),
+        Index("ix_rec_program_features_degree", "normalized_degree_level", "program_id"),
+    )
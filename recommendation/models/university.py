@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, event
 
 from .base import Base
 
@@ -9,6 +9,7 @@ class RecUniversity(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String)
     country = Column(String)
+    country_key = Column(String, index=True)  # adapter.country_key(country): ISO alpha-2 code
     city = Column(String)
     institution_type = Column(String)
     global_reputation_band = Column(String)
@@ -20,3 +21,12 @@ class RecUniversity(Base):
     confidence_level = Column(String)
     last_reviewed_at = Column(DateTime)
     notes = Column(Text)
+
+
+@event.listens_for(RecUniversity, "before_insert")
+@event.listens_for(RecUniversity, "before_update")
+def _derive_country_key(mapper, connection, target: RecUniversity) -> None:
+    """Keep country_key in step with country on every ORM insert/update."""
+    # Imported here: the logic package imports these models
+    from ..logic.countries import country_key
+    target.country_key = country_key(target.country)
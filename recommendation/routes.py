@@ -2,22 +2,49 @@
 Recommendation API Routes
 
 Exposes the recommendation engine via REST API.
-Single endpoint: POST /recommendations
+- POST /recommendations: single profile (JSON, or streamed as NDJSON / SSE)
+- POST /recommendations/batch: many profiles, streamed as NDJSON
+- POST /recommendations/{request_id}/what-if: re-score a run for a profile change
+- GET /recommendations/metrics: per-stage latency histograms
+- GET /recommendations/{request_id}?cursor=...: further pages of a ranked list
 """
 
+import dataclasses
+import json
+import uuid
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Body
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Body, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from db import get_db
 from .logic.contracts import StudentProfile, RecommendationOutput
-from .logic.runner import run_recommendations, get_recommendations_simple
+from .logic.output_assembler import assemble_recommendation
+from .logic.runner import (
+    run_recommendations,
+    candidate_pool_key,
+    fetch_candidates,
+    score_candidates,
+    simplify_output,
+)
+from .logic.result_cache import result_cache, profile_cache_key
+from .logic.timing import PipelineTimer, pipeline_metrics
+from .logic.run_store import run_store
+from .logic.segment_store import segment_store, live_delta, live_fields
+from .logic.what_if import run_what_if
+from .logic.pagination import ranked_lists, save_ranked_list, get_ranked_list, page_of, decode_cursor
+from .services.catalog_version import get_catalog_version
 
 
 router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 
+# Opt-in streaming formats for POST /recommendations -> media type
+STREAM_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
 
 # =============================================================================
 # REQUEST/RESPONSE SCHEMAS
@@ -42,16 +69,73 @@ class RecommendationRequest(BaseModel):
         default=50,
         ge=1,
         le=200,
-        description="Max programs to evaluate"
+        description="Max recommendations to return (cursor pages go on through the whole ranked pool)"
     )
     format: str = Field(
         default="full",
-        description="Response format: 'full' (complete output) or 'simple' (list only)"
+        description=(
+            "Response format: 'full' (complete output), 'simple' (list only), "
+            "or streamed 'ndjson' / 'sse' (summary, then each recommendation, then the explanation)"
+        )
     )
     explain: bool = Field(
         default=False,
         description="Include AI-generated explanation"
     )
+    timings: bool = Field(
+        default=False,
+        description="Include per-stage wall times and item counts in summary.timings"
+    )
+    page_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=200,
+        description=(
+            "Return only the first page_size recommendations plus `next_cursor`; "
+            "GET /recommendations/{request_id}?cursor=... serves the rest ('full' format only)"
+        )
+    )
+    time_budget_ms: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=60000,
+        description=(
+            "Anytime mode: stop scoring when the budget is nearly spent and rank what was "
+            "scored; the response then has `partial: true` and `coverage` (scored share of the pool)"
+        )
+    )
+
+
+class BatchRecommendationRequest(BaseModel):
+    """Request body for the batch recommendations endpoint."""
+    student_profiles: List[Dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Student profiles (same shape as student_profile in POST /recommendations)"
+    )
+    limit: int = Field(
+        default=50,
+        ge=1,
+        le=200,
+        description="Max recommendations to return per profile"
+    )
+    format: str = Field(
+        default="full",
+        description="Per-profile result format: 'full' or 'simple'"
+    )
+
+class WhatIfRequest(BaseModel):
+    """Request body for the what-if endpoint."""
+    profile_delta: Dict[str, Any] = Field(
+        ...,
+        description="StudentProfile fields to change, relative to the run's profile",
+        example={"language_score_band": "good"}
+    )
+    timings: bool = Field(
+        default=False,
+        description="Include per-stage wall times and item counts in summary.timings"
+    )
 
 # ... (imports)
 from .ai.explainer import explainer
@@ -64,6 +148,7 @@ from .ai.explainer import explainer
 @router.post("/", summary="Get program recommendations", include_in_schema=False)
 def get_recommendations(
     request: RecommendationRequest,
+    background_tasks: BackgroundTasks,
     db_session=Depends(get_db)
 ):
     """
@@ -71,14 +156,42 @@ def get_recommendations(
     
     **Request Body:**
     - `student_profile`: Student's academic profile and preferences
-    - `limit`: Maximum number of programs to evaluate (default: 50)
-    - `format`: Response format - 'full' or 'simple'
+    - `limit`: Maximum number of recommendations to return (default: 50)
+    - `format`: Response format - 'full', 'simple', 'ndjson' or 'sse'
     - `explain`: Include AI-generated explanation (default: False)
+    - `timings`: Include per-stage timings in `summary.timings` (default: False)
+    - `page_size`: Return the ranked list in pages of this size ('full' format only)
+    - `time_budget_ms`: Pipeline time budget; see **Anytime mode**
     
     **Response:**
     - Ranked recommendations categorized as Ambitious/Target/Safe
     - Dimension scores and risk factors for each recommendation
-    - AI explanation (if requested)
+    - AI explanation (if requested): generated in the background; `explanation`
+      holds the job status and `ai_explanation` is included once it is ready.
+      Poll `GET /recommendations/{request_id}/explanation` for the result.
+    
+    **Pagination:** the ranked list of every eligible program in the candidate
+    pool (at least `limit` programs are fetched) is kept under `request_id`, so
+    pages go on past `limit`. With `page_size` the response holds the first page,
+    `page` (offset, page_size, total) and `next_cursor`; pass it to
+    `GET /recommendations/{request_id}?cursor=...`.
+    
+    **Streaming (`ndjson` / `sse`):** events `summary` (request_id, summary,
+    warnings), one `recommendation` per ranked item, `explanation` (if requested
+    and available) and a final `done` - results arrive before the LLM call finishes.
+    
+    **Anytime mode:** with `time_budget_ms`, candidates are scored best prior
+    first until the budget is nearly spent, then ranked. A cut-short run has
+    `summary.partial = true` and `summary.coverage` < 1 (top-level keys in the
+    'simple' format) and is not cached. The budget starts before the candidate
+    fetch, so fetch time is spent from it too; ANYTIME_RESERVE_FRACTION of it is
+    kept for ranking and assembly. The candidate pool (CANDIDATE_POOL_SIZE
+    programs, or `limit` if larger) is scored from ANYTIME_FIRST_CHUNK candidates up.
+    
+    **Segments:** profiles in one of the most requested segments (categorical
+    fields, see logic.segment_store) are served from precomputed results; free-text
+    background / domains / career goals are rescored on them. `summary.segment`
+    holds the segment key and the rescored dimensions.
     """
     try:
         db: Session = db_session
@@ -92,40 +205,86 @@ def get_recommendations(
                 detail=f"Invalid student profile: {str(e)}"
             )
         
-        # Run recommendation pipeline
+        timer = PipelineTimer()
+        
+        # Serve repeated profiles from the result cache (invalidated on catalog upserts)
+        # Streaming formats carry the same data as 'full'
+        with timer.stage("cache_lookup"):
+            cache_format = request.format if request.format == "simple" else "full"
+            cache_key = profile_cache_key(profile, request.limit, cache_format)
+            catalog_version = get_catalog_version(db) if result_cache.enabled or segment_store.enabled else 0
+            cached = result_cache.get(cache_key, catalog_version)
+
+        # Run recommendation pipeline (cold profiles in a materialized segment skip it)
         if request.format == "simple":
-            results = get_recommendations_simple(db, profile, request.limit)
-            return {
-                "recommendations": results,
-                "count": len(results)
-            }
+            if cached is None:
+                cached = _from_segment(db, profile, request.limit, "simple", catalog_version, timer, background_tasks)
+                if cached is None:
+                    output = run_recommendations(db, profile, request.limit, timer, request.time_budget_ms)
+                    with timer.stage("serialization", items=len(output.all_recommendations)):
+                        results = simplify_output(output)
+                    cached = {
+                        "recommendations": results,
+                        "count": len(results)
+                    }
+                    if output.partial:
+                        cached.update(partial=True, coverage=output.coverage)
+                # Partial (time-budgeted) results are never cached
+                if not cached.get("partial"):
+                    result_cache.set(cache_key, cached, catalog_version)
+            pipeline_metrics.observe_timer(timer)
+            if request.timings:
+                return {**cached, "summary": {"timings": timer.as_dict()}}
+            return cached
         else:
-            output = run_recommendations(db, profile, request.limit)
+            if cached is not None:
+                response_data = _reissue(cached, profile, cached=True)
+            else:
+                response_data = (
+                    _from_segment(db, profile, request.limit, "full", catalog_version, timer, background_tasks)
+                    or _run_full(db, profile, request.limit, timer, request.time_budget_ms)
+                )
+                if not response_data["summary"]["partial"]:
+                    result_cache.set(cache_key, response_data, catalog_version)
             
-            # Convert to JSON-serializable dict
-            response_data = {
-                "request_id": output.request_id,
-                "student_id": output.student_id,
-                "summary": {
-                    "total_evaluated": output.total_candidates_evaluated,
-                    "total_eligible": output.total_eligible,
-                    "total_recommended": output.total_recommended,
-                    "processing_time_ms": output.processing_time_ms,
-                },
-                "recommendations": [_serialize_recommendation(r) for r in output.all_recommendations],
-                "warnings": output.warnings,
-                "engine_version": output.engine_version,
-            }
+            # Keep the ranked list for cursor pagination (refreshed on cache hits)
+            run = run_store.get(response_data["request_id"])
+            ranked = run.ranked if run else None
+            save_ranked_list(response_data, ranked)
+            
+            pipeline_metrics.observe_timer(timer)
+            if request.timings:
+                # Per request - never written into the cached entry
+                response_data = {
+                    **response_data,
+                    "summary": {**response_data["summary"], "timings": timer.as_dict()},
+                }
+            
+            if request.format in STREAM_FORMATS:
+                return _stream_response(request, response_data)
 
-            # AI Explanation Layer
-            if request.explain:
-                explanation = explainer.get_explanation(
-                    request_id=output.request_id,
-                    student_profile=request.student_profile,
-                    engine_output=response_data
-                )
-                if explanation:
-                    response_data["ai_explanation"] = explanation
+            # AI Explanation Layer (async - never blocks this response on the LLM)
+            if request.explain and explainer.enabled:
+                # Copy so the explanation is never written into the cached entry
+                response_data = dict(response_data)
+                request_id = response_data["request_id"]
+                if _start_explanation_job(request_id, request.student_profile, response_data):
+                    background_tasks.add_task(
+                        explainer.explain_async,
+                        request_id=request_id,
+                        student_profile=request.student_profile,
+                        engine_output=response_data
+                    )
+                job = explainer.jobs.get(request_id) or {}
+                response_data["explanation"] = {
+                    "status": job.get("status"),
+                    "url": f"{router.prefix}/{request_id}/explanation",
+                }
+                if job.get("explanation"):
+                    response_data["ai_explanation"] = job["explanation"]
+            
+            if request.page_size:
+                response_data = page_of(response_data, 0, request.page_size, ranked, _serialize_ranked)
             
             return response_data
             
@@ -139,6 +298,246 @@ def get_recommendations(
         )
 
 
+@router.post("/batch", summary="Get program recommendations for many profiles")
+def get_batch_recommendations(
+    request: BatchRecommendationRequest,
+    db_session=Depends(get_db)
+):
+    """
+    Generate recommendations for a cohort of students in one call.
+    
+    Profiles are grouped by their hard filters (target degree level + preferred
+    countries); each distinct candidate pool is fetched once and scored for
+    every profile in the group.
+    
+    **Response:** NDJSON stream (`application/x-ndjson`), one line per profile
+    as it completes:
+    - `{"type": "result", "index", "student_id", "result"}`
+    - `{"type": "error", "index", "student_id", "error"}`
+    
+    followed by a final `{"type": "summary", ...}` line.
+    """
+    try:
+        db: Session = db_session
+        
+        # Parse profiles (invalid ones are reported in the stream, not fatal)
+        errors: Dict[int, str] = {}
+        groups: Dict[Any, List[Any]] = {}
+        for index, data in enumerate(request.student_profiles):
+            try:
+                profile = StudentProfile(**data)
+            except Exception as e:
+                errors[index] = f"Invalid student profile: {str(e)}"
+                continue
+            groups.setdefault(candidate_pool_key(profile), []).append((index, profile))
+        
+        # Fetch every distinct pool up front: the DB session is closed once streaming starts
+        pools = {
+            key: fetch_candidates(db, members[0][1], request.limit)
+            for key, members in groups.items()
+        }
+    except Exception as e:
+        import traceback
+        return JSONResponse(
+            status_code=500,
+            content={"error": str(e), "trace": traceback.format_exc()}
+        )
+    
+    def stream():
+        failed = len(errors)
+        for index, message in errors.items():
+            yield _line({"type": "error", "index": index, "student_id": None, "error": message})
+        
+        for key, members in groups.items():
+            normalized_programs, candidates = pools[key]
+            for index, profile in members:
+                try:
+                    output = score_candidates(profile, normalized_programs, candidates, request.limit)
+                    result = simplify_output(output) if request.format == "simple" else _serialize_output(output)
+                    yield _line({"type": "result", "index": index, "student_id": profile.student_id, "result": result})
+                except Exception as e:
+                    failed += 1
+                    yield _line({"type": "error", "index": index, "student_id": profile.student_id, "error": str(e)})
+        
+        yield _line({
+            "type": "summary",
+            "profiles": len(request.student_profiles),
+            "candidate_pools": len(pools),
+            "failed": failed,
+        })
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+def _line(payload: Dict[str, Any]) -> str:
+    """Encode one NDJSON line."""
+    return json.dumps(payload, default=str) + "\n"
+
+
+def _sse(event: str, payload: Dict[str, Any]) -> str:
+    """Encode one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+def _stream_response(request: RecommendationRequest, response_data: Dict[str, Any]) -> StreamingResponse:
+    """
+    Stream a full-format response: summary header, each recommendation, then the
+    AI explanation (generated only after every recommendation has been sent).
+    """
+    def encode(event: str, payload: Dict[str, Any]) -> str:
+        if request.format == "sse":
+            return _sse(event, payload)
+        return _line({"type": event, **payload})
+    
+    async def stream():
+        yield encode("summary", {
+            "request_id": response_data["request_id"],
+            "student_id": response_data["student_id"],
+            "summary": response_data["summary"],
+            "warnings": response_data["warnings"],
+            "engine_version": response_data["engine_version"],
+        })
+        for recommendation in response_data["recommendations"]:
+            yield encode("recommendation", recommendation)
+        
+        if request.explain and explainer.enabled:
+            request_id = response_data["request_id"]
+            if _start_explanation_job(request_id, request.student_profile, response_data):
+                # Generated in-stream rather than in the background: it is the last event
+                await explainer.explain_async(
+                    request_id=request_id,
+                    student_profile=request.student_profile,
+                    engine_output=response_data
+                )
+            job = explainer.jobs.get(request_id) or {}
+            if job.get("explanation"):
+                yield encode("explanation", {"ai_explanation": job["explanation"]})
+        
+        yield encode("done", {"request_id": response_data["request_id"]})
+    
+    return StreamingResponse(
+        stream(),
+        media_type=STREAM_FORMATS[request.format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _start_explanation_job(request_id: str, student_profile: Dict[str, Any], response_data: Dict[str, Any]) -> bool:
+    """
+    Register the explanation job of request_id; True if the caller should run
+    explainer.explain_async for it.
+
+    A repeated profile (new request_id, same prompt inputs) is completed from the
+    explanation cache right away, so no job is started for it.
+    """
+    if not explainer.jobs.get(request_id):
+        explainer.complete_from_cache(request_id, student_profile, response_data)
+    return explainer.submit(request_id)
+
+
+def _reissue(response_data: Dict[str, Any], profile: StudentProfile, **summary: Any) -> Dict[str, Any]:
+    """
+    Copy of a stored full-format response for this caller, under a fresh request_id.
+
+    The ranked list, the explanation job and the what-if run are kept per
+    request_id, so a shared cached entry must never hand its id to a second
+    caller. The stored run is registered again under the new id.
+    """
+    request_id = str(uuid.uuid4())
+    run = run_store.get(response_data["request_id"]) if response_data.get("request_id") else None
+    if run is not None:
+        run_store.save(dataclasses.replace(run, request_id=request_id))
+    return {
+        **response_data,
+        "request_id": request_id,
+        "student_id": profile.student_id,
+        "summary": {**response_data["summary"], **summary},
+    }
+
+
+def _from_segment(
+    db: Session,
+    profile: StudentProfile,
+    limit: int,
+    format: str,
+    catalog_version: int,
+    timer: PipelineTimer,
+    background_tasks: BackgroundTasks
+) -> Optional[Dict[str, Any]]:
+    """
+    Serve a request from its materialized segment ('full' or 'simple' response),
+    or None to run the live pipeline.
+
+    Counts the request for its segment and schedules a segment refresh when the
+    catalog changed or a popular segment is not materialized yet. Live fields
+    (free-text background, domains, career goals) are rescored on the segment's run.
+    """
+    if not segment_store.enabled:
+        return None
+
+    # Timed as part of the cache lookup: the store is the cache tier behind result_cache
+    with timer.stage("cache_lookup"):
+        key = segment_store.record(profile, limit)
+        segment = segment_store.get(key, catalog_version)
+        if segment_store.claim_refresh(catalog_version):
+            background_tasks.add_task(segment_store.refresh, db.get_bind(), _serialize_output)
+    if segment is None:
+        return None
+
+    if not live_fields(profile):
+        segment_store.count_hit(rescored=False)
+        if format == "simple":
+            return {"recommendations": segment.simple, "count": len(segment.simple)}
+        # Own request_id per hit; the segment's run is registered under it for what-if
+        run_store.save(segment.run)
+        return _reissue(segment.full, profile, cached=True, segment={"key": key, "rescored_dimensions": []})
+
+    segment_store.count_hit(rescored=True)
+    output, details = run_what_if(db, segment.run, live_delta(profile), timer)
+    with timer.stage("serialization", items=len(output.all_recommendations)):
+        if format == "simple":
+            results = simplify_output(output)
+            return {"recommendations": results, "count": len(results)}
+        response_data = _serialize_output(output)
+    response_data["summary"]["segment"] = {"key": key, "rescored_dimensions": details["rescored_dimensions"]}
+    return response_data
+
+
+def _run_full(
+    db: Session,
+    profile: StudentProfile,
+    limit: int,
+    timer: Optional[PipelineTimer] = None,
+    time_budget_ms: Optional[int] = None
+) -> Dict[str, Any]:
+    """Run the pipeline and convert the output to a JSON-serializable dict."""
+    timer = timer or PipelineTimer()
+    output = run_recommendations(db, profile, limit, timer, time_budget_ms)
+    with timer.stage("serialization", items=len(output.all_recommendations)):
+        return _serialize_output(output)
+
+
+def _serialize_output(output: RecommendationOutput) -> Dict[str, Any]:
+    """Convert RecommendationOutput to the full-format response dict."""
+    return {
+        "request_id": output.request_id,
+        "student_id": output.student_id,
+        "summary": {
+            "total_evaluated": output.total_candidates_evaluated,
+            "total_eligible": output.total_eligible,
+            "total_recommended": output.total_recommended,
+            "candidates_by_country": output.candidates_by_country,
+            "processing_time_ms": output.processing_time_ms,
+            "cached": False,
+            "partial": output.partial,
+            "coverage": output.coverage,
+        },
+        "recommendations": [_serialize_recommendation(r) for r in output.all_recommendations],
+        "warnings": output.warnings,
+        "engine_version": output.engine_version,
+    }
+
+
 def _serialize_recommendation(rec) -> Dict[str, Any]:
     """Convert ProgramRecommendation to JSON-serializable dict."""
     return {
@@ -177,6 +576,105 @@ def _serialize_recommendation(rec) -> Dict[str, Any]:
     }
 
 
+def _serialize_ranked(scored, rank: int) -> Dict[str, Any]:
+    """Serialize a ranked ScoredRecord of a run as its recommendation at `rank` (later pages)."""
+    return _serialize_recommendation(assemble_recommendation(scored, rank))
+
+
+# =============================================================================
+# AI EXPLANATION JOBS
+# =============================================================================
+
+@router.get("/{request_id}/explanation", summary="Poll the AI explanation for a recommendation run")
+def get_explanation(request_id: str):
+    """
+    Status of the background AI explanation for `request_id`.
+    
+    `status` is `pending`, `ready` (with `explanation`) or `failed` (with `error`).
+    Jobs are visible to every worker when EXPLANATION_CACHE_PATH is set; without
+    it, only to the worker that started them (single-worker deployments).
+    """
+    job = explainer.jobs.get(request_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="No explanation requested for this request_id")
+    return job
+
+
+# =============================================================================
+# WHAT-IF RE-SCORING
+# =============================================================================
+
+@router.post("/{request_id}/what-if", summary="Re-score a recommendation run for a profile change")
+def what_if(
+    request_id: str,
+    request: WhatIfRequest,
+    db_session=Depends(get_db)
+):
+    """
+    Answer "what if my IELTS goes from adequate to good?" without re-running the
+    pipeline.
+    
+    Reuses the candidate pool and per-dimension scores of `request_id` and
+    recomputes only the dimensions that depend on the changed fields. Changing
+    `target_degree_level` or `preferred_countries` changes the pool and runs the
+    full pipeline instead.
+    
+    **Response:** same shape as the 'full' format, with a new `request_id`
+    (usable for further what-ifs) and a `what_if` block: `base_request_id`,
+    `changed_fields`, `rescored_dimensions`, `full_rerun`.
+    """
+    run = run_store.get(request_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired request_id - run POST /recommendations again")
+    
+    timer = PipelineTimer()
+    try:
+        output, details = run_what_if(db_session, run, request.profile_delta, timer)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid profile delta: {str(e)}")
+    
+    with timer.stage("serialization", items=len(output.all_recommendations)):
+        response_data = _serialize_output(output)
+    new_run = run_store.get(output.request_id)
+    save_ranked_list(response_data, new_run.ranked if new_run else None)
+
+    # Copies - the stored ranked list stays a plain 'full' response
+    response_data = {**response_data, "what_if": details}
+    if request.timings:
+        response_data["summary"] = {**response_data["summary"], "timings": timer.as_dict()}
+    return response_data
+
+
+# =============================================================================
+# CACHE STATS
+# =============================================================================
+
+@router.get("/cache/stats", summary="Recommendation and explanation cache statistics")
+def cache_stats():
+    """Hit/miss/eviction counters for sizing the result, AI explanation and segment caches."""
+    return {
+        "results": result_cache.stats(),
+        "explanations": explainer.cache.stats(),
+        "ranked_lists": ranked_lists.stats(),
+        "segments": segment_store.stats(),
+    }
+
+
+# =============================================================================
+# PIPELINE METRICS
+# =============================================================================
+
+@router.get("/metrics", summary="Per-stage recommendation pipeline latency histograms")
+def pipeline_metrics_snapshot():
+    """
+    Latency histograms (count, mean, max, estimated p50/p95/p99, buckets in ms)
+    for every pipeline stage and for whole requests, since process start.
+    
+    Metrics are per worker process.
+    """
+    return pipeline_metrics.snapshot()
+
+
 # =============================================================================
 # HEALTH CHECK
 # =============================================================================
@@ -185,3 +683,37 @@ def _serialize_recommendation(rec) -> Dict[str, Any]:
 def health_check():
     """Check if recommendation engine is operational."""
     return {"status": "ok", "engine": "recommendation", "version": "1.0.0"}
+
+
+# =============================================================================
+# PAGINATION
+# (declared last: /{request_id} must not shadow /metrics or /health)
+# =============================================================================
+
+@router.get("/{request_id}", summary="Page through a ranked recommendation list")
+def get_recommendation_page(
+    request_id: str,
+    cursor: Optional[str] = Query(default=None, description="next_cursor from a previous page"),
+    page_size: int = Query(default=20, ge=1, le=200, description="Page size when no cursor is given"),
+):
+    """
+    Serve a page of the ranked list of `request_id` from memory - no DB access or
+    scoring.
+    
+    Without `cursor` the first page is returned. The response has the 'full'
+    format shape with one page of `recommendations`, plus `page` (offset,
+    page_size, total) and `next_cursor` (null on the last page). `page.total`
+    counts every eligible program of the run's pool, so pages go on past the
+    request's `limit`. Lists expire after RECOMMENDATION_PAGE_TTL_SECONDS.
+    """
+    ranked_list = get_ranked_list(request_id)
+    if ranked_list is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired request_id - run POST /recommendations again")
+    
+    offset = 0
+    if cursor:
+        try:
+            offset, page_size = decode_cursor(request_id, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {str(e)}")
+    return page_of(ranked_list.response, offset, page_size, ranked_list.ranked, _serialize_ranked)
@@ -0,0 +1,74 @@
+"""
+Catalog Version
+
+Monotonic counter stored in rec_catalog_version. Program.upsert and
+UniversityModel.upsert mark their session (mark_catalog_changed); the version
+is bumped once when that transaction commits, however many rows it upserted,
+so every API worker sees the new version as soon as the catalog change is
+committed.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..models import RecCatalogVersion
+
+
+CATALOG_VERSION_ROW_ID = 1
+
+# Session.info flag set by mark_catalog_changed
+_CHANGED_KEY = "catalog_changed"
+
+
+def get_catalog_version(db: Session) -> int:
+    """
+    Current catalog version (0 if the catalog has never been bumped).
+    """
+    version = (
+        db.query(RecCatalogVersion.version)
+        .filter(RecCatalogVersion.id == CATALOG_VERSION_ROW_ID)
+        .scalar()
+    )
+    return version or 0
+
+
+def bump_catalog_version(db: Session) -> None:
+    """
+    Increment the catalog version. Does not commit - the caller's transaction
+    covers both the catalog change and the bump.
+    """
+    updated = (
+        db.query(RecCatalogVersion)
+        .filter(RecCatalogVersion.id == CATALOG_VERSION_ROW_ID)
+        .update(
+            {
+                RecCatalogVersion.version: RecCatalogVersion.version + 1,
+                RecCatalogVersion.updated_at: datetime.utcnow(),
+            },
+            synchronize_session=False,
+        )
+    )
+    if not updated:
+        db.add(RecCatalogVersion(id=CATALOG_VERSION_ROW_ID, version=1, updated_at=datetime.utcnow()))
+        db.flush()
+
+
+def mark_catalog_changed(db: Session) -> None:
+    """
+    Record a catalog change in the session's transaction; the version is bumped
+    once, just before that transaction commits (rolled back changes are not).
+    """
+    db.info[_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_on_commit(session: Session) -> None:
+    if session.info.pop(_CHANGED_KEY, False):
+        bump_catalog_version(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_CHANGED_KEY, None)
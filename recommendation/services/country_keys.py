@@ -0,0 +1,90 @@
+"""
+Country Key Backfill
+
+Brings country keys stored before the country registry up to date:
+- rec_program_features.country_key held the lower-cased country name; it is
+  now the ISO 3166-1 alpha-2 code (and `country` the registry display name)
+- rec_universities.country_key is a new indexed column derived from `country`
+
+Keys are derived from the stored country text with adapter.country_key. Rows
+sharing a country value are updated with one statement, so the work scales
+with the number of distinct countries, not rows. Rows written through the ORM
+afterwards get their key from RecUniversity's insert/update listener.
+
+Run from backend directory:
+    python -m recommendation.services.country_keys
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+
+from ..logic.adapter import country_key, _get_country_name
+from ..models import RecProgramFeature, RecUniversity
+from .catalog_version import bump_catalog_version
+
+
+def _matching(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def ensure_country_keys(db: Session) -> int:
+    """
+    Add rec_universities.country_key if missing and re-derive stale country keys.
+
+    Intended for application startup; idempotent (a DISTINCT scan once up to date).
+
+    Returns:
+        Number of rows updated
+    """
+    bind = db.get_bind()
+    columns = {column["name"] for column in inspect(bind).get_columns(RecUniversity.__tablename__)}
+    if "country_key" not in columns:
+        db.execute(text(f"ALTER TABLE {RecUniversity.__tablename__} ADD COLUMN country_key VARCHAR"))
+        db.commit()
+    for index in RecUniversity.__table__.indexes:
+        index.create(bind=bind, checkfirst=True)
+
+    updated = 0
+
+    universities = RecUniversity.__table__
+    for country, key in db.execute(universities.select().with_only_columns(
+        universities.c.country, universities.c.country_key
+    ).distinct()).all():
+        if key != country_key(country):
+            updated += db.execute(
+                universities.update()
+                .where(_matching(universities.c.country, country), _matching(universities.c.country_key, key))
+                .values(country_key=country_key(country))
+            ).rowcount
+
+    features = RecProgramFeature.__table__
+    feature_rows = 0
+    for country, key in db.execute(features.select().with_only_columns(
+        features.c.country, features.c.country_key
+    ).distinct()).all():
+        name = _get_country_name(country or "")
+        if key != country_key(country) or (country or "") != name:
+            feature_rows += db.execute(
+                features.update()
+                .where(_matching(features.c.country, country), _matching(features.c.country_key, key))
+                .values(country=name, country_key=country_key(country))
+            ).rowcount
+
+    if updated or feature_rows:
+        # Cached recommendations were filtered with the old keys
+        bump_catalog_version(db)
+    db.commit()
+    return updated + feature_rows
+
+
+if __name__ == "__main__":
+    import sys
+    sys.path.insert(0, ".")
+    from db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        count = ensure_country_keys(db)
+        print(f"✅ Country keys updated: {count}")
+    finally:
+        db.close()
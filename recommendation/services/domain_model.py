@@ -0,0 +1,81 @@
+"""
+Domain Similarity Model Build
+
+Builds the file read by logic.domain_similarity from the rec_* catalog:
+- idf is fitted on one document per program (name, domain and tags), plus the
+  names in rec_program_features
+- the term matrix holds every distinct program domain and industry alignment tag
+
+Rebuild after catalog imports; the file is replaced atomically and the catalog
+version is bumped so cached recommendations are re-scored with the new model.
+
+Run from backend directory:
+    python -m recommendation.services.domain_model [path]
+"""
+
+from typing import Iterator, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from ..logic.domain_similarity import DEFAULT_N_FEATURES, build_model, domain_model
+from ..models import RecProgram, RecProgramFeature
+from .catalog_version import bump_catalog_version
+
+
+def build_domain_model(
+    db: Session,
+    path: Optional[str] = None,
+    n_features: int = DEFAULT_N_FEATURES
+) -> int:
+    """
+    Build the domain similarity model from the catalog and write it to path.
+
+    Args:
+        db: Database session
+        path: Model file (default: the file the scorers load)
+        n_features: Hash space size
+
+    Returns:
+        Number of terms in the model
+    """
+    terms: Set[str] = set()
+
+    def documents() -> Iterator[str]:
+        programs = db.query(
+            RecProgram.program_name,
+            RecProgram.program_domain,
+            RecProgram.industry_alignment_tags,
+            RecProgram.background_preference_tags,
+        ).yield_per(1000)
+        for name, domain, industry_tags, background_tags in programs:
+            industry_tags = [t for t in industry_tags or [] if t]
+            if domain:
+                terms.add(domain)
+            terms.update(industry_tags)
+            yield " ".join([name or "", domain or "", *industry_tags, *(t for t in background_tags or [] if t)])
+
+        for (name,) in db.query(RecProgramFeature.program_name).yield_per(1000):
+            if name:
+                yield name
+
+    # build_model reads the terms only after the documents, so the set is complete by then
+    model = build_model(documents(), terms, n_features=n_features)
+    model.save(path or domain_model.path)
+
+    bump_catalog_version(db)
+    db.commit()
+    return len(model)
+
+
+if __name__ == "__main__":
+    import sys
+    sys.path.insert(0, ".")
+    from db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        path = sys.argv[1] if len(sys.argv) > 1 else None
+        count = build_domain_model(db, path)
+        print(f"✅ Domain similarity model built: {count} terms -> {path or domain_model.path}")
+    finally:
+        db.close()
@@ -0,0 +1,231 @@
+"""
+Program Feature Ingestion
+
+Materializes the adapter's normalized program format into rec_program_features.
+
+Runs transform_program + classify_degree once per program (at ingest time)
+instead of on every recommendation request:
+- sync_program_feature: incremental refresh of a single row (called from Program.upsert)
+- refresh_program_features: full or partial backfill
+
+Also backfills programs.school_id on databases created before that column existed
+(ensure_program_school_ids).
+
+Run a full backfill from backend directory:
+    python -m recommendation.services.program_features
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+
+from models.models import Program
+from ..logic.adapter import transform_program, country_key
+from ..logic.degree_classifier import classify_degree
+from ..models import RecProgramFeature
+
+
+def build_program_feature(program: Program) -> Dict[str, Any]:
+    """
+    Build the feature row for a single program.
+
+    Args:
+        program: Program ORM object
+
+    Returns:
+        Dict of RecProgramFeature column values
+    """
+    normalized = transform_program(program)
+
+    # Degree info is often embedded in program names, not in a clean field
+    degree = classify_degree(
+        str(normalized.get("degree_level") or ""),
+        str(normalized.get("program_name") or ""),
+    )
+
+    intakes = normalized.get("intakes") or []
+    first_intake = intakes[0] if intakes else {}
+
+    university_id = normalized.get("university_id")
+
+    return {
+        "program_id": str(program.id),
+        "external_id": str(normalized.get("program_id") or program.id),
+        "school_id": str(university_id) if university_id is not None else None,
+
+        "university_name": normalized.get("university_name") or "",
+        "country": normalized.get("country") or "",
+        "country_key": country_key(normalized.get("country")),
+        "city": normalized.get("city") or "",
+        "institution_type": normalized.get("institution_type") or "",
+        "logo_thumbnail_url": normalized.get("logo_thumbnail_url"),
+        "rank": normalized.get("rank"),
+
+        "program_name": normalized.get("program_name") or "",
+        "program_type": normalized.get("program_type"),
+        "degree_level": normalized.get("degree_level") or "",
+        "normalized_degree_level": degree.level,
+        "tuition_fee": normalized.get("tuition_fee"),
+
+        "conversion_signal": normalized.get("conversion_signal"),
+        "seat_availability": normalized.get("seat_availability"),
+        "turnaround_time": normalized.get("turnaround_time"),
+
+        "intake_open_date": first_intake.get("open_date"),
+        "intake_start_date": first_intake.get("start_date"),
+        "intake_deadline": first_intake.get("deadline"),
+
+        "updated_at": datetime.utcnow(),
+    }
+
+
+def sync_program_feature(db: Session, program: Program) -> Optional[RecProgramFeature]:
+    """
+    Incrementally refresh the feature row for one program.
+
+    Called whenever Program.upsert touches a row. Does not commit - the caller's
+    transaction covers both the program and its feature row.
+
+    Args:
+        db: Database session
+        program: Program ORM object that was inserted/updated
+
+    Returns:
+        The merged RecProgramFeature, or None if the program could not be transformed
+    """
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        values = build_program_feature(program)
+    except Exception as e:
+        # Never block catalog ingestion on a malformed attributes blob
+        logger.warning(f"Failed to build features for program {program.id}: {e}")
+        return None
+
+    return db.merge(RecProgramFeature(**values))
+
+
+def refresh_program_features(
+    db: Session,
+    program_ids: Optional[Iterable[str]] = None,
+    batch_size: int = 500
+) -> int:
+    """
+    Rebuild feature rows for all programs (or the given program IDs).
+
+    Args:
+        db: Database session
+        program_ids: Optional subset of programs.id to refresh
+        batch_size: Programs processed per commit
+
+    Returns:
+        Number of feature rows written
+    """
+    query = db.query(Program).order_by(Program.id)
+    if program_ids is not None:
+        query = query.filter(Program.id.in_([str(pid) for pid in program_ids]))
+
+    written = 0
+    last_id = None
+    while True:
+        # Keyset pagination keeps memory flat on large catalogs
+        page = query if last_id is None else query.filter(Program.id > last_id)
+        programs = page.limit(batch_size).all()
+        if not programs:
+            break
+
+        last_id = programs[-1].id
+        for program in programs:
+            if sync_program_feature(db, program) is not None:
+                written += 1
+        db.commit()
+        db.expunge_all()
+
+    return written
+
+
+def ensure_program_features(db: Session) -> int:
+    """
+    Backfill rec_program_features if it is empty but programs exist.
+    
+    Intended for application startup; a no-op once the table is populated.
+    
+    Returns:
+        Number of feature rows written (0 if nothing to do)
+    """
+    if db.query(RecProgramFeature.program_id).first() is not None:
+        return 0
+    if db.query(Program.id).first() is None:
+        return 0
+    return refresh_program_features(db)
+
+
+def ensure_program_school_ids(db: Session, batch_size: int = 1000) -> int:
+    """
+    Add and backfill programs.school_id on existing databases.
+
+    create_all does not add columns to existing tables. Adds the column and its
+    index if missing, then fills rows whose school_id is still NULL from
+    attributes['school']['id']. Intended for application startup, before anything
+    queries Program; idempotent.
+
+    Returns:
+        Number of programs backfilled
+    """
+    bind = db.get_bind()
+    columns = {column["name"] for column in inspect(bind).get_columns(Program.__tablename__)}
+    if "school_id" not in columns:
+        db.execute(text(f"ALTER TABLE {Program.__tablename__} ADD COLUMN school_id VARCHAR"))
+        db.commit()
+    for index in Program.__table__.indexes:
+        index.create(bind=bind, checkfirst=True)
+
+    table = Program.__table__
+    written = 0
+    last_id = None
+    while True:
+        # Keyset pagination; rows without a school stay NULL and are skipped on later pages
+        query = (
+            db.query(table.c.id, table.c.attributes)
+            .filter(table.c.school_id.is_(None))
+            .order_by(table.c.id)
+        )
+        if last_id is not None:
+            query = query.filter(table.c.id > last_id)
+        rows = query.limit(batch_size).all()
+        if not rows:
+            break
+
+        last_id = rows[-1].id
+        updates = [
+            {"program_id": row.id, "school_id": school_id}
+            for row in rows
+            if (school_id := Program.school_id_from(row.attributes)) is not None
+        ]
+        if updates:
+            db.execute(
+                text(f"UPDATE {Program.__tablename__} SET school_id = :school_id WHERE id = :program_id"),
+                updates,
+            )
+            written += len(updates)
+        db.commit()
+
+    return written
+
+
+if __name__ == "__main__":
+    import sys
+    sys.path.insert(0, ".")
+    from db import SessionLocal, engine
+
+    RecProgramFeature.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    try:
+        count = refresh_program_features(db)
+        print(f"✅ Program features refreshed: {count}")
+    finally:
+        db.close()
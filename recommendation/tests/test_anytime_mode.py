@@ -0,0 +1,197 @@
+"""
+Test the deadline-aware ("anytime") scoring mode (time_budget_ms).
+
+Run from backend directory:
+    python -m recommendation.tests.test_anytime_mode
+"""
+
+import sys
+import os
+import random
+import tempfile
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from db import get_db
+from recommendation.benchmarks.synthetic import create_rec_catalog, create_sqlite_catalog
+from recommendation.routes import router
+from recommendation.logic.engine import RecommendationEngine
+from recommendation.logic.aggregator import batch_aggregate_anytime, batch_aggregate_top_k
+from recommendation.logic.contracts import StudentProfile
+from recommendation.logic.ranker import rank_candidates, apply_diversity_penalty
+from recommendation.logic.records import CandidateRecord
+from recommendation.logic.result_cache import result_cache
+from recommendation.logic.runner import score_candidates
+from recommendation.logic.segment_store import segment_store
+from recommendation.logic.constants import (
+    ACADEMIC_SCORE_BAND_MAP,
+    ANYTIME_FIRST_CHUNK,
+    CANDIDATE_POOL_SIZE,
+    COLUMNAR_MIN_CANDIDATES,
+    REPUTATION_BAND_MAP,
+    TUITION_FEE_BAND_MAP,
+)
+
+
+PROFILE = StudentProfile(
+    academic_score_band="good",
+    language_score_band="good",
+    preferred_countries=["Germany", "Canada"],
+    preferred_program_domains=["Computer Science"],
+    tuition_preference_band="moderate",
+)
+
+
+def _candidates(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    return [
+        CandidateRecord(
+            program_id=i + 1,
+            university_id=rng.randint(1, count // 5 + 1),
+            country=rng.choice(["Germany", "Canada"]),
+            global_reputation_band=rng.choice(list(REPUTATION_BAND_MAP) + ["n/a"]),
+            academic_score_band=rng.choice(list(ACADEMIC_SCORE_BAND_MAP)),
+            tuition_fee_band=rng.choice(list(TUITION_FEE_BAND_MAP)),
+            program_domain=rng.choice(["Computer Science", "Finance", ""]),
+            degree_match_status="match",
+        )
+        for i in range(count)
+    ]
+
+
+def _ids(records):
+    return sorted(r.candidate.program_id for r in records)
+
+
+def _top(records, k):
+    return [r.candidate.program_id for r in apply_diversity_penalty(rank_candidates(records))[:k]]
+
+
+def _priority(candidates):
+    """Pool indices best reputation first, ties in pool order."""
+    return sorted(range(len(candidates)),
+                  key=lambda i: -REPUTATION_BAND_MAP.get(candidates[i].global_reputation_band, 0.5))
+
+
+def test_complete_run_matches_top_k():
+    for size in (100, 3000):  # per-candidate and column-wise paths
+        candidates = _candidates(size)
+        expected, expected_eligible = batch_aggregate_top_k(PROFILE, candidates, 30)
+        eligible, total_eligible, scored = batch_aggregate_anytime(PROFILE, candidates, 30, time.perf_counter() + 60)
+        assert scored == size and total_eligible == expected_eligible
+        assert _ids(eligible) == _ids(expected)
+    print("✅ A run that beats its deadline selects what batch_aggregate_top_k selects")
+
+
+def test_stops_at_deadline():
+    candidates = _candidates(3000)
+    assert len(candidates) >= COLUMNAR_MIN_CANDIDATES
+
+    # Each chunk takes one clock tick: after the first chunk half a tick is left
+    ticks = iter(range(100))
+    eligible, total_eligible, scored = batch_aggregate_anytime(
+        PROFILE, candidates, 30, deadline=1.5, clock=lambda: float(next(ticks))
+    )
+    assert scored == ANYTIME_FIRST_CHUNK + ANYTIME_FIRST_CHUNK // 2
+
+    # The scored candidates are the best-prior prefix, selected as a complete run over them would
+    prefix = [candidates[i] for i in sorted(_priority(candidates)[:scored])]
+    expected, expected_eligible = batch_aggregate_top_k(PROFILE, prefix, 30)
+    assert _top(eligible, 30) == _top(expected, 30) and total_eligible == expected_eligible
+
+    # Past the deadline, only the first chunk is scored
+    _, _, scored = batch_aggregate_anytime(PROFILE, candidates, 30, deadline=0.0)
+    assert scored == ANYTIME_FIRST_CHUNK
+    print(f"✅ Scoring stops at the deadline ({scored} of {len(candidates)} scored past it)")
+
+
+def test_small_pool_is_completed():
+    # Past the deadline, but the rest of the pool costs no more than the first chunk
+    candidates = _candidates(2 * ANYTIME_FIRST_CHUNK)
+    _, _, scored = batch_aggregate_anytime(PROFILE, candidates, 30, deadline=0.0)
+    assert scored == len(candidates)
+    _, _, scored = batch_aggregate_anytime(PROFILE, _candidates(2 * ANYTIME_FIRST_CHUNK + 1), 30, deadline=0.0)
+    assert scored == ANYTIME_FIRST_CHUNK
+    print(f"✅ Pools of up to {2 * ANYTIME_FIRST_CHUNK} candidates are never truncated")
+
+
+def test_partial_output():
+    candidates = _candidates(500)
+    output = score_candidates(PROFILE, [{}] * len(candidates), candidates, 20, deadline=0.0)
+    assert output.partial is True
+    assert output.coverage == round(ANYTIME_FIRST_CHUNK / len(candidates), 4)
+    assert output.total_candidates_evaluated == ANYTIME_FIRST_CHUNK
+    assert any(w.startswith("Time budget reached") for w in output.warnings)
+    assert 0 < len(output.all_recommendations) <= 20
+
+    complete = score_candidates(PROFILE, [{}] * len(candidates), candidates, 20)
+    assert complete.partial is False and complete.coverage == 1.0
+    print(f"✅ Partial output: coverage {output.coverage}, {len(output.all_recommendations)} recommendations")
+
+
+def test_engine_time_budget():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_rec_catalog(os.path.join(workdir, "rec.db"), 1500)
+        with factory() as db:
+            engine = RecommendationEngine(db)
+            profile = StudentProfile(academic_score_band="good", language_score_band="good")
+            complete = engine.recommend(profile, max_candidates=1000)
+            pool = complete.total_candidates_evaluated
+            assert complete.partial is False and pool > 2 * ANYTIME_FIRST_CHUNK
+
+            partial = engine.recommend(profile, max_candidates=1000, time_budget_ms=0.001)
+    assert partial.partial is True and partial.total_candidates_evaluated == ANYTIME_FIRST_CHUNK
+    assert partial.coverage == round(ANYTIME_FIRST_CHUNK / pool, 4)
+    assert any(w.startswith("Time budget reached") for w in partial.warnings)
+    print(f"✅ RecommendationEngine.recommend honours time_budget_ms (coverage {partial.coverage} of {pool})")
+
+
+def test_time_budget_endpoint():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 2000)
+
+        def override_get_db():
+            with factory() as db:
+                yield db
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(app)
+        result_cache.clear()
+        segment_store.clear()
+
+        profile = {"academic_score_band": "good", "preferred_countries": ["Germany", "Canada"]}
+        # The serving pool (CANDIDATE_POOL_SIZE candidates) is cut short: 1 ms is
+        # spent on the fetch before scoring starts, so only the first chunk is scored
+        for format in ("full", "simple"):
+            body = {"student_profile": profile, "limit": 100, "format": format, "time_budget_ms": 1}
+            partial = client.post("/recommendations", json=body).json()
+            info = partial["summary"] if format == "full" else partial
+            assert info["partial"] is True and 0 < info["coverage"] < 1
+            assert result_cache.stats()["size"] == 0  # partial results are not cached
+        assert info["coverage"] == round(ANYTIME_FIRST_CHUNK / CANDIDATE_POOL_SIZE, 4)
+
+        full = client.post("/recommendations", json={"student_profile": profile, "limit": 100}).json()
+        assert full["summary"]["partial"] is False and full["summary"]["coverage"] == 1.0
+        generous = client.post("/recommendations", json={"student_profile": profile, "limit": 100,
+                                                         "time_budget_ms": 60000}).json()
+        assert generous["summary"]["partial"] is False
+        assert client.post("/recommendations", json={"student_profile": profile, "time_budget_ms": 0}).status_code == 422
+        segment_store.clear()
+    print(f"✅ time_budget_ms returns partial=true with coverage {info['coverage']} and skips the cache")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 ANYTIME MODE TEST")
+    print("=" * 60)
+    test_complete_run_matches_top_k()
+    test_stops_at_deadline()
+    test_small_pool_is_completed()
+    test_partial_output()
+    test_engine_time_budget()
+    test_time_budget_endpoint()
@@ -0,0 +1,268 @@
+"""
+Test asynchronous AI explanations against a local fake OpenAI server.
+
+Run from backend directory:
+    python -m recommendation.tests.test_async_explanation
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import contextlib
+import io
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from db import get_db
+from recommendation import routes
+from recommendation.ai.explainer import AIExplainer
+from recommendation.ai.jobs import ExplanationJobStore
+from recommendation.benchmarks.synthetic import create_sqlite_catalog
+
+
+class FakeOpenAI(BaseHTTPRequestHandler):
+    """Minimal /chat/completions endpoint; prompts containing FAIL get a 400."""
+    delay = 0.05
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    calls = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.calls += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        time.sleep(cls.delay)
+        with cls.lock:
+            cls.active -= 1
+
+        if "FAIL" in body["messages"][-1]["content"]:
+            self._send(400, {"error": {"message": "bad request", "type": "invalid_request_error"}})
+            return
+
+        content = json.dumps({"summary": "fake explanation", "model": body["model"]})
+        self._send(200, {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        })
+
+    def _send(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_fake_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenAI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def test_explain_async_concurrency_and_failures():
+    server, base_url = _start_fake_server()
+    try:
+        explainer = AIExplainer(api_key="test-key", base_url=base_url, max_concurrency=2)
+        explainer.async_client = explainer.async_client.with_options(max_retries=0)
+
+        async def run():
+            profiles = [{"background_field": "FAIL" if i == 0 else "Computer Science"} for i in range(6)]
+            return await asyncio.gather(*[
+                explainer.explain_async(f"req-{i}", profile, {"recommendations": []})
+                for i, profile in enumerate(profiles)
+            ])
+
+        FakeOpenAI.max_active = 0
+        results = asyncio.run(run())
+        print(f"   max concurrent LLM calls: {FakeOpenAI.max_active}")
+        assert FakeOpenAI.max_active <= 2
+        assert results[0] is None
+        assert explainer.jobs.get("req-0")["status"] == "failed"
+        assert all(r["summary"] == "fake explanation" for r in results[1:])
+        assert explainer.jobs.get("req-3")["status"] == "ready"
+    finally:
+        server.shutdown()
+    print("✅ Async explanations respect the concurrency limit and record failures")
+
+
+def test_explain_endpoint_returns_immediately():
+    server, base_url = _start_fake_server()
+    original = routes.explainer
+    try:
+        routes.explainer = AIExplainer(api_key="test-key", base_url=base_url)
+        with tempfile.TemporaryDirectory() as workdir:
+            factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 1000)
+
+            def override_get_db():
+                with factory() as db:
+                    yield db
+
+            app = FastAPI()
+            app.include_router(routes.router)
+            app.dependency_overrides[get_db] = override_get_db
+
+            with TestClient(app) as client:
+                FakeOpenAI.calls = 0
+                profile = {"academic_score_band": "good", "preferred_countries": ["Ireland"]}
+                data = client.post("/recommendations", json={"student_profile": profile, "limit": 10, "explain": True}).json()
+                assert data["explanation"]["status"] == "pending"
+                assert "ai_explanation" not in data
+
+                job = client.get(data["explanation"]["url"]).json()
+                print(f"   job: {job['status']} {job['explanation']}")
+                assert job["status"] == "ready"
+                assert job["explanation"]["summary"] == "fake explanation"
+
+                # Cached run gets its own request_id: explanation is inline, no new LLM call
+                again = client.post("/recommendations", json={"student_profile": profile, "limit": 10, "explain": True}).json()
+                assert again["request_id"] != data["request_id"]
+                assert again["explanation"]["status"] == "ready"
+                assert client.get(again["explanation"]["url"]).json()["status"] == "ready"
+                assert again["ai_explanation"] == job["explanation"]
+                assert FakeOpenAI.calls == 1
+
+                assert client.get("/recommendations/unknown/explanation").status_code == 404
+    finally:
+        routes.explainer = original
+        server.shutdown()
+    print("✅ explain=true returns immediately and the explanation is pollable")
+
+
+def test_streamed_explanation():
+    server, base_url = _start_fake_server()
+    original = routes.explainer
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 1000)
+
+            def override_get_db():
+                with factory() as db:
+                    yield db
+
+            app = FastAPI()
+            app.include_router(routes.router)
+            app.dependency_overrides[get_db] = override_get_db
+            client = TestClient(app)
+            body = {"student_profile": {"academic_score_band": "good", "preferred_countries": ["Germany"]},
+                    "limit": 10, "explain": True, "format": "ndjson"}
+
+            def stream():
+                lines = [json.loads(line) for line in client.post("/recommendations", json=body).text.splitlines()]
+                return lines[0]["request_id"], [line for line in lines if line["type"] == "explanation"]
+
+            # Disabled explainer: no LLM attempt, no explanation event
+            routes.explainer = AIExplainer(api_key="test-key", base_url=base_url)
+            routes.explainer.client = routes.explainer.async_client = None
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                _, events = stream()
+            assert events == [] and "API key not found" not in output.getvalue()
+
+            routes.explainer = AIExplainer(api_key="test-key", base_url=base_url)
+            FakeOpenAI.calls = 0
+            request_id, events = stream()
+            assert [e["ai_explanation"]["summary"] for e in events] == ["fake explanation"]
+            assert client.get(f"/recommendations/{request_id}/explanation").json()["status"] == "ready"
+
+            # Repeated profile: new request_id, explanation from the cache through its job
+            again, events = stream()
+            assert again != request_id and len(events) == 1 and FakeOpenAI.calls == 1
+            assert client.get(f"/recommendations/{again}/explanation").json()["status"] == "ready"
+    finally:
+        routes.explainer = original
+        server.shutdown()
+    print("✅ Streamed explanations go through the explanation job path")
+
+
+def test_job_store_shared_across_workers():
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "explanations.db")
+        worker_a = ExplanationJobStore(maxsize=150, db_path=path)
+        worker_b = ExplanationJobStore(maxsize=150, db_path=path)
+        assert worker_a.shared and not ExplanationJobStore().shared
+
+        assert worker_a.submit("req-1") is True
+        assert worker_b.get("req-1")["status"] == "pending"
+        assert worker_b.submit("req-1") is False  # already started by worker A
+
+        worker_a.complete("req-1", {"summary": "shared"})
+        job = worker_b.get("req-1")
+        assert job["status"] == "ready" and job["explanation"] == {"summary": "shared"}
+        assert worker_b.submit("req-1") is False
+
+        # A failed job may be restarted by any worker, once
+        worker_b.fail("req-2", "timeout")
+        assert worker_a.get("req-2")["error"] == "timeout"
+        assert worker_a.submit("req-2") is True and worker_b.submit("req-2") is False
+
+        # Bounded: the least recently updated jobs are pruned
+        for i in range(300):
+            worker_a.complete(f"bulk-{i}", {"summary": str(i)})
+        assert len(worker_b) <= 250 and worker_b.get("bulk-299")["status"] == "ready"
+    print("✅ Explanation jobs in the SQLite tier are visible to every worker")
+
+
+def test_poll_on_another_worker():
+    server, base_url = _start_fake_server()
+    original = routes.explainer
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "explanations.db")
+            workers = []
+            for _ in range(2):
+                worker = AIExplainer(api_key="test-key", base_url=base_url)
+                worker.jobs = ExplanationJobStore(db_path=path)
+                workers.append(worker)
+            factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 1000)
+
+            def override_get_db():
+                with factory() as db:
+                    yield db
+
+            app = FastAPI()
+            app.include_router(routes.router)
+            app.dependency_overrides[get_db] = override_get_db
+
+            with TestClient(app) as client:
+                routes.explainer = workers[0]
+                profile = {"academic_score_band": "good", "preferred_countries": ["Canada"]}
+                data = client.post("/recommendations", json={"student_profile": profile, "limit": 10, "explain": True}).json()
+                # The poll is served by the other worker
+                routes.explainer = workers[1]
+                job = client.get(data["explanation"]["url"]).json()
+                assert job["status"] == "ready" and job["explanation"]["summary"] == "fake explanation"
+    finally:
+        routes.explainer = original
+        server.shutdown()
+    print("✅ A poll landing on another worker finds the explanation job")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 ASYNC EXPLANATION TEST")
+    print("=" * 60)
+    test_explain_async_concurrency_and_failures()
+    test_explain_endpoint_returns_immediately()
+    test_streamed_explanation()
+    test_job_store_shared_across_workers()
+    test_poll_on_another_worker()
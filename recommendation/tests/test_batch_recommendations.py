@@ -0,0 +1,89 @@
+"""
+Test POST /recommendations/batch (shared candidate pools, NDJSON stream).
+
+Run from backend directory:
+    python -m recommendation.tests.test_batch_recommendations
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from db import get_db
+from recommendation.benchmarks.synthetic import create_sqlite_catalog
+from recommendation.logic.contracts import StudentProfile
+from recommendation.logic.runner import run_recommendations
+from recommendation.routes import router, _serialize_output
+
+
+PROFILES = [
+    {"student_id": "a", "academic_score_band": "good", "preferred_countries": ["Ireland", "Canada"]},
+    {"student_id": "b", "academic_score_band": "average", "preferred_countries": ["IE", "CA"]},
+    {"student_id": "c", "target_degree_level": "bachelors", "preferred_countries": ["Germany"]},
+    {"student_id": "d", "academic_score_band": "excellent", "preferred_countries": ["ireland", "canada"],
+     "preferred_program_domains": ["Data Science"]},
+    {"student_id": "bad", "work_experience_years": "lots"},
+]
+
+
+def _comparable(result):
+    return {k: v for k, v in result.items() if k not in ("request_id", "summary")}
+
+
+def test_batch_recommendations():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 3000)
+
+        def override_get_db():
+            with factory() as db:
+                yield db
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(app)
+
+        statements = []
+        with factory() as db:
+            engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+
+        response = client.post("/recommendations/batch", json={"student_profiles": PROFILES, "limit": 30})
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        summary = lines[-1]
+        print(f"   summary: {summary}")
+        assert summary == {"type": "summary", "profiles": 5, "candidate_pools": 2, "failed": 1}
+
+        fetches = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        print(f"   pool fetch queries: {len(fetches)}")
+        assert len(fetches) == 2
+
+        results = {line["index"]: line for line in lines[:-1]}
+        assert results[4]["type"] == "error"
+
+        # Each batch result matches the single-profile pipeline
+        with factory() as db:
+            for index in range(4):
+                expected = _serialize_output(run_recommendations(db, StudentProfile(**PROFILES[index]), 30))
+                actual = results[index]["result"]
+                assert results[index]["student_id"] == PROFILES[index]["student_id"]
+                assert _comparable(json.loads(json.dumps(expected, default=str))) == _comparable(actual)
+                assert actual["summary"]["candidates_by_country"] == expected["summary"]["candidates_by_country"]
+    print("✅ Batch endpoint shares candidate pools and matches single-profile results")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 BATCH RECOMMENDATIONS TEST")
+    print("=" * 60)
+    test_batch_recommendations()
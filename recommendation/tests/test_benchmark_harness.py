@@ -0,0 +1,66 @@
+"""
+Smoke test for the recommendation benchmark harness and synthetic profiles.
+
+Run from backend directory:
+    python -m recommendation.tests.test_benchmark_harness
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from recommendation.benchmarks.synthetic import generate_profiles
+from recommendation.benchmarks.bench_recommendations import run, compare, percentile
+from recommendation.logic.contracts import StudentProfile
+
+
+def test_profiles_are_seeded_and_valid():
+    profiles = generate_profiles(50, seed=3)
+    assert profiles == generate_profiles(50, seed=3)
+    assert profiles != generate_profiles(50, seed=4)
+    for data in profiles:
+        StudentProfile(**data)
+    print("✅ Synthetic profiles are reproducible and valid StudentProfiles")
+
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile(samples, 99) == 99
+    assert percentile([7.0], 99) == 7.0
+    print("✅ Nearest-rank percentiles")
+
+
+def test_run_reports_json_and_detects_regressions():
+    with tempfile.TemporaryDirectory() as workdir:
+        results = run([300], requests=8, limit=20, warmup=1, seed=5, workdir=workdir)
+
+    # Machine-readable
+    results = json.loads(json.dumps(results))
+    result = results["sizes"]["300"]
+    assert result["requests"] == 8
+    assert result["throughput_rps"] > 0
+    assert {"p50_ms", "p95_ms", "p99_ms"} <= set(result["end_to_end"])
+    assert result["end_to_end"]["p50_ms"] <= result["end_to_end"]["p95_ms"] <= result["end_to_end"]["p99_ms"]
+    for stage in ("sql_fetch", "transform", "candidate_convert", "scoring", "diversity", "assembly"):
+        assert stage in result["stages"]
+
+    assert compare(results, results, max_regression=0.25) == []
+
+    slower = json.loads(json.dumps(results))
+    slower["sizes"]["300"]["end_to_end"]["p95_ms"] = max(results["sizes"]["300"]["end_to_end"]["p95_ms"], 1.0) * 2
+    regressions = compare(slower, results, max_regression=0.25)
+    assert len(regressions) == 1 and "end_to_end" in regressions[0]
+    print(f"✅ Harness output is JSON and flags regressions: {regressions[0]}")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 BENCHMARK HARNESS TEST")
+    print("=" * 60)
+    test_profiles_are_seeded_and_valid()
+    test_percentile_nearest_rank()
+    test_run_reports_json_and_detects_regressions()
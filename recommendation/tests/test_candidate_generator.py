@@ -0,0 +1,107 @@
+"""
+Test generate_candidates on the rec_* tables: one row per program, best intake.
+
+Run from backend directory:
+    python -m recommendation.tests.test_candidate_generator
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import inspect
+
+from recommendation.benchmarks.synthetic import create_rec_catalog
+from recommendation.logic.candidate_generator import (
+    ACTIVE_INTAKE_STATUSES,
+    CANDIDATE_INDEXES,
+    ensure_candidate_indexes,
+    generate_candidates,
+)
+from recommendation.logic.contracts import StudentProfile
+from recommendation.models import RecUniversity, RecProgram, RecIntake, RecEligibilitySnapshot
+
+
+def _expected_intake(intakes, profile):
+    """Reference pick: open < upcoming < active < NULL, then year, deadline, id."""
+    matching = [
+        i for i in intakes
+        if (i.intake_status in ACTIVE_INTAKE_STATUSES or i.intake_status is None)
+        and (not profile.target_intake_year or i.intake_year == profile.target_intake_year)
+        and (not profile.target_intake_term or profile.target_intake_term.lower() in i.intake_term.lower())
+    ]
+    status_rank = {status: rank for rank, status in enumerate(ACTIVE_INTAKE_STATUSES)}
+    return min(
+        matching,
+        key=lambda i: (status_rank.get(i.intake_status, len(ACTIVE_INTAKE_STATUSES)), i.intake_year,
+                       i.application_close_date is None, i.application_close_date, i.id),
+        default=None,
+    )
+
+
+def test_one_row_per_program_with_best_intake():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_rec_catalog(os.path.join(workdir, "rec.db"), 400, intakes_per_program=6, snapshots_per_intake=4)
+        with factory() as db:
+            intakes_by_program = {}
+            for intake in db.query(RecIntake):
+                intakes_by_program.setdefault(intake.program_id, []).append(intake)
+            programs = {p.id: p for p in db.query(RecProgram)}
+            countries = {u.id: u.country for u in db.query(RecUniversity)}
+            degree_types = {"masters": {"masters", "mba", "ms", "ma", "msc", "meng"}, "bachelors": {"bachelors", "bs", "ba", "bsc", "beng"}}
+            snapshots_by_intake = {}
+            for snapshot in db.query(RecEligibilitySnapshot):
+                snapshots_by_intake.setdefault(snapshot.intake_id, []).append(snapshot)
+
+            for profile in (
+                StudentProfile(target_degree_level="masters"),
+                StudentProfile(target_degree_level="masters", target_intake_year=2026, target_intake_term="fall"),
+                StudentProfile(target_degree_level="bachelors", preferred_countries=["Canada", "Ireland"]),
+            ):
+                candidates = generate_candidates(db, profile, max_candidates=50)
+                program_ids = [c.program_id for c in candidates]
+                qualifying = [
+                    p for p in programs.values()
+                    if p.degree_type in degree_types[profile.target_degree_level]
+                    and (not profile.preferred_countries or countries[p.university_id] in profile.preferred_countries)
+                    and _expected_intake(intakes_by_program[p.id], profile) is not None
+                ]
+                assert len(candidates) == min(50, len(qualifying)) > 0
+                assert len(set(program_ids)) == len(program_ids), "program returned more than once"
+
+                for candidate in candidates:
+                    best = _expected_intake(intakes_by_program[candidate.program_id], profile)
+                    assert candidate.intake_id == best.id
+                    latest = max(snapshots_by_intake[best.id], key=lambda s: (s.last_verified_at, s.id))
+                    assert candidate.academic_score_band == latest.academic_score_band
+                    assert candidate.language_score_band == latest.language_score_band
+    print("✅ One candidate per program with its best intake and latest snapshot")
+
+
+def test_indexes_created_on_existing_tables():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_rec_catalog(os.path.join(workdir, "rec.db"), 50)
+        with factory() as db:
+            bind = db.get_bind()
+            for index in CANDIDATE_INDEXES:
+                index.drop(bind=bind)
+            ensure_candidate_indexes(bind)
+            ensure_candidate_indexes(bind)  # idempotent
+
+            inspector = inspect(bind)
+            names = {
+                index["name"]
+                for model in (RecProgram, RecIntake, RecEligibilitySnapshot)
+                for index in inspector.get_indexes(model.__tablename__)
+            }
+            assert {index.name for index in CANDIDATE_INDEXES} <= names
+    print("✅ ensure_candidate_indexes adds the composite indexes to existing tables")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 CANDIDATE GENERATOR TEST")
+    print("=" * 60)
+    test_one_row_per_program_with_best_intake()
+    test_indexes_created_on_existing_tables()
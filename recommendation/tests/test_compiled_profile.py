@@ -0,0 +1,110 @@
+"""
+Test the compiled per-profile scorer inputs (compile_profile).
+
+Run from backend directory:
+    python -m recommendation.tests.test_compiled_profile
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from recommendation.logic.contracts import StudentProfile
+from recommendation.logic.records import CandidateRecord
+from recommendation.logic.aggregator import SCORERS, aggregate_scores, batch_aggregate
+from recommendation.logic.dimension_scorers import compile_profile, CompiledProfile
+
+
+PROFILE = StudentProfile(
+    academic_score_band="Good",
+    language_score_band="adequate",
+    background_field="Computer Science",
+    work_experience_years=3.5,
+    gap_years=1,
+    preferred_countries=["Ireland", "Canada"],
+    preferred_program_domains=["Data Science ", "AI"],
+    career_goals=[" Software Engineering"],
+    tuition_preference_band="unknown",
+    internship_importance="high",
+)
+
+
+def _candidate(**overrides) -> CandidateRecord:
+    fields = dict(
+        program_id=1,
+        university_id=1,
+        program_name="MSc Applied Data Science",
+        university_name="Test University",
+        country="Ireland",
+        academic_score_band="good",
+        language_score_band="adequate",
+        background_preference_tags=["computer engineering"],
+        work_experience_preference="preferred",
+        program_domain="Applied Data Science",
+        industry_alignment_tags=["software engineering", "fintech"],
+        tuition_fee_band="moderate",
+        global_reputation_band="high",
+        internship_opportunities="strong",
+    )
+    fields.update(overrides)
+    return CandidateRecord(**fields)
+
+
+def test_compile_hoists_profile_values():
+    compiled = compile_profile(PROFILE)
+    assert compile_profile(compiled) is compiled
+    assert compiled.profile is PROFILE
+    assert compiled.domains == (("data science ", "data science"), ("ai", "ai"))
+    assert compiled.career_goals == ("software engineering",)
+    assert compiled.background_key == "computer science"
+    assert compiled.background_words == frozenset({"computer", "science"})
+    assert compiled.internship_high is True
+    assert compiled.budget is None  # "unknown" = no budget preference
+    assert compiled.countries == frozenset({"IE", "CA"})  # country_key values
+    print("✅ compile_profile precomputes profile-only values and is idempotent")
+
+
+def test_compiled_matches_raw_profile():
+    candidates = [
+        _candidate(),
+        _candidate(program_id=2, country="Germany", program_domain="Mechanical Engineering",
+                   industry_alignment_tags=[], background_preference_tags=["biology"],
+                   work_experience_preference="required", tuition_fee_band="very_high"),
+    ]
+    compiled = compile_profile(PROFILE)
+    for candidate in candidates:
+        for name, scorer in SCORERS.items():
+            assert scorer(PROFILE, candidate) == scorer(compiled, candidate), name
+        assert aggregate_scores(PROFILE, candidate) == aggregate_scores(compiled, candidate)
+    assert batch_aggregate(PROFILE, candidates) == [aggregate_scores(PROFILE, c) for c in candidates]
+    print("✅ Scorers give identical results for raw and compiled profiles")
+
+
+def test_compiled_edge_cases():
+    compiled = compile_profile(PROFILE)
+    score, risks = SCORERS["program_fit"](compiled, _candidate())
+    # "data science " (unstripped) is not a substring, the stripped fuzzy match gives 0.7
+    # background only shares a word with "computer engineering" -> partial 0.7
+    assert score.explanation.startswith("Domain: 0.70")
+    assert score.explanation.endswith("Background: 0.70")
+    assert risks == []
+
+    score, risks = SCORERS["program_fit"](compiled, _candidate(background_preference_tags=["biology"]))
+    assert score.explanation.endswith("Background: 0.50")  # unmatched tag keeps the default
+    assert risks == []
+
+    empty = compile_profile(StudentProfile())
+    assert isinstance(empty, CompiledProfile)
+    assert empty.background_key is None and empty.domains == () and empty.countries == frozenset()
+    score, _ = SCORERS["location_preference"](empty, _candidate())
+    assert score.score == 0.7
+    print("✅ Stripping, partial matches and empty profiles behave as before")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 COMPILED PROFILE TEST")
+    print("=" * 60)
+    test_compile_hoists_profile_values()
+    test_compiled_matches_raw_profile()
+    test_compiled_edge_cases()
@@ -0,0 +1,123 @@
+"""
+Test the country registry, canonical country keys and their backfill.
+
+Run from backend directory:
+    python -m recommendation.tests.test_country_registry
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from recommendation.benchmarks.synthetic import create_rec_catalog, create_sqlite_catalog
+from recommendation.logic.candidate_generator import generate_candidates
+from recommendation.logic.contracts import StudentProfile
+from recommendation.logic.countries import BY_CODE, COUNTRIES, country_key, resolve_country
+from recommendation.logic.adapter import fetch_and_transform_programs
+from recommendation.models import RecCatalogVersion, RecProgramFeature, RecUniversity
+from recommendation.services.catalog_version import get_catalog_version
+from recommendation.services.country_keys import ensure_country_keys
+
+
+def test_registry():
+    assert len(COUNTRIES) == 249
+    assert len({c.code for c in COUNTRIES}) == len({c.alpha3 for c in COUNTRIES}) == 249
+
+    for value in ("IE", "ie", "IRL", "Ireland", " ireland ", "Republic of Ireland"):
+        assert country_key(value) == "IE", value
+    for value in ("US", "USA", "U.S.A.", "United States", "United States of America"):
+        assert country_key(value) == "US", value
+    assert country_key("UK") == country_key("Great Britain") == "GB"
+    assert resolve_country("JP").name == "Japan"
+    # Unrecognized values still get a stable key; empty stays empty
+    assert country_key("Atlantis") == "atlantis"
+    assert country_key(None) == country_key("") == ""
+
+    try:
+        BY_CODE["XX"] = COUNTRIES[0]
+        assert False, "registry must be immutable"
+    except TypeError:
+        pass
+    print("✅ 249 ISO countries; codes, names and aliases share one key")
+
+
+def test_filters_use_canonical_keys():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 1000)
+        with factory() as db:
+            by_code = fetch_and_transform_programs(db, limit=30, country_filter="IE", target_degree_level="masters")
+            by_alias = fetch_and_transform_programs(db, limit=30, country_filter="IRL", target_degree_level="masters")
+            assert by_code and [p["program_id"] for p in by_code] == [p["program_id"] for p in by_alias]
+
+        factory = create_rec_catalog(os.path.join(workdir, "rec.db"), 300)
+        with factory() as db:
+            by_name = generate_candidates(db, StudentProfile(target_degree_level="masters", preferred_countries=["Canada"]))
+            by_code = generate_candidates(db, StudentProfile(target_degree_level="masters", preferred_countries=["CA"]))
+            assert by_name and [c.program_id for c in by_name] == [c.program_id for c in by_code]
+            assert {c.country for c in by_name} == {"Canada"}
+    print("✅ program and university filters match codes, names and aliases alike")
+
+
+def test_backfill_of_stale_keys():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 500)
+        with factory() as db:
+            expected = dict(db.query(RecProgramFeature.program_id, RecProgramFeature.country_key))
+            # Keys as stored before the registry: lower-cased country names
+            db.execute(text("UPDATE rec_program_features SET country_key = lower(country)"))
+            db.execute(text("UPDATE rec_program_features SET country = 'JP', country_key = 'jp' WHERE program_id = '1'"))
+            db.commit()
+            version = get_catalog_version(db)
+
+            assert ensure_country_keys(db) == 500
+            assert ensure_country_keys(db) == 0  # idempotent
+            assert get_catalog_version(db) == version + 1
+
+            stored = {f.program_id: f for f in db.query(RecProgramFeature)}
+            assert all(stored[pid].country_key == key for pid, key in expected.items() if pid != "1")
+            assert (stored["1"].country, stored["1"].country_key) == ("Japan", "JP")
+
+        # rec_universities created before the country_key column existed
+        engine = create_engine(f"sqlite:///{os.path.join(workdir, 'old.db')}", future=True)
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE rec_universities (id INTEGER PRIMARY KEY, name VARCHAR, country VARCHAR)"))
+            conn.execute(text("INSERT INTO rec_universities (id, name, country) VALUES "
+                              "(1, 'A', 'Ireland'), (2, 'B', 'IE'), (3, 'C', 'Canada'), (4, 'D', NULL)"))
+            RecProgramFeature.__table__.create(bind=conn)
+            RecCatalogVersion.__table__.create(bind=conn)
+        with sessionmaker(bind=engine, future=True)() as db:
+            assert ensure_country_keys(db) == 4
+            assert "ix_rec_universities_country_key" in {i["name"] for i in inspect(engine).get_indexes("rec_universities")}
+            keys = dict(db.query(RecUniversity.id, RecUniversity.country_key))
+            assert keys == {1: "IE", 2: "IE", 3: "CA", 4: ""}
+    print("✅ ensure_country_keys re-derives stale keys and adds the university column")
+
+
+def test_university_writes_derive_key():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_rec_catalog(os.path.join(workdir, "rec.db"), 50)
+        with factory() as db:
+            university = RecUniversity(name="New University", country="Republic of Ireland")
+            db.add(university)
+            db.commit()
+            assert university.country_key == "IE"
+            assert ensure_country_keys(db) == 0  # nothing left for the backfill
+
+            university.country = "DEU"
+            db.commit()
+            assert db.query(RecUniversity.country_key).filter_by(id=university.id).scalar() == "DE"
+    print("✅ rec_universities.country_key is set on insert and update")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 COUNTRY REGISTRY TEST")
+    print("=" * 60)
+    test_registry()
+    test_filters_use_canonical_keys()
+    test_backfill_of_stale_keys()
+    test_university_writes_derive_key()
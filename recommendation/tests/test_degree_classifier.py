@@ -0,0 +1,80 @@
+"""
+Test the degree level classifier: whole-token matching, label precedence,
+confidence and memoization.
+
+Run from backend directory:
+    python -m recommendation.tests.test_degree_classifier
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from recommendation.logic.adapter import normalize_degree_level
+from recommendation.logic.degree_classifier import classify_degree
+
+
+def test_abbreviations_match_whole_tokens_only():
+    cases = {
+        # Short abbreviations inside unrelated words used to win
+        "Bachelor of Arts in Mathematics": "bachelors",
+        "Postgraduate Diploma in Marketing": "diploma",
+        "Graduate Certificate in Business Analytics": "diploma",
+        "Mathematics": "unknown",
+        "Systems Biology": "unknown",
+        # Abbreviations as tokens, with and without dots
+        "MA Economics": "masters",
+        "M.Sc. Physics": "masters",
+        "Business Analytics MS": "masters",
+        "MBA - Finance": "masters",
+        "BA (Hons) English": "bachelors",
+        "B.S. Computer Science": "bachelors",
+        "Ph.D. Chemistry": "phd",
+        "Master’s in Management": "masters",
+        "Doctor of Philosophy in History": "phd",
+        "": "unknown",
+    }
+    for text, expected in cases.items():
+        assert classify_degree(text).level == expected, (text, classify_degree(text))
+        assert normalize_degree_level(text) == expected
+    assert normalize_degree_level(None) == "unknown"
+    print(f"✅ {len(cases)} labels classified on whole tokens")
+
+
+def test_label_decides_and_confidence():
+    by_label = classify_degree("Bachelor's Degree", "Bachelor of Science in Mathematics")
+    assert (by_label.level, by_label.confidence, by_label.source) == ("bachelors", 1.0, "degree_text")
+
+    by_name = classify_degree("", "MSc Data Science")
+    assert by_name.level == "masters" and by_name.source == "program_name"
+    assert 0 < by_name.confidence < classify_degree("MSc", "").confidence < by_label.confidence
+
+    # The label wins over a conflicting program name
+    assert classify_degree("Doctoral Degree", "MSc Research Track").level == "phd"
+
+    # Several levels in one text: precedence, lower confidence
+    mixed = classify_degree("", "Integrated Master's and Bachelor's in Engineering")
+    assert mixed.level == "masters" and mixed.confidence < classify_degree("", "Master's in Engineering").confidence
+
+    unknown = classify_degree("", "Computer Science")
+    assert (unknown.level, unknown.confidence, unknown.source) == ("unknown", 0.0, None)
+    print("✅ degree label takes precedence, confidence reflects the evidence")
+
+
+def test_memoized():
+    classify_degree.cache_clear()
+    first = classify_degree("Master's Degree", "MSc Finance")
+    second = classify_degree("Master's Degree", "MSc Finance")
+    assert first is second
+    info = classify_degree.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    print("✅ repeated (label, name) pairs are served from the memo")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 DEGREE CLASSIFIER TEST")
+    print("=" * 60)
+    test_abbreviations_match_whole_tokens_only()
+    test_label_decides_and_confidence()
+    test_memoized()
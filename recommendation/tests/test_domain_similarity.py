@@ -0,0 +1,143 @@
+"""
+Test the offline domain similarity model and its use by the program-fit scorers.
+
+Run from backend directory:
+    python -m recommendation.tests.test_domain_similarity
+"""
+
+import sys
+import os
+import math
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from recommendation.logic import columnar
+from recommendation.logic.aggregator import aggregate_scores
+from recommendation.logic.contracts import CandidateProgram, StudentProfile
+from recommendation.logic.dimension_scorers import compile_profile
+from recommendation.logic.domain_similarity import (
+    DomainModelStore, DomainSimilarityModel, ProfileSimilarity, build_model, domain_model,
+)
+from recommendation.benchmarks.synthetic import create_rec_catalog
+from recommendation.services.catalog_version import get_catalog_version
+from recommendation.services.domain_model import build_domain_model
+
+DOCUMENTS = [
+    "MSc Data Analytics data analytics software engineering",
+    "BSc Computer Science computer science machine learning",
+    "MBA Finance finance consulting",
+    "MSc Data Science data science",
+    "BA Economics economics",
+]
+TERMS = ["Data Analytics", "Computer Science", "Finance", "Consulting", "Software Engineering",
+         "Data Science", "Economics", "Machine Learning"]
+
+PROFILE = StudentProfile(
+    background_field="Mathematics",
+    preferred_program_domains=["Computer Engineering"],
+    career_goals=["Business Analytics", "Software Engineer"],
+)
+
+
+def _cosine(a, b):
+    weights = dict(zip(*b))
+    return sum(w * weights.get(f, 0.0) for f, w in zip(*a))
+
+
+def test_model_round_trip():
+    model = build_model(DOCUMENTS, TERMS + ["data science ", ""])
+    assert model.terms == sorted({t.lower() for t in TERMS})  # deduplicated, empty dropped
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "model.npz")
+        model.save(path)
+        loaded = DomainSimilarityModel.load(path)
+    assert loaded.terms == model.terms and loaded.idf == model.idf
+
+    queries = [loaded.vectorize("business analytics"), loaded.vectorize("computing"), loaded.vectorize("")]
+    table = loaded.similarities(queries)
+    for row, term in enumerate(loaded.terms):
+        vector = loaded.vectorize(term)
+        assert math.isclose(_cosine(vector, vector), 1.0, rel_tol=1e-6)
+        for column, query in enumerate(queries):
+            assert abs(table[row, column] - _cosine(query, vector)) < 1e-5
+    print(f"✅ {len(loaded)} terms saved, reloaded and scored in one product")
+
+
+def test_matcher_uses_similarity():
+    model = build_model(DOCUMENTS, TERMS)
+    similarity = ProfileSimilarity(model, ["computer engineering"], ["business analytics", "software engineer"])
+    assert similarity.domain("Computer Science") > similarity.domain("Finance")
+    # Terms missing from the model are vectorized on the fly
+    assert abs(similarity.domain("computing") - _cosine(
+        model.vectorize("computer engineering"), model.vectorize("computing"))) < 1e-9
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "model.npz")
+        baseline = compile_profile(PROFILE).tags
+        previous, domain_model.path = domain_model.path, path
+        try:
+            assert domain_model.get() is None  # no file, no model
+            model.save(path)
+            tags = compile_profile(PROFILE).tags
+        finally:
+            domain_model.path = previous
+
+    assert baseline.domain_match("Computer Science") == 0.5
+    assert 0.5 < tags.domain_match("Computer Science") <= 0.9
+    assert tags.domain_match("Finance") == 0.5
+    assert baseline.career_counts(["Data Analytics"]) == (0, 0)
+    assert tags.career_counts(["Data Analytics", "Software Engineering"]) == (2, 2)
+    print("✅ similar domains and goal / tag pairs match only with a model")
+
+
+def test_columnar_matches_scalar_with_model():
+    candidates = [
+        CandidateProgram(
+            program_id=i + 1,
+            university_id=i // 3 + 1,
+            program_domain=TERMS[i % len(TERMS)],
+            industry_alignment_tags=[TERMS[(i * 3) % len(TERMS)], TERMS[(i * 5) % len(TERMS)]],
+            background_preference_tags=["Applied Mathematics"] if i % 2 else [],
+        )
+        for i in range(300)
+    ]
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "model.npz")
+        build_model(DOCUMENTS, TERMS).save(path)
+        previous, domain_model.path = domain_model.path, path
+        try:
+            scores = columnar.score_columns(PROFILE, columnar.encode_candidates(candidates))
+            for i, candidate in enumerate(candidates):
+                expected = aggregate_scores(PROFILE, candidate)
+                for dimension in ("program_fit", "career_alignment"):
+                    assert abs(scores.dimensions[dimension][i] - expected.dimension_scores[dimension].score) < 1e-9
+        finally:
+            domain_model.path = previous
+    print("✅ columnar and per-candidate scores agree with a model loaded")
+
+
+def test_build_from_catalog():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_rec_catalog(os.path.join(workdir, "rec.db"), 300)
+        path = os.path.join(workdir, "model.npz")
+        with factory() as db:
+            version = get_catalog_version(db)
+            count = build_domain_model(db, path, n_features=1 << 16)
+            assert get_catalog_version(db) == version + 1
+
+        store = DomainModelStore(path)
+        model = store.get()
+        assert model is not None and len(model) == count > 0
+        assert store.get() is model  # loaded once while the file is unchanged
+    print(f"✅ model built from the rec catalog: {count} terms")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 DOMAIN SIMILARITY TEST")
+    print("=" * 60)
+    test_model_round_trip()
+    test_matcher_uses_similarity()
+    test_columnar_matches_scalar_with_model()
+    test_build_from_catalog()
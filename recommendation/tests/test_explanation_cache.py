@@ -0,0 +1,76 @@
+"""
+Test the content-addressed AI explanation cache (memory LRU + shared SQLite tier).
+
+Run from backend directory:
+    python -m recommendation.tests.test_explanation_cache
+"""
+
+import sys
+import os
+import json
+import asyncio
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from recommendation.ai.explainer import AIExplainer
+from recommendation.ai.explanation_cache import ExplanationCache
+
+
+PROFILE = {"target_degree_level": "masters", "preferred_countries": ["Ireland"], "academic_score_band": "good"}
+
+
+def _engine_output(top_program_id):
+    return {
+        "summary": {"total_evaluated": 40, "total_eligible": 30},
+        "warnings": [],
+        "recommendations": [
+            {"program_id": top_program_id, "university_name": "U1", "total_score": 0.81},
+            {"program_id": 2, "university_name": "U2", "total_score": 0.74},
+        ],
+    }
+
+
+def test_memory_cap_and_disk_tier():
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "explanations.db")
+        value = {"summary": "x" * 100}
+        size = len(json.dumps(value))
+
+        cache = ExplanationCache(max_bytes=size * 2, db_path=path)
+        for key in ("a", "b", "c"):
+            cache.set(key, value)
+        stats = cache.stats()
+        assert stats["entries"] == 2 and stats["evictions"] == 1
+        assert cache.get("a") == value            # evicted from memory, served from disk
+        assert cache.stats()["disk_hits"] == 1
+
+        # A second worker process sees the same SQLite tier
+        other_worker = ExplanationCache(max_bytes=size * 2, db_path=path)
+        assert other_worker.get("c") == value
+        assert other_worker.get("missing") is None
+        print(f"   {other_worker.stats()}")
+    print("✅ Memory tier is byte-capped and SQLite tier is shared")
+
+
+def test_content_addressed_keys():
+    explainer = AIExplainer(api_key="test-key", base_url="http://127.0.0.1:9/v1")
+    key, _ = explainer._prepare(PROFILE, _engine_output(1))
+    same_key, _ = explainer._prepare({**PROFILE, "student_id": "other"}, _engine_output(1))
+    other_key, _ = explainer._prepare(PROFILE, _engine_output(99))
+    assert key == same_key
+    assert key != other_key
+
+    # Cache hit for a brand-new request_id: no LLM call (the base_url is unreachable)
+    explainer.cache.set(key, {"summary": "cached"})
+    result = asyncio.run(explainer.explain_async("fresh-request-id", PROFILE, _engine_output(1)))
+    assert result == {"summary": "cached"}
+    assert explainer.jobs.get("fresh-request-id")["status"] == "ready"
+    print("✅ Explanations are keyed by prompt inputs, not request_id")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 EXPLANATION CACHE TEST")
+    print("=" * 60)
+    test_memory_cap_and_disk_tier()
+    test_content_addressed_keys()
@@ -0,0 +1,136 @@
+"""
+Test cursor pagination over stored ranked lists (GET /recommendations/{request_id}).
+
+Run from backend directory:
+    python -m recommendation.tests.test_pagination
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from db import get_db
+from recommendation.benchmarks.synthetic import create_sqlite_catalog
+from recommendation.routes import router
+from recommendation.logic.pagination import encode_cursor, decode_cursor, ranked_lists
+from recommendation.logic.result_cache import result_cache
+
+
+PROFILE = {
+    "academic_score_band": "good",
+    "language_score_band": "good",
+    "background_field": "Computer Science",
+    "preferred_countries": ["Ireland", "Germany"],
+}
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("abc-123", 40, 20)
+    assert decode_cursor("abc-123", cursor) == (40, 20)
+    for bad in ("not-a-cursor", encode_cursor("other", 40, 20), encode_cursor("abc-123", -1, 20)):
+        try:
+            decode_cursor("abc-123", bad)
+            assert False, bad
+        except ValueError:
+            pass
+    print("✅ Cursors round-trip and are bound to their request_id")
+
+
+def test_pages_cover_the_ranked_list():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 1000)
+        calls = {"db": 0}
+
+        def override_get_db():
+            calls["db"] += 1
+            with factory() as db:
+                yield db
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(app)
+        result_cache.clear()
+        ranked_lists.clear()
+
+        full = client.post("/recommendations", json={"student_profile": PROFILE, "limit": 50}).json()
+        assert "next_cursor" not in full  # unchanged without page_size
+        result_cache.clear()
+
+        first = client.post("/recommendations", json={"student_profile": PROFILE, "limit": 50, "page_size": 15}).json()
+        # The list covers every eligible program of the pool, not just the first `limit`
+        total = full["summary"]["total_eligible"]
+        assert total > len(full["recommendations"]) == 50
+        assert first["page"] == {"offset": 0, "page_size": 15, "total": total}
+        assert len(first["recommendations"]) == 15
+
+        # Walk the cursors: no DB session, and the pages concatenate to the full list
+        db_calls = calls["db"]
+        pages = [first]
+        while pages[-1]["next_cursor"]:
+            pages.append(client.get(f"/recommendations/{first['request_id']}", params={"cursor": pages[-1]["next_cursor"]}).json())
+        assert calls["db"] == db_calls
+        walked = [r for page in pages for r in page["recommendations"]]
+        assert [r["rank"] for r in walked] == list(range(1, total + 1))
+        strip = lambda recs: [(r["program_id"], r["total_score"]) for r in recs]
+        assert strip(walked[:50]) == strip(full["recommendations"])
+        # Pages past `limit` are the ranking a run with a larger limit returns
+        longer = client.post("/recommendations", json={"student_profile": PROFILE, "limit": total}).json()
+        assert walked == longer["recommendations"]
+        print(f"   {total} recommendations in {len(pages)} pages (limit 50)")
+
+        # First page without a cursor, other routes are not shadowed
+        assert client.get(f"/recommendations/{first['request_id']}", params={"page_size": 5}).json()["page"]["page_size"] == 5
+        assert "stages" in client.get("/recommendations/metrics").json()
+        assert client.get("/recommendations/health").json()["status"] == "ok"
+
+        assert client.get("/recommendations/missing").status_code == 404
+        bad = encode_cursor("missing", 15, 15)
+        assert client.get(f"/recommendations/{first['request_id']}", params={"cursor": bad}).status_code == 400
+    print("✅ Cursor pages cover the whole ranked list without DB access")
+
+
+def test_shared_profile_gets_own_request_ids():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 1000)
+
+        def override_get_db():
+            with factory() as db:
+                yield db
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(app)
+        result_cache.clear()
+        ranked_lists.clear()
+
+        body = {"limit": 30, "page_size": 5}
+        alice = client.post("/recommendations", json={**body, "student_profile": {**PROFILE, "student_id": "alice"}}).json()
+        # Same profile: served from the result cache, but as bob's own run
+        bob = client.post("/recommendations", json={**body, "student_profile": {**PROFILE, "student_id": "bob"}}).json()
+        assert bob["summary"]["cached"] is True
+        assert bob["request_id"] != alice["request_id"]
+        assert [r["program_id"] for r in bob["recommendations"]] == [r["program_id"] for r in alice["recommendations"]]
+
+        for student, first in (("alice", alice), ("bob", bob)):
+            page = client.get(f"/recommendations/{first['request_id']}", params={"cursor": first["next_cursor"]}).json()
+            assert page["student_id"] == student and page["page"]["offset"] == 5
+            # The what-if run is reachable under each caller's id
+            what_if = client.post(f"/recommendations/{first['request_id']}/what-if",
+                                  json={"profile_delta": {"language_score_band": "native"}})
+            assert what_if.status_code == 200
+    print("✅ Callers sharing a cached profile page through their own ranked lists")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 PAGINATION TEST")
+    print("=" * 60)
+    test_cursor_round_trip()
+    test_pages_cover_the_ranked_list()
+    test_shared_profile_gets_own_request_ids()
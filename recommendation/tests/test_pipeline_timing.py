@@ -0,0 +1,108 @@
+"""
+Test per-stage pipeline timings (summary.timings) and GET /recommendations/metrics.
+
+Run from backend directory:
+    python -m recommendation.tests.test_pipeline_timing
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from db import get_db
+from recommendation.benchmarks.synthetic import create_sqlite_catalog
+from recommendation.routes import router
+from recommendation.logic.result_cache import result_cache
+from recommendation.logic.timing import PipelineTimer, StageHistogram, pipeline_metrics
+
+
+PROFILE = {"student_id": "timed", "academic_score_band": "good", "preferred_countries": ["Ireland", "Canada"]}
+PIPELINE_STAGES = ["cache_lookup", "sql_fetch", "transform", "degree_filter", "candidate_convert",
+                   "scoring", "diversity", "assembly", "serialization"]
+
+
+def test_timer_accumulates_stages():
+    now = [0.0]
+    timer = PipelineTimer(clock=lambda: now[0])
+    for _ in range(2):
+        with timer.stage("sql_fetch", items=10):
+            now[0] += 0.004
+    timer.count("sql_fetch", 5)
+
+    timings = timer.as_dict()
+    assert timings["stages"]["sql_fetch"] == {"ms": 8.0, "items": 25}
+    assert timings["total_ms"] == 8.0
+    print("✅ Repeated stages accumulate time and items")
+
+
+def test_histogram_quantiles():
+    histogram = StageHistogram()
+    for ms in [1.0] * 90 + [40.0] * 8 + [3000.0] * 2:
+        histogram.observe(ms)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 100
+    assert snapshot["p50_ms"] <= 1.0
+    assert 25.0 < snapshot["p95_ms"] <= 50.0
+    assert 2500.0 < snapshot["p99_ms"] <= 3000.0
+    assert snapshot["max_ms"] == 3000.0
+    assert sum(snapshot["buckets"].values()) == 100
+    print(f"✅ Histogram quantiles: p50={snapshot['p50_ms']} p95={snapshot['p95_ms']} p99={snapshot['p99_ms']}")
+
+
+def test_summary_timings_and_metrics_endpoint():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 2000)
+
+        def override_get_db():
+            with factory() as db:
+                yield db
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(app)
+        result_cache.clear()
+        pipeline_metrics.reset()
+
+        plain = client.post("/recommendations", json={"student_profile": PROFILE, "limit": 20}).json()
+        assert "timings" not in plain["summary"]
+
+        profile = {**PROFILE, "student_id": "timed-2", "preferred_countries": ["Germany"]}
+        timed = client.post("/recommendations", json={"student_profile": profile, "limit": 20, "timings": True}).json()
+        stages = timed["summary"]["timings"]["stages"]
+        print(f"   stages: { {name: stage['ms'] for name, stage in stages.items()} }")
+        assert list(stages) == PIPELINE_STAGES
+        assert stages["sql_fetch"]["items"] == timed["summary"]["total_evaluated"]
+        assert stages["serialization"]["items"] == len(timed["recommendations"])
+        assert timed["summary"]["timings"]["total_ms"] >= sum(stage["ms"] for stage in stages.values())
+
+        # Cache hits only time the lookup, and the cached entry never stores timings
+        hit = client.post("/recommendations", json={"student_profile": profile, "limit": 20, "timings": True}).json()
+        assert hit["summary"]["cached"] is True
+        assert list(hit["summary"]["timings"]["stages"]) == ["cache_lookup"]
+        again = client.post("/recommendations", json={"student_profile": profile, "limit": 20}).json()
+        assert "timings" not in again["summary"]
+
+        simple = client.post("/recommendations", json={"student_profile": PROFILE, "format": "simple", "timings": True}).json()
+        assert "serialization" in simple["summary"]["timings"]["stages"]
+
+        metrics = client.get("/recommendations/metrics").json()
+        assert metrics["requests"]["count"] == 5
+        assert metrics["stages"]["cache_lookup"]["count"] == 5
+        assert metrics["stages"]["scoring"]["count"] == 3
+        assert metrics["stages"]["scoring"]["p99_ms"] > 0
+    print("✅ summary.timings is opt-in and /recommendations/metrics aggregates every request")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 PIPELINE TIMING TEST")
+    print("=" * 60)
+    test_timer_accumulates_stages()
+    test_histogram_quantiles()
+    test_summary_timings_and_metrics_endpoint()
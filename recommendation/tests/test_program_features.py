@@ -0,0 +1,139 @@
+"""
+Test materialized program features (services/program_features.py).
+
+Run from backend directory:
+    python -m recommendation.tests.test_program_features
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from models.models import Program, UniversityModel
+from recommendation.benchmarks.synthetic import create_sqlite_catalog, generate_catalog
+from recommendation.logic.adapter import country_key
+from recommendation.models import RecProgramFeature
+from recommendation.services import program_features
+from recommendation.services.catalog_version import get_catalog_version
+from recommendation.services.program_features import (
+    build_program_feature,
+    ensure_program_features,
+    refresh_program_features,
+)
+
+
+def _features(db):
+    return {f.program_id: f for f in db.query(RecProgramFeature)}
+
+
+def test_upsert_writes_and_updates_feature():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 0)
+        entry = generate_catalog(1, seed=3)["programs"][0]
+        with factory() as db:
+            program = Program.upsert(db, entry)
+            db.commit()
+            feature = _features(db)[entry["id"]]
+            expected = build_program_feature(program)
+            assert feature.program_name == expected["program_name"] == entry["attributes"]["name"]
+            assert feature.country_key == country_key(entry["attributes"]["school"]["country"])
+            assert feature.normalized_degree_level == expected["normalized_degree_level"]
+
+            # Updating the program rewrites its feature row in the same transaction
+            entry["attributes"] = {**entry["attributes"], "name": "MSc Renamed Program"}
+            Program.upsert(db, entry)
+            db.commit()
+            db.expire_all()
+            features = _features(db)
+            assert len(features) == 1 and features[entry["id"]].program_name == "MSc Renamed Program"
+    print("✅ Program.upsert writes and updates the feature row")
+
+
+def test_build_error_does_not_block_upsert():
+    def broken(program):
+        raise ValueError("malformed attributes")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 0)
+        entry = generate_catalog(1, seed=5)["programs"][0]
+        original = program_features.build_program_feature
+        program_features.build_program_feature = broken
+        try:
+            with factory() as db:
+                Program.upsert(db, entry)
+                db.commit()
+                assert db.query(Program).filter_by(id=entry["id"]).one().attributes == entry["attributes"]
+                assert _features(db) == {}
+        finally:
+            program_features.build_program_feature = original
+    print("✅ A feature build error is logged and the program is still upserted")
+
+
+def test_catalog_version_bumped_once_per_commit():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 0)
+        catalog = generate_catalog(30, seed=9)
+        with factory() as db:
+            version = get_catalog_version(db)
+            for entry in catalog["universities"]:
+                UniversityModel.upsert(db, entry)
+            for entry in catalog["programs"]:
+                Program.upsert(db, entry)
+            assert get_catalog_version(db) == version  # not bumped per row
+            db.commit()
+            assert get_catalog_version(db) == version + 1
+
+            db.commit()  # nothing changed
+            Program.upsert(db, catalog["programs"][0])
+            db.rollback()  # a rolled back change does not bump
+            db.commit()
+            assert get_catalog_version(db) == version + 1
+    print("✅ An import transaction bumps the catalog version once")
+
+
+def test_refresh_pages_through_batches():
+    with tempfile.TemporaryDirectory() as workdir:
+        # Ids "1".."23" are strings: keyset order is "1", "10", "11", ..., "2", "20", ...
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 23)
+        with factory() as db:
+            expected = {pid: f.program_name for pid, f in _features(db).items()}
+            db.query(RecProgramFeature).delete()
+            db.commit()
+
+            assert refresh_program_features(db, batch_size=5) == 23
+            assert {pid: f.program_name for pid, f in _features(db).items()} == expected
+
+            # A subset is refreshed across batches too
+            assert refresh_program_features(db, program_ids=[3, "12", "20", "7"], batch_size=2) == 4
+            assert refresh_program_features(db, program_ids=["missing"]) == 0
+            assert len(_features(db)) == 23
+    print("✅ refresh_program_features pages through every program by keyset")
+
+
+def test_ensure_is_noop_once_populated():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 12)
+        with factory() as db:
+            assert ensure_program_features(db) == 0  # populated with the catalog
+            db.query(RecProgramFeature).delete()
+            db.commit()
+            assert ensure_program_features(db) == 12
+            assert ensure_program_features(db) == 0
+
+            db.query(RecProgramFeature).delete()
+            db.query(Program).delete()
+            db.commit()
+            assert ensure_program_features(db) == 0  # nothing to backfill
+    print("✅ ensure_program_features backfills an empty table only")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 PROGRAM FEATURES TEST")
+    print("=" * 60)
+    test_upsert_writes_and_updates_feature()
+    test_build_error_does_not_block_upsert()
+    test_catalog_version_bumped_once_per_commit()
+    test_refresh_pages_through_batches()
+    test_ensure_is_noop_once_populated()
@@ -0,0 +1,109 @@
+"""
+Test get_programs_by_university: indexed programs.school_id lookup with pagination.
+
+Run from backend directory:
+    python -m recommendation.tests.test_programs_by_university
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from collections import Counter
+
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from models.models import Program, UniversityModel
+from recommendation.benchmarks.synthetic import create_sqlite_catalog, generate_catalog
+from recommendation.logic import adapter
+from recommendation.logic.adapter import get_programs_by_university, transform_program
+from recommendation.services.program_features import ensure_program_school_ids
+
+
+def test_all_programs_of_a_university():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 3000)
+        with factory() as db:
+            by_school = {}
+            for program in db.query(Program).order_by(Program.id):
+                by_school.setdefault(Program.school_id_from(program.attributes), []).append(program)
+            # A university whose programs are spread across the whole table
+            school_id, programs = max(by_school.items(), key=lambda item: len(item[1]))
+            university = db.query(UniversityModel).filter(UniversityModel.id == school_id).first()
+            expected = [transform_program(p, university) for p in programs]
+
+            everything = get_programs_by_university(db, school_id, limit=len(programs) + 10)
+            assert everything == expected
+
+            pages = []
+            for offset in range(0, len(programs), 4):
+                pages.extend(get_programs_by_university(db, school_id, limit=4, offset=offset))
+            assert pages == expected
+
+            assert get_programs_by_university(db, "no-such-school") == []
+    print(f"✅ {len(programs)} programs of university {school_id} returned, also page by page")
+
+
+def test_only_the_page_is_transformed():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 1000)
+        with factory() as db:
+            school_id, _ = Counter(p.school_id for p in db.query(Program)).most_common(1)[0]
+
+            calls = []
+            original = adapter.transform_program
+            adapter.transform_program = lambda *args: calls.append(args) or original(*args)
+            statements = []
+            event.listen(db.get_bind(), "before_cursor_execute",
+                         lambda conn, cursor, statement, parameters, *args: statements.append((statement, parameters)))
+            try:
+                results = get_programs_by_university(db, school_id, limit=3)
+            finally:
+                adapter.transform_program = original
+
+            assert len(results) == len(calls) == 3
+            statement, parameters = next(s for s in statements if "FROM programs" in s[0])
+            plan = " ".join(
+                row[-1] for row in db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            )
+            assert "ix_programs_school_id" in plan, plan
+    print("✅ one index range read, transform_program only on the returned page")
+
+
+def test_school_ids_backfilled_on_existing_table():
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = create_engine(f"sqlite:///{os.path.join(workdir, 'old.db')}", future=True)
+        factory = sessionmaker(bind=engine, future=True)
+        catalog = generate_catalog(300, seed=7)
+        with engine.begin() as conn:
+            # programs as created before the school_id column existed
+            conn.execute(text("CREATE TABLE programs (id VARCHAR PRIMARY KEY, type VARCHAR, attributes VARCHAR)"))
+            conn.execute(
+                text("INSERT INTO programs (id, type, attributes) VALUES (:id, :type, :attributes)"),
+                [{**entry, "attributes": Program.attributes.type.process_bind_param(entry["attributes"], None)}
+                 for entry in catalog["programs"]],
+            )
+            conn.execute(text("INSERT INTO programs (id, type, attributes) VALUES ('no-school', 'programs', '{}')"))
+
+        with factory() as db:
+            assert ensure_program_school_ids(db, batch_size=64) == 300
+            assert ensure_program_school_ids(db, batch_size=64) == 0  # idempotent
+
+            names = {index["name"] for index in inspect(engine).get_indexes("programs")}
+            assert "ix_programs_school_id" in names
+            stored = dict(db.query(Program.id, Program.school_id))
+            for entry in catalog["programs"]:
+                assert stored[str(entry["id"])] == str(entry["attributes"]["school"]["id"])
+            assert stored["no-school"] is None
+    print("✅ ensure_program_school_ids adds, indexes and backfills the column")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 PROGRAMS BY UNIVERSITY TEST")
+    print("=" * 60)
+    test_all_programs_of_a_university()
+    test_only_the_page_is_transformed()
+    test_school_ids_backfilled_on_existing_table()
@@ -0,0 +1,91 @@
+"""
+Test the recommendation result cache (LRU + TTL + catalog-version invalidation).
+
+Run from backend directory:
+    python -m recommendation.tests.test_result_cache
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from recommendation.logic.contracts import StudentProfile
+from recommendation.logic.result_cache import ResultCache, profile_cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_profile_cache_key():
+    base = StudentProfile(
+        student_id="s-1",
+        academic_score_band="good",
+        preferred_countries=["Ireland", "Germany"],
+        preferred_program_domains=["Data Science", "Computer Science"],
+    )
+    same = StudentProfile(
+        student_id="s-2",
+        academic_score_band="good",
+        preferred_countries=["Ireland", "Germany"],
+        preferred_program_domains=["computer science ", "DATA SCIENCE"],
+    )
+    other_country_order = base.copy(update={"preferred_countries": ["Germany", "Ireland"]})
+
+    key = profile_cache_key(base, 50, "full")
+    print(f"   key={key[:16]}…")
+
+    assert profile_cache_key(same, 50, "full") == key
+    assert profile_cache_key(base, 20, "full") != key
+    assert profile_cache_key(base, 50, "simple") != key
+    assert profile_cache_key(other_country_order, 50, "full") != key
+    print("✅ Profile cache key canonicalization correct")
+
+
+def test_result_cache_lru_ttl_and_version():
+    clock = FakeClock()
+    cache = ResultCache(maxsize=2, ttl_seconds=10, clock=clock)
+
+    cache.set("a", 1, version=1)
+    cache.set("b", 2, version=1)
+    assert cache.get("a", version=1) == 1       # a becomes most recently used
+    cache.set("c", 3, version=1)                 # evicts b
+    assert cache.get("b", version=1) is None
+    assert cache.get("c", version=1) == 3
+
+    clock.now = 11
+    assert cache.get("a", version=1) is None     # expired
+
+    cache.set("d", 4, version=1)
+    assert cache.get("d", version=2) is None     # catalog bumped
+    assert cache.stats()["size"] == 0
+
+    stats = cache.stats()
+    print(f"   {stats}")
+    assert stats["hits"] == 2
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["expirations"] == 1
+    assert stats["invalidations"] == 1
+    print("✅ Result cache LRU/TTL/version invalidation correct")
+
+
+def test_disabled_cache():
+    cache = ResultCache(maxsize=0)
+    cache.set("a", 1, version=0)
+    assert cache.get("a", version=0) is None
+    assert cache.stats()["misses"] == 0
+    print("✅ Disabled cache never stores")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 RESULT CACHE TEST")
+    print("=" * 60)
+    test_profile_cache_key()
+    test_result_cache_lru_ttl_and_version()
+    test_disabled_cache()
@@ -0,0 +1,162 @@
+"""
+Test the precomputed score tables behind the band-driven scorers.
+
+Run from backend directory:
+    python -m recommendation.tests.test_score_tables
+"""
+
+import sys
+import os
+import itertools
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from recommendation.logic import constants
+from recommendation.logic.contracts import StudentProfile
+from recommendation.logic.records import CandidateRecord
+from recommendation.logic.dimension_scorers import (
+    compile_profile, score_academic_fit, score_affordability, score_career_alignment, score_eligibility,
+)
+from recommendation.logic.score_tables import (
+    COMPETITION_DEFAULT, GAP_TOLERANCE_DEFAULT, academic_cell, affordability_cell, career_cell,
+    eligibility_cell, score_tables,
+)
+
+
+def _with_unknown(band_map):
+    return list(band_map) + ["Not A Band"]
+
+
+def test_every_candidate_combination():
+    """Table lookups equal the cell functions evaluated on the band values."""
+    tables = score_tables.get()
+    weights = constants.DIMENSION_WEIGHTS
+    for profile in (
+        StudentProfile(academic_score_band="Good", language_score_band="minimum",
+                       work_experience_years=0.5, gap_years=2, tuition_preference_band="low"),
+        StudentProfile(academic_score_band="unknown", language_score_band="native",
+                       work_experience_years=6, gap_years=0),
+    ):
+        compiled = compile_profile(profile)
+        student_academic = constants.ACADEMIC_SCORE_BAND_MAP[profile.academic_score_band.lower()]
+        student_language = constants.LANGUAGE_SCORE_BAND_MAP[profile.language_score_band.lower()]
+
+        for academic, language, status in itertools.product(
+            _with_unknown(constants.ACADEMIC_SCORE_BAND_MAP), _with_unknown(constants.LANGUAGE_SCORE_BAND_MAP),
+            ("match", "unknown"),
+        ):
+            candidate = CandidateRecord(program_id=1, university_id=1, academic_score_band=academic,
+                                        language_score_band=language, degree_match_status=status)
+            record, _ = score_academic_fit(compiled, candidate)
+            expected = academic_cell(
+                student_academic, student_language,
+                constants.ACADEMIC_SCORE_BAND_MAP.get(academic, constants.DEFAULT_SCORE),
+                constants.LANGUAGE_SCORE_BAND_MAP.get(language, constants.DEFAULT_SCORE),
+                status == "unknown", weights["academic_fit"],
+            )
+            assert (record.score, record.weighted_score, record.explanation) == expected[:3]
+
+        for background, preference, tolerance, competition in itertools.product(
+            _with_unknown(constants.BACKGROUND_MATCH_LEVEL_MAP), ["Required", "preferred", "neutral"],
+            _with_unknown(constants.GAP_YEAR_TOLERANCE_MAP), _with_unknown(constants.COMPETITION_LEVEL_MAP),
+        ):
+            candidate = CandidateRecord(program_id=1, university_id=1, background_match_level=background,
+                                        work_experience_preference=preference, gap_year_tolerance_level=tolerance,
+                                        competition_level_this_intake=competition)
+            record, _ = score_eligibility(compiled, candidate)
+            expected = eligibility_cell(
+                compiled.work_experience, profile.gap_years,
+                constants.BACKGROUND_MATCH_LEVEL_MAP.get(background, constants.DEFAULT_SCORE),
+                preference.lower() if preference.lower() in ("required", "preferred") else None,
+                constants.GAP_YEAR_TOLERANCE_MAP.get(tolerance, GAP_TOLERANCE_DEFAULT),
+                constants.COMPETITION_LEVEL_MAP.get(competition, COMPETITION_DEFAULT),
+                weights["eligibility"],
+            )
+            assert (record.score, record.weighted_score, record.explanation) == expected[:3]
+
+        for tuition in _with_unknown(constants.TUITION_FEE_BAND_MAP):
+            candidate = CandidateRecord(program_id=1, university_id=1, tuition_fee_band=tuition)
+            record, _ = score_affordability(compiled, candidate)
+            expected = affordability_cell(
+                compiled.budget, constants.TUITION_FEE_BAND_MAP.get(tuition, constants.DEFAULT_SCORE),
+                weights["affordability"],
+            )
+            assert record.score == expected[0]
+            assert record.explanation == f"Program tuition: {tuition}, {expected[2]}"
+    print(f"✅ cells match the scorer formulas ({len(tables.career)} career cells, "
+          f"gap years cap {tables.gap_years_cap}, matches cap {tables.career_matches_cap})")
+
+
+def test_saturating_axes():
+    """Gap years and career matches beyond the table caps score like the uncapped formula."""
+    tables = score_tables.get()
+    candidate = CandidateRecord(program_id=1, university_id=1, gap_year_tolerance_level="very_strict",
+                                global_reputation_band="top_50",
+                                industry_alignment_tags=["software", "software engineering", "engineering", "soft"])
+    for gap_years in (-2, 0, 3, tables.gap_years_cap + 1, 50):
+        record, risks = score_eligibility(StudentProfile(gap_years=gap_years), candidate)
+        expected = eligibility_cell(0.2, gap_years, constants.DEFAULT_SCORE, None, 0.2,
+                                    constants.COMPETITION_LEVEL_MAP["moderate"],
+                                    constants.DIMENSION_WEIGHTS["eligibility"])
+        assert record.score == expected[0]
+        assert [r.description for r in risks] == (
+            [f"{gap_years} gap years with strict tolerance"] if gap_years >= 3 else []
+        )
+
+    profile = StudentProfile(career_goals=["software engineering", "software", "engineering"])
+    record, _ = score_career_alignment(profile, candidate)
+    _, matches = compile_profile(profile).tags.career_counts(candidate.industry_alignment_tags)
+    assert matches > tables.career_matches_cap
+    assert record.score == career_cell(0.85, matches, constants.DIMENSION_WEIGHTS["career_alignment"])[0]
+    print("✅ capped axes agree with the uncapped formulas")
+
+
+def test_risk_bitmasks():
+    profile = StudentProfile(academic_score_band="Poor", language_score_band="good", work_experience_years=0)
+    candidate = CandidateRecord(program_id=1, university_id=1, academic_score_band="Excellent",
+                                language_score_band="native", degree_match_status="unknown",
+                                work_experience_preference="required")
+    _, risks = score_academic_fit(profile, candidate)
+    assert [(r.factor, r.severity) for r in risks] == [
+        ("uncertain_degree_match", "low"), ("gpa_below_minimum", "high"), ("borderline_language", "moderate"),
+    ]
+    assert risks[1].description == "Academic score (Poor) below program requirement (Excellent)"
+
+    _, risks = score_eligibility(profile, candidate)
+    assert [r.factor for r in risks] == ["no_work_experience_required"]
+    _, risks = score_academic_fit(StudentProfile(academic_score_band="excellent", language_score_band="native"),
+                                  CandidateRecord(program_id=1, university_id=1, degree_match_status="match"))
+    assert risks == []
+    print("✅ risk bitmasks expand to the scorers' risk records")
+
+
+def test_tables_follow_constants():
+    profile = StudentProfile(academic_score_band="outstanding")
+    candidate = CandidateRecord(program_id=1, university_id=1, academic_score_band="good", language_score_band="good")
+    before = score_tables.get()
+    weight = constants.DIMENSION_WEIGHTS["academic_fit"]
+    try:
+        constants.DIMENSION_WEIGHTS["academic_fit"] = 0.5
+        constants.ACADEMIC_SCORE_BAND_MAP["outstanding"] = 1.2
+        assert score_tables.get() is not before
+        record, _ = score_academic_fit(profile, candidate)
+        assert record.weight == 0.5
+        assert record.explanation.startswith("Academic match: 1.00")  # 1.2 / 0.8, capped
+    finally:
+        constants.DIMENSION_WEIGHTS["academic_fit"] = weight
+        del constants.ACADEMIC_SCORE_BAND_MAP["outstanding"]
+
+    restored = score_tables.get()
+    assert restored.fingerprint == before.fingerprint and score_tables.get() is restored
+    record, _ = score_academic_fit(profile, candidate)
+    assert record.weight == weight
+    print("✅ tables are rebuilt when band maps or weights change")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 SCORE TABLES TEST")
+    print("=" * 60)
+    test_every_candidate_combination()
+    test_saturating_axes()
+    test_risk_bitmasks()
+    test_tables_follow_constants()
@@ -0,0 +1,86 @@
+"""
+Test the compact scoring records against the pydantic contracts.
+
+Run from backend directory:
+    python -m recommendation.tests.test_scoring_records
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from recommendation.logic.contracts import (
+    StudentProfile,
+    CandidateProgram,
+    DimensionScore,
+    RiskFactor,
+    ScoredCandidate,
+)
+from recommendation.logic.records import CandidateRecord, ScoredRecord
+from recommendation.logic.aggregator import aggregate_scores
+from recommendation.logic.ranker import rank_candidates, apply_diversity_penalty
+from recommendation.logic.output_assembler import assemble_output
+from recommendation.tests.test_columnar_scoring import PROFILES, _random_candidates
+
+
+def test_records_are_slotted():
+    """Records carry no per-instance __dict__."""
+    record = CandidateRecord(program_id=1, university_id=2)
+    assert not hasattr(record, "__dict__")
+    assert not hasattr(aggregate_scores(StudentProfile(), record), "__dict__")
+
+
+def test_candidate_record_round_trip():
+    """CandidateRecord mirrors every CandidateProgram field and default."""
+    assert set(CandidateRecord.__slots__) == set(CandidateProgram.model_fields)
+    assert CandidateRecord(program_id=1, university_id=2).to_contract() == CandidateProgram(program_id=1, university_id=2)
+
+    for candidate in _random_candidates(50):
+        assert CandidateRecord.from_contract(candidate).to_contract() == candidate
+
+
+def test_records_score_like_contracts():
+    """Scoring a record or a CandidateProgram gives the same ScoredCandidate."""
+    candidates = _random_candidates(300)
+
+    for profile in PROFILES:
+        for candidate in candidates:
+            from_record = aggregate_scores(profile, CandidateRecord.from_contract(candidate))
+            from_contract = aggregate_scores(profile, candidate)
+            assert isinstance(from_record, ScoredRecord)
+            assert from_record.to_contract() == from_contract.to_contract()
+
+
+def test_output_converts_top_k_to_contracts():
+    """output_assembler returns pydantic dimension scores and risks built from records."""
+    profile = PROFILES[1]
+    candidates = [CandidateRecord.from_contract(c) for c in _random_candidates(200, seed=3)]
+    eligible = [s for s in (aggregate_scores(profile, c) for c in candidates) if s.is_eligible]
+    ranked = apply_diversity_penalty(rank_candidates(eligible))
+    assert all(isinstance(s, ScoredRecord) for s in ranked)
+
+    output = assemble_output(profile, ranked[:20], len(candidates), len(eligible))
+    assert len(output.all_recommendations) == min(20, len(ranked))
+    for rec, scored in zip(output.all_recommendations, ranked):
+        assert rec.program_id == scored.candidate.program_id
+        assert rec.overall_score == round(scored.overall_score, 3)
+        assert all(isinstance(d, DimensionScore) for d in rec.dimension_scores)
+        assert all(isinstance(r, RiskFactor) for r in rec.risk_factors)
+        assert len(rec.risk_factors) == len(scored.risk_factors)
+
+    # Contracts are still accepted by the assembler
+    contract = ranked[0].to_contract()
+    assert isinstance(contract, ScoredCandidate)
+    assert assemble_output(profile, [contract], 1, 1).all_recommendations[0] == output.all_recommendations[0]
+
+
+if __name__ == "__main__":
+    test_records_are_slotted()
+    print("✅ Records are slotted")
+    test_candidate_record_round_trip()
+    print("✅ CandidateRecord round-trips through CandidateProgram")
+    test_records_score_like_contracts()
+    print("✅ Records score identically to contracts")
+    test_output_converts_top_k_to_contracts()
+    print("✅ Output assembler converts records to contracts")
+    print("SCORING RECORD TESTS PASSED ✓")
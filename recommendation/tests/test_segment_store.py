@@ -0,0 +1,161 @@
+"""
+Test materialized segment recommendations (served by POST /recommendations).
+
+Run from backend directory:
+    python -m recommendation.tests.test_segment_store
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from db import get_db
+from recommendation.benchmarks.synthetic import create_sqlite_catalog
+from recommendation.routes import router
+from recommendation.logic.contracts import StudentProfile
+from recommendation.logic.result_cache import result_cache
+from recommendation.logic.run_store import run_store
+from recommendation.logic.segment_store import (
+    LIVE_FIELDS, SEGMENT_FIELDS, SegmentStore, live_fields, segment_key, segment_store,
+)
+from recommendation.logic.what_if import FIELD_DIMENSIONS
+from recommendation.services.catalog_version import bump_catalog_version
+
+
+SEGMENT = {
+    "academic_score_band": "good",
+    "language_score_band": "adequate",
+    "preferred_countries": ["Ireland", "Canada"],
+    "tuition_preference_band": "low",
+    "work_experience_years": 1.0,
+}
+LIVE = {
+    "background_field": "Computer Science",
+    "preferred_program_domains": ["Data Science"],
+    "career_goals": ["Data Analyst"],
+}
+
+
+def _ranking(response):
+    return [(r["program_id"], r["total_score"], r["dimension_scores"], r["risk_factors"]) for r in response["recommendations"]]
+
+
+def test_segment_keys():
+    # Every scored field is either in the segment key or rescored live
+    scored = {name for name, dimensions in FIELD_DIMENSIONS.items() if dimensions}
+    assert scored | {"target_degree_level"} == set(SEGMENT_FIELDS) | set(LIVE_FIELDS)
+
+    base = StudentProfile(**SEGMENT)
+    personal = StudentProfile(**SEGMENT, **LIVE, student_id="s-1", graduation_year=2022)
+    assert segment_key(base, 20) == segment_key(personal, 20)
+    assert segment_key(base, 20) != segment_key(base, 30)
+    assert segment_key(base, 20) != segment_key(StudentProfile(**{**SEGMENT, "gap_years": 2}), 20)
+    assert live_fields(base) == [] and live_fields(personal) == list(LIVE_FIELDS)
+    print("✅ Segment keys ignore live and unscored fields")
+
+
+def test_top_segments_and_refresh_claims():
+    now = [0.0]
+    store = SegmentStore(top_n=2, min_requests=2, refresh_seconds=60, clock=lambda: now[0])
+    profiles = [StudentProfile(**{**SEGMENT, "gap_years": years}) for years in range(3)]
+    for profile, count in zip(profiles, (3, 1, 2)):
+        for _ in range(count):
+            store.record(profile, 20)
+    with store._lock:
+        assert store._top_keys() == [segment_key(profiles[0], 20), segment_key(profiles[2], 20)]
+
+    assert store.claim_refresh(1) is True
+    assert store.claim_refresh(1) is False  # already pending
+    store._pending = False
+
+    # Request log stays bounded
+    for years in range(100):
+        store.record(StudentProfile(gap_years=years), 10)
+    assert len(store._requests) <= store.top_n * 20 and set(store._profiles) == set(store._requests)
+    print("✅ Top segments need min_requests, one refresh is claimed at a time")
+
+
+def test_segment_endpoint():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 2000)
+
+        def override_get_db():
+            with factory() as db:
+                yield db
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(app)
+        result_cache.clear()
+        run_store.clear()
+        segment_store.clear()
+        before = segment_store.stats()
+        previous = segment_store.min_requests
+        segment_store.min_requests = 2
+
+        def post(profile, format="full"):
+            result_cache.clear()
+            return client.post("/recommendations", json={"student_profile": profile, "limit": 20, "format": format}).json()
+
+        try:
+            live = post(SEGMENT)
+            assert "segment" not in live["summary"]
+            # The second request makes the segment popular; the refresh runs as a background task
+            post({**SEGMENT, "student_id": "s-2"})
+            assert segment_store.stats()["materialized"] == 1
+
+            hit = post({**SEGMENT, "student_id": "s-3"})
+            assert hit["summary"]["segment"]["rescored_dimensions"] == []
+            assert hit["summary"]["cached"] is True and hit["student_id"] == "s-3"
+            assert _ranking(hit) == _ranking(live)
+            assert run_store.get(hit["request_id"]) is not None  # what-if still works on a hit
+            # Every hit gets its own request_id, so ranked lists are never shared
+            other = post({**SEGMENT, "student_id": "s-4"})
+            stored = segment_store._segments[other["summary"]["segment"]["key"]]
+            assert len({hit["request_id"], other["request_id"], stored.full["request_id"]}) == 3
+            assert client.get(f"/recommendations/{hit['request_id']}").json()["student_id"] == "s-3"
+            assert client.get(f"/recommendations/{other['request_id']}").json()["student_id"] == "s-4"
+
+            simple = post(SEGMENT, format="simple")
+            assert [r["program_id"] for r in simple["recommendations"]] == [r["program_id"] for r in live["recommendations"]]
+
+            # Live fields are rescored on the stored run and match a pipeline run
+            rescored = post({**SEGMENT, **LIVE})
+            assert rescored["summary"]["segment"]["rescored_dimensions"] == ["program_fit", "career_alignment"]
+            segment_store.top_n, top_n = 0, segment_store.top_n
+            try:
+                fresh = post({**SEGMENT, **LIVE})
+            finally:
+                segment_store.top_n = top_n
+            assert "segment" not in fresh["summary"]
+            assert _ranking(rescored) == _ranking(fresh)
+            assert rescored["summary"]["total_eligible"] == fresh["summary"]["total_eligible"]
+            print(f"   {len(rescored['recommendations'])} recommendations match a live run")
+
+            # A catalog change retires the stored segments until the refresh that request schedules
+            with factory() as db:
+                bump_catalog_version(db)
+                db.commit()
+            stale = post(SEGMENT)
+            assert "segment" not in stale["summary"]
+            assert post(SEGMENT)["summary"]["segment"]["rescored_dimensions"] == []
+            stats = segment_store.stats()
+            assert [stats[name] - before[name] for name in ("refreshes", "hits", "rescored")] == [2, 4, 1]
+        finally:
+            segment_store.min_requests = previous
+            segment_store.clear()
+    print("✅ Popular segments are served from the store and refreshed on catalog changes")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 SEGMENT STORE TEST")
+    print("=" * 60)
+    test_segment_keys()
+    test_top_segments_and_refresh_claims()
+    test_segment_endpoint()
@@ -0,0 +1,72 @@
+"""
+Test the streaming (NDJSON / SSE) formats of POST /recommendations.
+
+Run from backend directory:
+    python -m recommendation.tests.test_streaming_format
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from db import get_db
+from recommendation.benchmarks.synthetic import create_sqlite_catalog
+from recommendation.routes import router
+
+
+PROFILE = {"student_id": "stream", "academic_score_band": "good", "preferred_countries": ["Ireland", "Canada"]}
+
+
+def _parse_sse(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_streaming_formats():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 2000)
+
+        def override_get_db():
+            with factory() as db:
+                yield db
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(app)
+
+        full = client.post("/recommendations", json={"student_profile": PROFILE, "limit": 20}).json()
+
+        response = client.post("/recommendations", json={"student_profile": PROFILE, "limit": 20, "format": "ndjson"})
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        print(f"   ndjson events: {[line['type'] for line in lines[:2]]} ... {lines[-1]['type']}")
+        assert lines[0]["type"] == "summary"
+        # Served from the result cache, but under its own request_id
+        assert lines[0]["request_id"] != full["request_id"]
+        assert lines[-1] == {"type": "done", "request_id": lines[0]["request_id"]}
+        streamed = [{k: v for k, v in line.items() if k != "type"} for line in lines[1:-1]]
+        assert streamed == full["recommendations"]
+
+        response = client.post("/recommendations", json={"student_profile": PROFILE, "limit": 20, "format": "sse"})
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert events[0][0] == "summary"
+        assert [payload for event, payload in events if event == "recommendation"] == full["recommendations"]
+        assert events[-1][0] == "done"
+    print("✅ Streaming formats emit summary, recommendations and done in order")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 STREAMING FORMAT TEST")
+    print("=" * 60)
+    test_streaming_formats()
@@ -0,0 +1,105 @@
+"""
+Test the interned tag vocabulary and the per-request tag matcher.
+
+Run from backend directory:
+    python -m recommendation.tests.test_tag_index
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from recommendation.logic.dimension_scorers import compile_profile
+from recommendation.logic.contracts import StudentProfile
+from recommendation.logic.tag_index import TagMatcher, TagVocabulary
+
+TERMS = ["Data Science", "data", "Engineering", " Software Engineering ", "Business",
+         "Finance", "AI", "Machine Learning", "Health", "law", "Computer Science", ""]
+
+
+# The per-pair string matching the scorers used before TagMatcher (reference only)
+def _fuzzy_match(term1, term2):
+    t1 = term1.lower().strip()
+    t2 = term2.lower().strip()
+    return t1 in t2 or t2 in t1
+
+
+def _partial_match(term1, term2):
+    return bool(set(term1.lower().split()) & set(term2.lower().split()))
+
+
+def _matcher(domains, goals, background, vocabulary):
+    return TagMatcher(
+        tuple((d.lower(), d.lower().strip()) for d in domains),
+        tuple(g.lower().strip() for g in goals),
+        background.lower().strip() if background else None,
+        frozenset(background.lower().split()) if background else frozenset(),
+        vocabulary=vocabulary,
+    )
+
+
+def test_vocabulary_interning():
+    vocabulary = TagVocabulary()
+    assert vocabulary.tag_id("Data Science") == vocabulary.tag_id("Data Science")
+    assert vocabulary.tag_id("data science") != vocabulary.tag_id("Data Science")
+    assert vocabulary.keys[vocabulary.tag_id(" AI ")] == "ai"
+    assert vocabulary.tag_set(["AI", "Health"]) is vocabulary.tag_set(("AI", "Health"))
+    assert len(vocabulary) == 5  # " AI " and "AI" are distinct strings
+    print("✅ tags and tag lists are interned once")
+
+
+def test_matches_reference_loops():
+    rng = random.Random(7)
+    vocabulary = TagVocabulary()
+    for _ in range(2000):
+        domains = rng.sample(TERMS, rng.randint(1, 3))
+        goals = rng.sample(TERMS, rng.randint(1, 3))
+        background = rng.choice(TERMS[:-1])
+        tags = rng.sample(TERMS, rng.randint(1, 4))
+        program_domain = rng.choice(TERMS)
+        matcher = _matcher(domains, goals, background, vocabulary)
+
+        domain = 0.5
+        for d in domains:
+            if d.lower() in program_domain.lower():
+                domain = 1.0
+                break
+            elif _fuzzy_match(d, program_domain):
+                domain = 0.7
+        assert matcher.domain_match(program_domain) == domain
+
+        matched = sum(any(_fuzzy_match(g, t) for t in tags) for g in goals)
+        pairs = sum(_fuzzy_match(g, t) for g in goals for t in tags)
+        assert matcher.career_counts(tags) == (matched, pairs)
+
+        fit = 0.5
+        for t in tags:
+            if _fuzzy_match(background, t):
+                fit = 1.0
+                break
+            elif _partial_match(background, t):
+                fit = 0.7
+        assert matcher.background_fit(tags) == fit
+    print("✅ matcher agrees with the substring / word-overlap loops")
+
+
+def test_compiled_profile_has_matcher():
+    compiled = compile_profile(StudentProfile(
+        preferred_program_domains=["Computer Science"],
+        career_goals=["software engineering", "data"],
+        background_field="Computer Engineering",
+    ))
+    assert compiled.tags.domain_match("Applied Computer Science") == 1.0
+    assert compiled.tags.career_counts(["Software Engineering", "Big Data"]) == (2, 2)
+    assert compiled.tags.background_fit(["Engineering"]) == 1.0
+    print("✅ compile_profile builds the matcher from the profile terms")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 TAG INDEX TEST")
+    print("=" * 60)
+    test_vocabulary_interning()
+    test_matches_reference_loops()
+    test_compiled_profile_has_matcher()
@@ -0,0 +1,139 @@
+"""
+Test what-if re-scoring (POST /recommendations/{request_id}/what-if).
+
+Run from backend directory:
+    python -m recommendation.tests.test_what_if
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from db import get_db
+from recommendation.benchmarks.synthetic import create_sqlite_catalog
+from recommendation.routes import router
+from recommendation.logic import aggregator
+from recommendation.logic.contracts import StudentProfile
+from recommendation.logic.result_cache import result_cache
+from recommendation.logic.run_store import run_store
+from recommendation.logic.what_if import FIELD_DIMENSIONS, affected_dimensions, run_what_if
+
+
+PROFILE = {
+    "student_id": "what-if",
+    "academic_score_band": "good",
+    "language_score_band": "adequate",
+    "background_field": "Computer Science",
+    "preferred_countries": ["Ireland", "Canada"],
+    "preferred_program_domains": ["Data Science"],
+    "tuition_preference_band": "low",
+}
+
+
+def _ranking(response):
+    return [(r["program_id"], r["total_score"], r["dimension_scores"], r["risk_factors"]) for r in response["recommendations"]]
+
+
+def test_field_dimension_map():
+    assert set(FIELD_DIMENSIONS) == set(StudentProfile.model_fields)
+    assert affected_dimensions(["language_score_band"]) == ["academic_fit"]
+    assert affected_dimensions(["career_goals", "gap_years"]) == ["eligibility", "program_fit", "career_alignment"]
+    assert affected_dimensions(["graduation_year"]) == []
+    print("✅ Every profile field maps to the dimensions that read it")
+
+
+def test_what_if_endpoint():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 2000)
+
+        def override_get_db():
+            with factory() as db:
+                yield db
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(app)
+        result_cache.clear()
+        run_store.clear()
+
+        base = client.post("/recommendations", json={"student_profile": PROFILE, "limit": 30}).json()
+
+        # Language change: only academic_fit is recomputed, result equals a fresh run
+        delta = {"language_score_band": "good"}
+        changed = client.post(f"/recommendations/{base['request_id']}/what-if", json={"profile_delta": delta}).json()
+        fresh = client.post("/recommendations", json={"student_profile": {**PROFILE, **delta}, "limit": 30}).json()
+        assert changed["what_if"] == {
+            "base_request_id": base["request_id"],
+            "changed_fields": ["language_score_band"],
+            "full_rerun": False,
+            "rescored_dimensions": ["academic_fit"],
+        }
+        assert changed["request_id"] != base["request_id"]
+        assert _ranking(changed) == _ranking(fresh)
+        assert changed["summary"]["total_eligible"] == fresh["summary"]["total_eligible"]
+        print(f"   {len(changed['recommendations'])} recommendations match a full run")
+
+        # Chained what-if on the new run
+        delta2 = {"tuition_preference_band": "high", "gap_years": 3}
+        chained = client.post(f"/recommendations/{changed['request_id']}/what-if", json={"profile_delta": delta2}).json()
+        fresh2 = client.post("/recommendations", json={"student_profile": {**PROFILE, **delta, **delta2}, "limit": 30}).json()
+        assert chained["what_if"]["rescored_dimensions"] == ["eligibility", "affordability"]
+        assert _ranking(chained) == _ranking(fresh2)
+
+        # Hard filter change: full rerun over the new pool
+        delta3 = {"preferred_countries": ["Germany"]}
+        rerun = client.post(f"/recommendations/{base['request_id']}/what-if", json={"profile_delta": delta3}).json()
+        fresh3 = client.post("/recommendations", json={"student_profile": {**PROFILE, **delta3}, "limit": 30}).json()
+        assert rerun["what_if"]["full_rerun"] is True
+        assert _ranking(rerun) == _ranking(fresh3)
+
+        assert client.post("/recommendations/missing/what-if", json={"profile_delta": delta}).status_code == 404
+        assert client.post(f"/recommendations/{base['request_id']}/what-if", json={"profile_delta": {"ielts": 7}}).status_code == 400
+        assert client.post(f"/recommendations/{base['request_id']}/what-if", json={"profile_delta": {"gap_years": "many"}}).status_code == 400
+    print("✅ What-if re-scores incrementally, chains, and falls back to a full run for hard filters")
+
+
+def test_only_affected_scorers_run():
+    with tempfile.TemporaryDirectory() as workdir:
+        factory = create_sqlite_catalog(os.path.join(workdir, "catalog.db"), 1000)
+        run_store.clear()
+
+        from recommendation.logic.runner import run_recommendations
+        with factory() as db:
+            output = run_recommendations(db, StudentProfile(**PROFILE), 30)
+            run = run_store.get(output.request_id)
+            assert run.dimension_results is not None  # kept from the base run's scoring
+
+            calls = {name: 0 for name in aggregator.SCORERS}
+            originals = dict(aggregator.SCORERS)
+
+            def spy(name):
+                def wrapped(profile, candidate):
+                    calls[name] += 1
+                    return originals[name](profile, candidate)
+                return wrapped
+
+            try:
+                for name in originals:
+                    aggregator.SCORERS[name] = spy(name)
+                run_what_if(db, run, {"language_score_band": "good"})
+            finally:
+                aggregator.SCORERS.update(originals)
+
+        assert calls["academic_fit"] == len(run.candidates)
+        assert all(count == 0 for name, count in calls.items() if name != "academic_fit")
+    print(f"✅ Only academic_fit re-ran on the first what-if ({calls['academic_fit']} candidates)")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🧪 WHAT-IF RE-SCORING TEST")
+    print("=" * 60)
+    test_field_dimension_map()
+    test_what_if_endpoint()
+    test_only_affected_scorers_run()